@@ -0,0 +1,103 @@
+"""
+Throughput of ``iter_filing_text`` on a synthetic EDGAR HTML filing.
+
+The filing mimics generated EDGAR HTML: styled ``<div>``/``<span>``
+paragraphs, numeric financial tables, numeric entities and an inline XBRL
+header.  Reports input MB/s for extraction alone and with the streaming
+``f_text`` scan, and checks that chunked output matches a one-shot pass.
+
+Usage::
+
+    python benchmarks/bench_edgar.py [--mb 50] [--chunk-kb 1024]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ipo_risk_score.domain.risk.features.edgar import (  # noqa: E402
+    filing_text_features,
+    iter_filing_text,
+)
+
+_WORDS = (
+    "the company may our growth risk decline shares market strong loss revenue we could "
+    "result in significant operations customers competition increase products future"
+).split()
+_SPAN = (
+    "<span style=\"color:#000000;font-family:'Times New Roman',serif;font-size:10pt;"
+    'font-weight:400;line-height:120%">'
+)
+
+
+def _paragraph(rng: random.Random) -> str:
+    words = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(40, 120)))
+    return f'<div style="margin-top:6pt;text-align:justify">{_SPAN}{words}&#160;</span></div>\n'
+
+
+def _table(rng: random.Random) -> str:
+    cell = '<td style="padding:0 1pt;vertical-align:bottom">'
+    rows = "".join(
+        f"<tr>{cell}{_SPAN}Line item {i}</span></td>"
+        f"{cell}{_SPAN}{rng.randint(1, 99999):,}</span></td>"
+        f"{cell}{_SPAN}({rng.randint(1, 999)})</span></td></tr>\n"
+        for i in range(rng.randint(5, 30))
+    )
+    return f'<table style="border-collapse:collapse;width:100%">{rows}</table>\n'
+
+
+def _write_filing(path: str, megabytes: float, seed: int = 0) -> int:
+    rng = random.Random(seed)
+    size = 0
+    with open(path, "w", encoding="utf-8") as fh:
+        head = (
+            '<?xml version="1.0"?><html><head><title>S-1</title></head><body>'
+            '<div style="display:none"><ix:header><ix:hidden>loss growth</ix:hidden>'
+            "</ix:header></div>\n"
+        )
+        fh.write(head)
+        while size < megabytes * 1e6:
+            part = _table(rng) if rng.random() < 0.15 else _paragraph(rng)
+            fh.write(part)
+            size += len(part)
+        fh.write("</body></html>\n")
+    return os.path.getsize(path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mb", type=float, default=50.0)
+    parser.add_argument("--chunk-kb", type=int, default=1024)
+    args = parser.parse_args()
+    chunk_size = args.chunk_kb * 1024
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "filing.htm")
+        n_bytes = _write_filing(path, args.mb)
+
+        start = time.perf_counter()
+        n_chars = sum(len(text) for text in iter_filing_text(path, chunk_size=chunk_size))
+        extract = time.perf_counter() - start
+        start = time.perf_counter()
+        features = filing_text_features(path, chunk_size=chunk_size)
+        scored = time.perf_counter() - start
+        small = "".join(iter_filing_text(path, chunk_size=4096))
+        assert small == "".join(iter_filing_text(path, chunk_size=chunk_size))
+
+    print(f"{n_bytes / 1e6:.1f} MB filing -> {n_chars / 1e6:.1f} M chars of text")
+    print(f"  extract:          {n_bytes / extract / 1e6:8.1f} MB/s")
+    print(f"  extract + f_text: {n_bytes / scored / 1e6:8.1f} MB/s")
+    print(f"  f_text:           {features['f_text']:8.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Per-call latency: ``compute_ipo_risk`` vs the fused kernel.
+
+Both paths score the same deals (with and without prospectus text) and are
+checked to agree bit for bit before timing.
+
+Usage::
+
+    python benchmarks/bench_fused.py [--deals 2000] [--repeat 5] [--min-speedup 3]
+
+Exits with status 1 if the fused ``score`` speed-up on numeric-only deals is
+below ``--min-speedup``.  With prospectus text the shared text scan
+dominates both paths, so that row is reported but not gated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ipo_risk_score.domain.risk import (  # noqa: E402
+    DealTermsDomain,
+    FinancialSnapshotDomain,
+    IpoInput,
+    compute_ipo_risk,
+)
+from ipo_risk_score.domain.risk.fused import compile_fused_scorer  # noqa: E402
+
+
+def _make_ipos(n: int, with_text: bool) -> list:
+    rng = random.Random(42)
+    text = "Strong growth, but competition and regulatory risk may cause a decline. " * 5
+    return [
+        IpoInput(
+            ticker="BENCH",
+            company_name="Bench Corp",
+            country="US",
+            sector="Tech",
+            deal_terms=DealTermsDomain(
+                10.0, 10.0 + rng.random() * 4, rng.randint(10**5, 10**8), rng.uniform(5, 95), 180
+            ),
+            financials=FinancialSnapshotDomain(
+                rng.uniform(1e6, 1e9), 40.0, rng.uniform(-30, 30), rng.uniform(-10, 90)
+            ),
+            underwriter_tier=rng.randint(1, 5),
+            auditor_is_big4=rng.random() < 0.5,
+            sector_cyclicality=rng.randint(0, 2),
+            region_risk_tier=rng.randint(0, 2),
+            prospectus_text=text if with_text else None,
+        )
+        for _ in range(n)
+    ]
+
+
+def _best_us_per_call(fn, ipos: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for ipo in ipos:
+            fn(ipo)
+        best = min(best, time.perf_counter() - start)
+    return best / len(ipos) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deals", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-speedup", type=float, default=3.0)
+    args = parser.parse_args()
+
+    scorer = compile_fused_scorer()
+    gated = 0.0
+    for label, with_text in (("numeric only", False), ("with text", True)):
+        ipos = _make_ipos(args.deals, with_text)
+        assert all(scorer.score(i) == compute_ipo_risk(i).risk_score for i in ipos)
+        modular = _best_us_per_call(compute_ipo_risk, ipos, args.repeat)
+        fused = _best_us_per_call(scorer.score, ipos, args.repeat)
+        result = _best_us_per_call(scorer.result, ipos, args.repeat)
+        speedup = modular / fused
+        if not with_text:
+            gated = speedup
+        print(f"{label}:")
+        print(f"  compute_ipo_risk:     {modular:8.2f} us/call")
+        print(f"  fused score:          {fused:8.2f} us/call ({speedup:.1f}x)")
+        print(f"  fused result:         {result:8.2f} us/call ({modular / result:.1f}x)")
+    return 0 if gated >= args.min_speedup else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Cold-start benchmark: ``import ipo_risk_score`` plus the first score.
+
+Each sample runs in a fresh interpreter so that module caches do not hide
+import cost.  Two numbers are reported:
+
+* the end-to-end wall time minus a bare ``python -c pass`` start-up, and
+* the cost the package itself controls: the self time of every
+  ``ipo_risk_score.*`` module (from ``-X importtime``) plus the first
+  ``compute_ipo_risk`` call.
+
+Standard-library modules pulled in along the way (``typing``,
+``dataclasses``) show up only in the first figure.
+
+Usage::
+
+    python benchmarks/bench_import.py [--runs 20] [--budget-ms 10]
+
+Exits with status 1 if the median package cost exceeds ``--budget-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+FIRST_SCORE_SNIPPET = """
+import time
+
+import ipo_risk_score
+from ipo_risk_score.domain.risk import (
+    DealTermsDomain,
+    FinancialSnapshotDomain,
+    IpoInput,
+    compute_ipo_risk,
+)
+
+ipo = IpoInput(
+    ticker="BENCH",
+    company_name=None,
+    country="US",
+    sector="Tech",
+    deal_terms=DealTermsDomain(10.0, 12.0, 5_000_000, 25.0, 180),
+    financials=FinancialSnapshotDomain(50_000_000.0, 45.0, 12.0, 30.0),
+    underwriter_tier=2,
+    auditor_is_big4=True,
+    sector_cyclicality=1,
+    region_risk_tier=1,
+)
+t0 = time.perf_counter()
+compute_ipo_risk(ipo)
+print(f"first-score-us={(time.perf_counter() - t0) * 1e6:.0f}")
+"""
+FIRST_SCORE_MARKER = "first-score-us="
+
+
+def _time_interpreter(code: str, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True, capture_output=True)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def _time_package(runs: int) -> list:
+    """Package-owned cost per run: own module self times plus the first score."""
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", FIRST_SCORE_SNIPPET],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        own_us = 0
+        for line in proc.stderr.splitlines():
+            # Format: "import time: <self us> | <cumulative us> | <module>"
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip().startswith("ipo_risk_score"):
+                own_us += int(parts[0].split(":")[1])
+        for line in proc.stdout.splitlines():
+            if line.startswith(FIRST_SCORE_MARKER):
+                own_us += int(line[len(FIRST_SCORE_MARKER) :])
+        samples.append(own_us / 1000.0)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    baseline = statistics.median(_time_interpreter("pass", args.runs))
+    package = statistics.median(_time_interpreter(FIRST_SCORE_SNIPPET, args.runs))
+    own = statistics.median(_time_package(args.runs))
+
+    print(f"interpreter start-up:       {baseline:8.2f} ms")
+    print(f"import + first score:       {package:8.2f} ms (wall, fresh interpreter)")
+    print(f"  over bare start-up:       {package - baseline:8.2f} ms")
+    print(f"  package-owned cost:       {own:8.2f} ms (budget {args.budget_ms:.1f} ms)")
+    return 0 if own <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
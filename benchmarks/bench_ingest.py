@@ -0,0 +1,89 @@
+"""
+Sequential vs pipelined scoring of a directory of filings.
+
+Writes ``--files`` synthetic EDGAR HTML filings, then scores them with a
+read -> extract -> score loop and with ``score_filings`` (reader threads
+plus ``--workers`` scanner processes), checking that both agree.
+
+Usage::
+
+    python benchmarks/bench_ingest.py [--files 200] [--kb 500] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_edgar import _write_filing  # noqa: E402
+
+from ipo_risk_score.domain.risk import (  # noqa: E402
+    DealTermsDomain,
+    FinancialSnapshotDomain,
+    IpoInput,
+    compute_ipo_risk,
+)
+from ipo_risk_score.domain.risk.features.edgar import extract_filing_text  # noqa: E402
+from ipo_risk_score.domain.risk.ingest import score_filings  # noqa: E402
+
+
+def _make_ipo(ticker: str) -> IpoInput:
+    return IpoInput(
+        ticker=ticker,
+        company_name="Bench Corp",
+        country="US",
+        sector="Tech",
+        deal_terms=DealTermsDomain(10.0, 12.0, 5_000_000, 30.0, 180),
+        financials=FinancialSnapshotDomain(5e7, 40.0, 5.0, 25.0),
+        underwriter_tier=2,
+        auditor_is_big4=True,
+        sector_cyclicality=1,
+        region_risk_tier=0,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--kb", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        n_bytes = 0
+        ipos = []
+        for i in range(args.files):
+            ticker = f"T{i:05d}"
+            n_bytes += _write_filing(os.path.join(tmp, f"{ticker}.htm"), args.kb / 1000, seed=i)
+            ipos.append(_make_ipo(ticker))
+        by_ticker = {ipo.ticker: ipo for ipo in ipos}
+
+        start = time.perf_counter()
+        sequential = {}
+        for name in sorted(os.listdir(tmp)):
+            ticker = Path(name).stem
+            text = extract_filing_text(os.path.join(tmp, name))
+            sequential[ticker] = compute_ipo_risk(by_ticker[ticker], prospectus_text=text)
+        seq = time.perf_counter() - start
+
+        start = time.perf_counter()
+        items = score_filings(ipos, tmp, workers=args.workers)
+        pipelined = {item.key: item.result for item in items}
+        pipe = time.perf_counter() - start
+        assert pipelined == sequential
+
+    mb = n_bytes / 1e6
+    print(f"{args.files} filings, {mb:.0f} MB, {args.workers} worker(s)")
+    print(f"  sequential:  {seq:7.2f} s  {mb / seq:7.1f} MB/s")
+    print(f"  pipelined:   {pipe:7.2f} s  {mb / pipe:7.1f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
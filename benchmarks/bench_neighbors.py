@@ -0,0 +1,99 @@
+"""
+k-NN query latency of ``ComparableIndex`` over a large deal history.
+
+Builds an index over synthetic past deals, checks a sample of queries
+against brute force, then times single-deal queries (features included).
+
+Usage::
+
+    python benchmarks/bench_neighbors.py [--deals 100000] [--queries 500] [--k 10] [--max-ms 1]
+
+Exits with status 1 if the mean query time exceeds ``--max-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ipo_risk_score.domain.risk import (  # noqa: E402
+    DealTermsDomain,
+    FinancialSnapshotDomain,
+    IpoInput,
+)
+from ipo_risk_score.domain.risk.features.config import DEFAULT_FEATURE_CONFIG  # noqa: E402
+from ipo_risk_score.domain.risk.fused import compile_feature_extractor  # noqa: E402
+from ipo_risk_score.domain.risk.neighbors import ComparableIndex  # noqa: E402
+
+
+def _make_ipos(n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [
+        IpoInput(
+            ticker="BENCH",
+            company_name="Bench Corp",
+            country="US",
+            sector="Tech",
+            deal_terms=DealTermsDomain(
+                10.0,
+                10.0 + rng.random() * 4,
+                rng.randint(10**5, 10**8),
+                rng.uniform(5, 95),
+                rng.choice([0, 90, 180, 365]),
+            ),
+            financials=FinancialSnapshotDomain(
+                rng.uniform(1e6, 1e9), 40.0, rng.uniform(-30, 30), rng.uniform(-10, 90)
+            ),
+            underwriter_tier=rng.randint(1, 5),
+            auditor_is_big4=rng.random() < 0.5,
+            sector_cyclicality=rng.randint(0, 2),
+            region_risk_tier=rng.randint(0, 2),
+            sector_ps_multiple=rng.choice([None, 3.0]),
+        )
+        for _ in range(n)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deals", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    extract = compile_feature_extractor(DEFAULT_FEATURE_CONFIG)
+    matrix = [extract(ipo, None, True) for ipo in _make_ipos(args.deals, 1)]
+    start = time.perf_counter()
+    index = ComparableIndex.build(matrix)
+    build = time.perf_counter() - start
+
+    queries = _make_ipos(args.queries, 2)
+    for ipo in queries[:10]:
+        x = extract(ipo, None, True)
+        expected = sorted((math.dist(x, row), i) for i, row in enumerate(matrix))[: args.k]
+        assert [c.row for c in index.query(ipo, args.k)] == [i for _, i in expected]
+
+    start = time.perf_counter()
+    for ipo in queries:
+        index.query(ipo, args.k)
+    per_query = (time.perf_counter() - start) / len(queries) * 1e3
+    start = time.perf_counter()
+    index.query_batch(queries, args.k)
+    per_batch_query = (time.perf_counter() - start) / len(queries) * 1e3
+
+    print(f"{args.deals} deals, k={args.k}")
+    print(f"  build:        {build:8.2f} s")
+    print(f"  query:        {per_query:8.3f} ms/deal")
+    print(f"  query_batch:  {per_batch_query:8.3f} ms/deal")
+    return 0 if per_query <= args.max_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Pickled vs shared-memory transport for multi-process scoring.
+
+Scores ``--deals`` synthetic deals on ``--workers`` processes twice:
+sending ``IpoInput`` chunks and receiving ``RiskResult`` lists through the
+pool (pickling both ways), and through a ``SharedBatch`` where workers
+score slices in place.  Also times the serial fused scorer as a baseline.
+
+Usage::
+
+    python benchmarks/bench_shared.py [--deals 200000] [--workers N] [--chunk 16384]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pickle
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ipo_risk_score.domain.risk import (  # noqa: E402
+    DealTermsDomain,
+    FinancialSnapshotDomain,
+    IpoInput,
+    compile_fused_scorer,
+)
+from ipo_risk_score.domain.risk.shared import SharedBatch, score_shared  # noqa: E402
+
+
+def _make_ipos(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        IpoInput(
+            ticker=f"T{i}",
+            company_name="Bench Corp",
+            country="US",
+            sector="Tech",
+            deal_terms=DealTermsDomain(
+                10.0, 10.0 + rng.random() * 4, rng.randint(10**5, 10**8), rng.uniform(5, 95), 180
+            ),
+            financials=FinancialSnapshotDomain(rng.uniform(1e6, 1e9), 40.0, 5.0, 25.0),
+            underwriter_tier=rng.randint(1, 5),
+            auditor_is_big4=rng.random() < 0.5,
+            sector_cyclicality=rng.randint(0, 2),
+            region_risk_tier=rng.randint(0, 2),
+            sector_ps_multiple=3.0,
+        )
+        for i in range(n)
+    ]
+
+
+def _score_chunk(ipos: list) -> list:
+    scorer = compile_fused_scorer()
+    return [scorer.result(ipo) for ipo in ipos]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deals", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=16384)
+    args = parser.parse_args()
+
+    ipos = _make_ipos(args.deals)
+    chunks = [ipos[i : i + args.chunk] for i in range(0, len(ipos), args.chunk)]
+
+    scorer = compile_fused_scorer()
+    start = time.perf_counter()
+    serial = [scorer.score(ipo) for ipo in ipos]
+    t_serial = time.perf_counter() - start
+    start = time.perf_counter()
+    for ipo in ipos:
+        scorer.result(ipo)
+    t_serial_results = time.perf_counter() - start
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        pool.submit(int).result()
+        start = time.perf_counter()
+        pickled = [r.risk_score for chunk in pool.map(_score_chunk, chunks) for r in chunk]
+        t_pickled = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with SharedBatch.from_ipos(ipos) as batch:
+            t_layout = time.perf_counter() - start
+            score_shared(batch, executor=pool, chunk_rows=args.chunk)
+            shared = list(batch.column("risk_score"))
+        t_shared = time.perf_counter() - start
+
+    assert pickled == serial == shared
+    payload = sum(len(pickle.dumps(c)) for c in chunks[:4]) / min(4, len(chunks)) / args.chunk
+    print(f"{args.deals} deals, {args.workers} worker(s), {args.chunk} rows per task")
+    print(f"  serial score():    {t_serial:7.2f} s")
+    print(f"  serial result():   {t_serial_results:7.2f} s")
+    print(f"  pickled pool:      {t_pickled:7.2f} s  (~{payload:.0f} B/deal in, RiskResults out)")
+    print(f"  shared memory:     {t_shared:7.2f} s  (layout {t_layout:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
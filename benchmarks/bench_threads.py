@@ -0,0 +1,106 @@
+"""
+Thread scaling of ``score_threaded``.
+
+Scores the same batch with 1, 2, 4, ... threads sharing one compiled
+scorer.  Every run is checked against serial scoring first.  Run it on both
+a regular build and a free-threaded one to compare::
+
+    python benchmarks/bench_threads.py [--deals 50000] [--max-threads 8] [--text]
+    python3.13t benchmarks/bench_threads.py
+
+On a regular build the GIL keeps the speed-up near 1x.  Without the GIL it
+is bounded by the number of cores.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ipo_risk_score.domain.risk import (  # noqa: E402
+    DealTermsDomain,
+    FinancialSnapshotDomain,
+    IpoInput,
+    compile_fused_scorer,
+)
+from ipo_risk_score.domain.risk.threaded import gil_enabled, score_threaded  # noqa: E402
+
+
+def _make_ipos(n: int, with_text: bool) -> list:
+    rng = random.Random(42)
+    text = "Strong growth, but competition and regulatory risk may cause a decline. " * 5
+    return [
+        IpoInput(
+            ticker="BENCH",
+            company_name="Bench Corp",
+            country="US",
+            sector="Tech",
+            deal_terms=DealTermsDomain(
+                10.0, 10.0 + rng.random() * 4, rng.randint(10**5, 10**8), rng.uniform(5, 95), 180
+            ),
+            financials=FinancialSnapshotDomain(
+                rng.uniform(1e6, 1e9), 40.0, rng.uniform(-30, 30), rng.uniform(-10, 90)
+            ),
+            underwriter_tier=rng.randint(1, 5),
+            auditor_is_big4=rng.random() < 0.5,
+            sector_cyclicality=rng.randint(0, 2),
+            region_risk_tier=rng.randint(0, 2),
+            prospectus_text=text if with_text else None,
+        )
+        for _ in range(n)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deals", type=int, default=50_000)
+    parser.add_argument("--max-threads", type=int, default=8)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--text", action="store_true", help="give every deal prospectus text")
+    args = parser.parse_args()
+
+    ipos = _make_ipos(args.deals, args.text)
+    scorer = compile_fused_scorer()
+    expected = [scorer.score(ipo) for ipo in ipos]
+
+    build = "free-threaded" if not gil_enabled() else "GIL"
+    print(
+        f"{platform.python_implementation()} {platform.python_version()} ({build}), "
+        f"{os.cpu_count()} CPU(s), {args.deals} deals{' with text' if args.text else ''}"
+    )
+    counts = [1]
+    while counts[-1] * 2 <= args.max_threads:
+        counts.append(counts[-1] * 2)
+
+    base = 0.0
+    for threads in counts:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                scores = score_threaded(
+                    ipos, scorer=scorer, executor=pool, chunk_size=args.chunk_size
+                )
+                best = min(best, time.perf_counter() - start)
+                if list(scores) != expected:
+                    print(f"  {threads} thread(s): scores differ from serial scoring")
+                    return 1
+        base = base or best
+        print(
+            f"  {threads:2d} thread(s): {best:7.3f} s  "
+            f"{args.deals / best:10,.0f} deals/s  {base / best:5.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,13 +3,25 @@ IPO Risk Score package.
 
 This package exposes the domain models and scoring engine under
 `ipo_risk_score.domain`.
+
+Importing the package is deliberately cheap: ``__version__`` is resolved
+through ``importlib.metadata`` only on first access, since scanning the
+installed distributions dominates cold-start time in short-lived processes.
 """
 
-from importlib import metadata
+__all__ = ["__version__"]
 
-try:  # pragma: no cover - fallback for editable installs
-    __version__ = metadata.version("ipo-risk-score")
-except metadata.PackageNotFoundError:  # pragma: no cover
-    __version__ = "0.1.0"
+_FALLBACK_VERSION = "0.1.0"
 
-__all__ = ["__version__"]
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib import metadata
+
+        try:  # pragma: no cover - fallback for editable installs
+            version = metadata.version("ipo-risk-score")
+        except metadata.PackageNotFoundError:  # pragma: no cover
+            version = _FALLBACK_VERSION
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
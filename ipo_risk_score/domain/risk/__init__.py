@@ -3,21 +3,98 @@ Risk scoring subpackage for the IPO Risk Score model.
 
 This package exposes the high-level API (`compute_ipo_risk`) and domain types
 used by the model.
+
+Public names are resolved lazily on first attribute access (PEP 562), so
+``import ipo_risk_score.domain.risk`` does not pull in the engine, the
+calibration helpers or any feature module until they are actually used.
 """
 
-from .calibration import fit_coefficients
-from .engine import compute_ipo_risk
-from .entities import (
-    DealTermsDomain,
-    FinancialSnapshotDomain,
-    IpoInput,
-    RiskDriverDomain,
-    RiskResult,
-)
-from .features.textual import compute_textual_features
-from .logistic import COEFFS_TEX_EXAMPLE, COEFFS_V1, risk_score_from_features
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:  # pragma: no cover - static analysers only
+    from .aggregation import RiskAggregator
+    from .batch import EncodedBatch
+    from .bayesian import fit_posterior
+    from .calibration import fit_coefficients
+    from .columnar import score_columns
+    from .comparison import score_models
+    from .engine import compute_ipo_risk
+    from .entities import (
+        DealTermsDomain,
+        FinancialSnapshotDomain,
+        IpoInput,
+        RiskDriverDomain,
+        RiskResult,
+    )
+    from .features.amendments import FilingHistory
+    from .features.config import FeatureConfig
+    from .features.edgar import iter_filing_text
+    from .features.tables import TableScorer
+    from .features.text_engine import TextFeatureEngine
+    from .features.textual import compute_textual_features
+    from .fused import compile_feature_extractor, compile_fused_scorer
+    from .ingest import score_filings
+    from .logistic import COEFFS_TEX_EXAMPLE, COEFFS_V1, risk_score_from_features
+    from .model import CompiledModel, compile_model
+    from .monitoring import DriftMonitor
+    from .neighbors import ComparableIndex
+    from .online import OnlineCalibrator
+    from .peers import PeerMultipleIndex
+    from .profiling import ScoringProfiler
+    from .registry import ModelRegistry
+    from .screening import screen_threshold, top_k
+    from .serialization import RiskResultReader, RiskResultWriter
+    from .shapley import ShapleyExplainer
+    from .shared import SharedBatch, score_shared
+    from .threaded import score_threaded
 
-__all__ = [
+# Public name -> submodule (relative to this package) that defines it.
+_LAZY_ATTRS: Dict[str, str] = {
+    "DealTermsDomain": ".entities",
+    "FinancialSnapshotDomain": ".entities",
+    "IpoInput": ".entities",
+    "RiskDriverDomain": ".entities",
+    "RiskResult": ".entities",
+    "compute_ipo_risk": ".engine",
+    "COEFFS_V1": ".logistic",
+    "COEFFS_TEX_EXAMPLE": ".logistic",
+    "risk_score_from_features": ".logistic",
+    "fit_coefficients": ".calibration",
+    "compute_textual_features": ".features.textual",
+    "RiskAggregator": ".aggregation",
+    "score_columns": ".columnar",
+    "RiskResultWriter": ".serialization",
+    "RiskResultReader": ".serialization",
+    "CompiledModel": ".model",
+    "compile_model": ".model",
+    "ModelRegistry": ".registry",
+    "FeatureConfig": ".features.config",
+    "DriftMonitor": ".monitoring",
+    "ScoringProfiler": ".profiling",
+    "ShapleyExplainer": ".shapley",
+    "EncodedBatch": ".batch",
+    "TableScorer": ".features.tables",
+    "compile_fused_scorer": ".fused",
+    "compile_feature_extractor": ".fused",
+    "score_models": ".comparison",
+    "TextFeatureEngine": ".features.text_engine",
+    "fit_posterior": ".bayesian",
+    "top_k": ".screening",
+    "screen_threshold": ".screening",
+    "PeerMultipleIndex": ".peers",
+    "ComparableIndex": ".neighbors",
+    "FilingHistory": ".features.amendments",
+    "iter_filing_text": ".features.edgar",
+    "score_filings": ".ingest",
+    "SharedBatch": ".shared",
+    "score_shared": ".shared",
+    "score_threaded": ".threaded",
+    "OnlineCalibrator": ".online",
+}
+
+# Literal so linters and IDEs can read it; must list the keys of _LAZY_ATTRS.
+__all__ = (
     "DealTermsDomain",
     "FinancialSnapshotDomain",
     "IpoInput",
@@ -29,4 +106,47 @@ __all__ = [
     "risk_score_from_features",
     "fit_coefficients",
     "compute_textual_features",
-]
+    "RiskAggregator",
+    "score_columns",
+    "RiskResultWriter",
+    "RiskResultReader",
+    "CompiledModel",
+    "compile_model",
+    "ModelRegistry",
+    "FeatureConfig",
+    "DriftMonitor",
+    "ScoringProfiler",
+    "ShapleyExplainer",
+    "EncodedBatch",
+    "TableScorer",
+    "compile_fused_scorer",
+    "compile_feature_extractor",
+    "score_models",
+    "TextFeatureEngine",
+    "fit_posterior",
+    "top_k",
+    "screen_threshold",
+    "PeerMultipleIndex",
+    "ComparableIndex",
+    "FilingHistory",
+    "iter_filing_text",
+    "score_filings",
+    "SharedBatch",
+    "score_shared",
+    "score_threaded",
+    "OnlineCalibrator",
+)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,272 @@
+"""
+Portfolio-level aggregation of scored IPOs.
+
+``RiskAggregator`` keeps running statistics over a pipeline of scored deals,
+grouped by ``sector``, ``country``, ``region_risk_tier`` and
+``underwriter_tier``.  Each group tracks its count, mean risk score, a
+quantile sketch of the score distribution and the total contribution of
+every driver.  Adding, rescoring or removing a single deal touches only the
+groups that deal belongs to, so dashboards never need a full regroup.
+
+Because ``risk_score`` is bounded in [0, 100], the quantile sketch is a
+fixed-resolution histogram backed by a Fenwick tree: updates and quantile
+queries both cost O(log bins), independent of the number of deals.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .entities import IpoInput, RiskResult
+
+DIMENSIONS: Tuple[str, ...] = ("sector", "country", "region_risk_tier", "underwriter_tier")
+
+# Resolution of the score histogram: 1000 bins over [0, 100] => 0.1 points.
+DEFAULT_SKETCH_BINS = 1000
+SCORE_MIN = 0.0
+SCORE_MAX = 100.0
+
+
+class ScoreHistogram:
+    """
+    Quantile sketch over the bounded score range [0, 100].
+
+    Scores are bucketed into ``bins`` equal-width cells and the cell counts
+    are stored in a Fenwick (binary indexed) tree.  Quantiles are exact up to
+    the cell width and insertions and deletions are both supported.
+    """
+
+    def __init__(self, bins: int = DEFAULT_SKETCH_BINS) -> None:
+        if bins <= 0:
+            raise ValueError("bins must be > 0")
+        self.bins = bins
+        self.count = 0
+        self._tree: List[int] = [0] * (bins + 1)
+        self._top_bit = 1 << (bins.bit_length() - 1)
+
+    def _bin(self, score: float) -> int:
+        width = (SCORE_MAX - SCORE_MIN) / self.bins
+        idx = int((score - SCORE_MIN) / width)
+        return max(0, min(idx, self.bins - 1))
+
+    def _update(self, idx: int, delta: int) -> None:
+        i = idx + 1
+        tree = self._tree
+        while i <= self.bins:
+            tree[i] += delta
+            i += i & -i
+
+    def add(self, score: float) -> None:
+        self._update(self._bin(score), 1)
+        self.count += 1
+
+    def remove(self, score: float) -> None:
+        if self.count <= 0:
+            raise ValueError("Cannot remove from an empty histogram")
+        self._update(self._bin(score), -1)
+        self.count -= 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Return the approximate ``q``-quantile (``q`` in [0, 1]) as the
+        midpoint of the cell holding that rank, or ``None`` when empty.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+        if self.count == 0:
+            return None
+        # 1-based rank of the requested order statistic.
+        rank = max(1, min(self.count, math.ceil(q * self.count)))
+        # Fenwick descent: find the smallest cell whose prefix count >= rank.
+        pos = 0
+        remaining = rank
+        step = self._top_bit
+        tree = self._tree
+        while step:
+            nxt = pos + step
+            if nxt <= self.bins and tree[nxt] < remaining:
+                pos = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        width = (SCORE_MAX - SCORE_MIN) / self.bins
+        return SCORE_MIN + (pos + 0.5) * width
+
+
+class _GroupStats:
+    """Mutable running statistics for one aggregation group."""
+
+    __slots__ = ("count", "score_sum", "driver_totals", "sketch")
+
+    def __init__(self, bins: int) -> None:
+        self.count = 0
+        self.score_sum = 0.0
+        self.driver_totals: Dict[str, float] = {}
+        self.sketch = ScoreHistogram(bins)
+
+    def add(self, score: float, drivers: Dict[str, float]) -> None:
+        self.count += 1
+        self.score_sum += score
+        self.sketch.add(score)
+        totals = self.driver_totals
+        for name, points in drivers.items():
+            totals[name] = totals.get(name, 0.0) + points
+
+    def remove(self, score: float, drivers: Dict[str, float]) -> None:
+        self.count -= 1
+        self.score_sum -= score
+        self.sketch.remove(score)
+        totals = self.driver_totals
+        for name, points in drivers.items():
+            totals[name] = totals.get(name, 0.0) - points
+        if self.count == 0:
+            # Reset accumulated floating-point residue once the group empties.
+            self.score_sum = 0.0
+            totals.clear()
+
+
+@dataclass
+class GroupSummary:
+    """Point-in-time snapshot of an aggregation group."""
+
+    dimension: str
+    value: Any
+    count: int
+    mean_score: Optional[float]
+    quantiles: Dict[float, Optional[float]]
+    driver_totals: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class _DealEntry:
+    keys: Tuple[Any, ...]
+    score: float
+    drivers: Dict[str, float]
+
+
+class RiskAggregator:
+    """
+    Incrementally maintained risk aggregates over a pipeline of scored deals.
+
+    Deals are identified by a caller-supplied hashable ``deal_id`` (tickers
+    are optional on ``IpoInput`` and therefore not a reliable key).  Each
+    update costs O(dimensions * (drivers + log bins)).
+
+    Examples
+    --------
+    >>> agg = RiskAggregator()
+    >>> agg.add("UPX", ipo, compute_ipo_risk(ipo))
+    >>> agg.summary("sector", "Construction").mean_score
+    """
+
+    def __init__(
+        self,
+        *,
+        dimensions: Tuple[str, ...] = DIMENSIONS,
+        sketch_bins: int = DEFAULT_SKETCH_BINS,
+        quantiles: Tuple[float, ...] = (0.1, 0.5, 0.9),
+    ) -> None:
+        for dim in dimensions:
+            if dim not in IpoInput.__dataclass_fields__:
+                raise ValueError(f"Unknown aggregation dimension {dim!r}")
+        self.dimensions = tuple(dimensions)
+        self.sketch_bins = sketch_bins
+        self.quantiles = tuple(quantiles)
+        self._deals: Dict[Hashable, _DealEntry] = {}
+        self._groups: Dict[str, Dict[Any, _GroupStats]] = {dim: {} for dim in self.dimensions}
+        self._overall = _GroupStats(sketch_bins)
+
+    def __len__(self) -> int:
+        return len(self._deals)
+
+    def __contains__(self, deal_id: Hashable) -> bool:
+        return deal_id in self._deals
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add(self, deal_id: Hashable, ipo: IpoInput, result: RiskResult) -> None:
+        """Fold a newly scored deal into the aggregates."""
+        if deal_id in self._deals:
+            raise KeyError(f"Deal {deal_id!r} is already aggregated; use update()")
+        entry = _DealEntry(
+            keys=tuple(getattr(ipo, dim) for dim in self.dimensions),
+            score=float(result.risk_score),
+            drivers={d.name: float(d.contribution_points) for d in result.drivers},
+        )
+        self._deals[deal_id] = entry
+        self._apply(entry, add=True)
+
+    def update(self, deal_id: Hashable, ipo: IpoInput, result: RiskResult) -> None:
+        """Replace a deal's previous score (and grouping keys) with a new one."""
+        self.remove(deal_id)
+        self.add(deal_id, ipo, result)
+
+    def remove(self, deal_id: Hashable) -> None:
+        """Withdraw a deal from every group it contributes to."""
+        try:
+            entry = self._deals.pop(deal_id)
+        except KeyError:
+            raise KeyError(f"Deal {deal_id!r} is not aggregated") from None
+        self._apply(entry, add=False)
+
+    def _apply(self, entry: _DealEntry, *, add: bool) -> None:
+        targets = [self._overall]
+        for dim, key in zip(self.dimensions, entry.keys):
+            groups = self._groups[dim]
+            stats = groups.get(key)
+            if stats is None:
+                stats = groups[key] = _GroupStats(self.sketch_bins)
+            targets.append(stats)
+
+        for stats in targets:
+            if add:
+                stats.add(entry.score, entry.drivers)
+            else:
+                stats.remove(entry.score, entry.drivers)
+
+        if not add:
+            for dim, key in zip(self.dimensions, entry.keys):
+                if self._groups[dim][key].count == 0:
+                    del self._groups[dim][key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _summarize(self, dimension: str, value: Any, stats: _GroupStats) -> GroupSummary:
+        return GroupSummary(
+            dimension=dimension,
+            value=value,
+            count=stats.count,
+            mean_score=stats.score_sum / stats.count if stats.count else None,
+            quantiles={q: stats.sketch.quantile(q) for q in self.quantiles},
+            driver_totals=dict(stats.driver_totals),
+        )
+
+    def summary(self, dimension: str, value: Any) -> GroupSummary:
+        """Snapshot the aggregates for one group, e.g. ``("sector", "Tech")``."""
+        if dimension not in self._groups:
+            raise ValueError(f"Unknown aggregation dimension {dimension!r}")
+        stats = self._groups[dimension].get(value)
+        if stats is None:
+            stats = _GroupStats(self.sketch_bins)
+        return self._summarize(dimension, value, stats)
+
+    def groups(self, dimension: str) -> Dict[Any, GroupSummary]:
+        """Snapshot every non-empty group along ``dimension``."""
+        if dimension not in self._groups:
+            raise ValueError(f"Unknown aggregation dimension {dimension!r}")
+        return {
+            value: self._summarize(dimension, value, stats)
+            for value, stats in self._groups[dimension].items()
+        }
+
+    def overall(self) -> GroupSummary:
+        """Snapshot the aggregates across the whole pipeline."""
+        return self._summarize("*", None, self._overall)
+
+    def quantile(self, dimension: str, value: Any, q: float) -> Optional[float]:
+        """Approximate ``q``-quantile of risk scores within one group."""
+        stats = self._groups.get(dimension, {}).get(value)
+        return stats.sketch.quantile(q) if stats is not None else None
@@ -0,0 +1,341 @@
+"""
+Backtesting harness for coefficient sets against realised IPO outcomes.
+
+Historical deals are wrapped in ``BacktestSample``s (input, 0/1 outcome,
+listing date).  ``FeatureCache`` builds their feature matrix exactly once,
+sorted by listing date, so every evaluation window is a contiguous slice of
+cached rows and no window ever re-runs the feature pipeline.
+
+``evaluate`` scores a set of samples under fixed coefficients and reports
+AUC, log-loss, Brier score, a calibration curve and decile lift.
+``walk_forward`` steps through time with rolling or expanding training
+windows, optionally re-fitting coefficients per window (in parallel worker
+processes) through ``fit_coefficients_from_matrix``.
+"""
+
+import bisect
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .calibration import fit_coefficients_from_matrix
+from .entities import IpoInput
+from .features import FEATURE_KEYS, build_feature_vector
+from .logistic import COEFFS_V1, _logistic
+
+FitFunction = Callable[[Sequence[Sequence[float]], Sequence[int], Sequence[str]], Dict[str, float]]
+
+LOG_LOSS_EPS = 1e-15
+
+
+@dataclass
+class BacktestSample:
+    ipo: IpoInput
+    outcome: int
+    listing_date: date
+
+
+@dataclass
+class CalibrationBin:
+    lower: float
+    upper: float
+    count: int
+    mean_predicted: Optional[float]
+    observed_rate: Optional[float]
+
+
+@dataclass
+class BacktestMetrics:
+    n: int
+    base_rate: float
+    auc: Optional[float]
+    log_loss: float
+    brier: float
+    calibration: List[CalibrationBin] = field(default_factory=list)
+    # Event rate of each predicted-risk decile (highest risk first) divided
+    # by the overall event rate.
+    decile_lift: List[Optional[float]] = field(default_factory=list)
+
+
+@dataclass
+class WindowResult:
+    train_start: Optional[date]
+    train_end: date
+    test_start: date
+    test_end: date
+    n_train: int
+    coeffs: Dict[str, float]
+    metrics: BacktestMetrics
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+def roc_auc(probs: Sequence[float], outcomes: Sequence[int]) -> Optional[float]:
+    """Mann-Whitney AUC with average ranks for ties; ``None`` if one class is absent."""
+    n_pos = sum(1 for y in outcomes if y)
+    n_neg = len(outcomes) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return None
+    order = sorted(range(len(probs)), key=probs.__getitem__)
+    rank_sum_pos = 0.0
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and probs[order[j + 1]] == probs[order[i]]:
+            j += 1
+        avg_rank = (i + j) / 2.0 + 1.0
+        for k in range(i, j + 1):
+            if outcomes[order[k]]:
+                rank_sum_pos += avg_rank
+        i = j + 1
+    return (rank_sum_pos - n_pos * (n_pos + 1) / 2.0) / (n_pos * n_neg)
+
+
+def calibration_curve(
+    probs: Sequence[float], outcomes: Sequence[int], n_bins: int = 10
+) -> List[CalibrationBin]:
+    """Equal-width probability bins with mean prediction and observed event rate."""
+    counts = [0] * n_bins
+    pred_sums = [0.0] * n_bins
+    event_sums = [0] * n_bins
+    for p, y in zip(probs, outcomes):
+        b = min(int(p * n_bins), n_bins - 1)
+        counts[b] += 1
+        pred_sums[b] += p
+        event_sums[b] += 1 if y else 0
+    return [
+        CalibrationBin(
+            lower=b / n_bins,
+            upper=(b + 1) / n_bins,
+            count=counts[b],
+            mean_predicted=pred_sums[b] / counts[b] if counts[b] else None,
+            observed_rate=event_sums[b] / counts[b] if counts[b] else None,
+        )
+        for b in range(n_bins)
+    ]
+
+
+def decile_lift(
+    probs: Sequence[float], outcomes: Sequence[int], n_groups: int = 10
+) -> List[Optional[float]]:
+    """Event-rate lift per predicted-risk group, riskiest group first."""
+    n = len(probs)
+    total_events = sum(1 for y in outcomes if y)
+    if n == 0 or total_events == 0:
+        return [None] * n_groups
+    base_rate = total_events / n
+    order = sorted(range(n), key=probs.__getitem__, reverse=True)
+    lifts: List[Optional[float]] = []
+    for g in range(n_groups):
+        lo = g * n // n_groups
+        hi = (g + 1) * n // n_groups
+        if hi == lo:
+            lifts.append(None)
+            continue
+        events = sum(1 for k in order[lo:hi] if outcomes[k])
+        lifts.append((events / (hi - lo)) / base_rate)
+    return lifts
+
+
+def compute_metrics(
+    probs: Sequence[float], outcomes: Sequence[int], *, n_bins: int = 10
+) -> BacktestMetrics:
+    """All headline metrics for predicted probabilities in [0, 1]."""
+    n = len(probs)
+    if n == 0:
+        raise ValueError("Cannot compute metrics on an empty sample")
+    log_loss = 0.0
+    brier = 0.0
+    for p, y in zip(probs, outcomes):
+        q = min(max(p, LOG_LOSS_EPS), 1.0 - LOG_LOSS_EPS)
+        log_loss -= math.log(q) if y else math.log(1.0 - q)
+        brier += (p - (1.0 if y else 0.0)) ** 2
+    return BacktestMetrics(
+        n=n,
+        base_rate=sum(1 for y in outcomes if y) / n,
+        auc=roc_auc(probs, outcomes),
+        log_loss=log_loss / n,
+        brier=brier / n,
+        calibration=calibration_curve(probs, outcomes, n_bins),
+        decile_lift=decile_lift(probs, outcomes),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Feature cache
+# ---------------------------------------------------------------------------
+
+
+def _build_scoring_features(ipo: IpoInput) -> Mapping[str, float]:
+    # Same inputs as compute_ipo_risk, including the stored prospectus text.
+    return build_feature_vector(ipo, getattr(ipo, "prospectus_text", None))
+
+
+class FeatureCache:
+    """
+    Feature matrix of a historical sample, built once and sorted by date.
+
+    Rows follow ``feature_names`` (default: every builder feature).  Window
+    boundaries map to row ranges through binary search on the dates.
+    """
+
+    def __init__(
+        self,
+        samples: Sequence[BacktestSample],
+        *,
+        feature_names: Sequence[str] = FEATURE_KEYS,
+        build: Optional[Callable[[IpoInput], Mapping[str, float]]] = None,
+    ) -> None:
+        build = build if build is not None else _build_scoring_features
+        ordered = sorted(samples, key=lambda s: s.listing_date)
+        self.feature_names: Tuple[str, ...] = tuple(feature_names)
+        self.dates: List[date] = [s.listing_date for s in ordered]
+        self.outcomes: List[int] = [1 if s.outcome else 0 for s in ordered]
+        self.rows: List[Tuple[float, ...]] = []
+        for s in ordered:
+            features = build(s.ipo)
+            self.rows.append(tuple(float(features.get(k, 0.0)) for k in self.feature_names))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def index_range(self, start: Optional[date], end: date) -> Tuple[int, int]:
+        """Row range with ``start <= listing_date < end`` (open start if ``None``)."""
+        lo = 0 if start is None else bisect.bisect_left(self.dates, start)
+        hi = bisect.bisect_left(self.dates, end)
+        return lo, hi
+
+    def predict(
+        self, coeffs: Mapping[str, float], lo: int = 0, hi: Optional[int] = None
+    ) -> List[float]:
+        """Predicted probabilities for rows ``lo:hi`` under ``coeffs``."""
+        intercept = float(coeffs.get("intercept", 0.0))
+        weights = [
+            (i, float(coeffs[name])) for i, name in enumerate(self.feature_names) if name in coeffs
+        ]
+        out: List[float] = []
+        for row in self.rows[lo:hi]:
+            z = intercept
+            for i, w in weights:
+                z += w * row[i]
+            out.append(_logistic(z))
+        return out
+
+
+def evaluate(
+    samples: Sequence[BacktestSample],
+    coeffs: Optional[Mapping[str, float]] = None,
+    *,
+    cache: Optional[FeatureCache] = None,
+    n_bins: int = 10,
+) -> BacktestMetrics:
+    """Score every sample under ``coeffs`` (default ``COEFFS_V1``) and compute metrics."""
+    cache = cache if cache is not None else FeatureCache(samples)
+    probs = cache.predict(coeffs if coeffs is not None else COEFFS_V1)
+    return compute_metrics(probs, cache.outcomes, n_bins=n_bins)
+
+
+# ---------------------------------------------------------------------------
+# Walk-forward
+# ---------------------------------------------------------------------------
+
+
+def _fit_window(
+    fit: FitFunction, rows: List[Tuple[float, ...]], outcomes: List[int], names: Tuple[str, ...]
+) -> Dict[str, float]:
+    return fit(rows, outcomes, names)
+
+
+def walk_forward(
+    samples: Sequence[BacktestSample],
+    *,
+    test_window: timedelta,
+    train_window: Optional[timedelta] = None,
+    start: Optional[date] = None,
+    coeffs: Optional[Mapping[str, float]] = None,
+    refit: bool = True,
+    fit: Optional[FitFunction] = None,
+    min_train: int = 20,
+    n_jobs: int = 1,
+    cache: Optional[FeatureCache] = None,
+    n_bins: int = 10,
+) -> List[WindowResult]:
+    """
+    Walk-forward evaluation over listing dates.
+
+    Test windows of length ``test_window`` start at ``start`` (default: the
+    first listing date plus ``train_window``, or plus ``test_window`` for
+    expanding windows) and advance until the data runs out.  Each window
+    trains on the preceding ``train_window`` (rolling) or on all earlier
+    deals (expanding, ``train_window=None``).
+
+    With ``refit=True`` coefficients are fitted per window with ``fit``
+    (default ``fit_coefficients_from_matrix``, which needs scikit-learn);
+    windows with fewer than ``min_train`` deals or a single outcome class
+    are skipped.  With ``refit=False`` the fixed ``coeffs`` are evaluated
+    on every test window.  ``n_jobs > 1`` fits windows in parallel worker
+    processes; ``fit`` must then be picklable (a module-level function or a
+    ``functools.partial`` of one).
+    """
+    if test_window <= timedelta(0):
+        raise ValueError("test_window must be positive")
+    cache = cache if cache is not None else FeatureCache(samples)
+    if not len(cache):
+        return []
+    fixed = dict(coeffs if coeffs is not None else COEFFS_V1)
+    fit_fn: FitFunction = fit if fit is not None else fit_coefficients_from_matrix
+
+    first, last = cache.dates[0], cache.dates[-1]
+    cursor = start if start is not None else first + (train_window or test_window)
+
+    # Lay out windows first; fitting is then embarrassingly parallel.
+    plans: List[Tuple[Optional[date], date, date, int, int, int, int]] = []
+    while cursor <= last:
+        test_end = cursor + test_window
+        train_start = cursor - train_window if train_window is not None else None
+        tr_lo, tr_hi = cache.index_range(train_start, cursor)
+        te_lo, te_hi = cache.index_range(cursor, test_end)
+        if te_hi > te_lo:
+            plans.append((train_start, cursor, test_end, tr_lo, tr_hi, te_lo, te_hi))
+        cursor = test_end
+
+    def _trainable(tr_lo: int, tr_hi: int) -> bool:
+        labels = cache.outcomes[tr_lo:tr_hi]
+        return len(labels) >= min_train and 0 < sum(labels) < len(labels)
+
+    if refit:
+        plans = [p for p in plans if _trainable(p[3], p[4])]
+        jobs = [
+            (fit_fn, cache.rows[p[3] : p[4]], cache.outcomes[p[3] : p[4]], cache.feature_names)
+            for p in plans
+        ]
+        if n_jobs > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                fitted = list(pool.map(_fit_window, *zip(*jobs)))
+        else:
+            fitted = [_fit_window(*job) for job in jobs]
+    else:
+        fitted = [fixed] * len(plans)
+
+    results: List[WindowResult] = []
+    for (train_start, test_start, test_end, tr_lo, tr_hi, te_lo, te_hi), window_coeffs in zip(
+        plans, fitted
+    ):
+        probs = cache.predict(window_coeffs, te_lo, te_hi)
+        results.append(
+            WindowResult(
+                train_start=train_start,
+                train_end=test_start,
+                test_start=test_start,
+                test_end=test_end,
+                n_train=tr_hi - tr_lo,
+                coeffs=dict(window_coeffs),
+                metrics=compute_metrics(probs, cache.outcomes[te_lo:te_hi], n_bins=n_bins),
+            )
+        )
+    return results
@@ -0,0 +1,394 @@
+"""
+Dictionary-encoded batch loading.
+
+Large batches repeat the same strings (country, sector, often tickers across
+snapshots) and the categorical inputs take only a handful of values.
+``EncodedBatch`` stores a batch column-wise:
+
+* every string field is interned into a per-field ``StringPool`` and kept as
+  an integer code column; each distinct string is validated once, when it is
+  first seen;
+* the categorical tuple ``(underwriter_tier, auditor_is_big4,
+  sector_cyclicality, region_risk_tier)`` is dictionary-encoded, so the
+  quality and context features are computed once per distinct combination
+  and gathered by code;
+* prospectus texts are pooled too, so a text shared by several rows (e.g.
+  re-scored snapshots) is scanned once;
+* numeric fields live in ``array.array`` columns.
+
+Scores equal ``compute_ipo_risk(ipo).risk_score`` for every row.
+"""
+
+import math
+import sys
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from .features.builder import FEATURE_KEYS, _reject_text_engine_weights
+from .features.context import _geo_feature
+from .features.financials import _financial_feature
+from .features.liquidity import (
+    DEFAULT_WEIGHT_LIQUIDITY,
+    DEFAULT_WEIGHT_LOCKUP,
+    _liquidity_core,
+    _lockup_feature,
+)
+from .features.quality import _auditor_feature, _underwriter_feature
+from .features.textual import _text_feature
+from .features.valuation import _valuation_feature
+from .logistic import COEFFS_V1, _logistic
+from .validators import (
+    ValidationError,
+    _ensure_finite,
+    _validate_categorical_values,
+    _validate_deal_values,
+    _validate_financial_values,
+    _validate_identity_values,
+)
+
+# Categorical inputs, in the order of the tuples in ``EncodedBatch.categories``.
+CATEGORICAL_FIELDS: Tuple[str, ...] = (
+    "underwriter_tier",
+    "auditor_is_big4",
+    "sector_cyclicality",
+    "region_risk_tier",
+)
+STRING_FIELDS: Tuple[str, ...] = ("ticker", "company_name", "country", "sector")
+# Numeric columns, stored as ``array("d")``; NaN in sector_ps_multiple means missing.
+NUMERIC_COLUMNS: Tuple[str, ...] = (
+    "price_low",
+    "price_high",
+    "offer_shares",
+    "free_float_pct",
+    "lockup_days",
+    "revenue_ttm",
+    "gross_margin",
+    "net_margin",
+    "growth_yoy",
+    "sector_ps_multiple",
+)
+
+Category = Tuple[int, bool, int, int]
+
+
+class StringPool:
+    """Interns strings to dense integer codes (``-1`` encodes ``None``)."""
+
+    __slots__ = ("_codes", "values", "_check")
+
+    def __init__(self, check: Optional[Callable[[str], None]] = None) -> None:
+        self._codes: Dict[str, int] = {}
+        self.values: List[str] = []
+        self._check = check
+
+    def check(self, value: Optional[str]) -> None:
+        """Validate ``value`` without interning it; known values passed already."""
+        if value is not None and self._check is not None and value not in self._codes:
+            self._check(value)
+
+    def code(self, value: Optional[str]) -> int:
+        self.check(value)
+        return self._intern(value)
+
+    def _intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            value = sys.intern(value)
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def value(self, code: int) -> Optional[str]:
+        return None if code < 0 else self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _stored_int(value: float) -> Any:
+    """An integer field read back from its float column, unchanged if not integral."""
+    return int(value) if value.is_integer() else value
+
+
+def _field_check(field: str) -> Callable[[str], None]:
+    def check(value: str) -> None:
+        kwargs: Dict[str, Optional[str]] = dict.fromkeys(STRING_FIELDS)
+        kwargs[field] = value
+        _validate_identity_values(**kwargs)
+
+    return check
+
+
+class EncodedBatch:
+    """
+    Column-wise, dictionary-encoded batch of IPO inputs.
+
+    Build one with ``from_ipos`` / ``from_records`` (or ``add_ipo`` /
+    ``add_record``), then call ``score`` or ``build_features``.  Rows are
+    validated as they are added, with the same rules as
+    ``validate_ipo_input``; a failing row raises ``ValidationError`` naming
+    its index and is not added.
+
+    Examples
+    --------
+    >>> batch = EncodedBatch.from_ipos(ipos)
+    >>> scores = batch.score()
+    >>> len(batch.categories), len(batch.strings["sector"])   # distinct values
+    """
+
+    def __init__(self, *, validate: bool = True) -> None:
+        self.validate = validate
+        self.strings: Dict[str, StringPool] = {
+            field: StringPool(_field_check(field) if validate else None) for field in STRING_FIELDS
+        }
+        self.string_codes: Dict[str, array] = {field: array("i") for field in STRING_FIELDS}
+        self.texts = StringPool()
+        self.text_codes = array("i")
+        self.categories: List[Category] = []
+        self._category_index: Dict[Category, int] = {}
+        self.category_codes = array("i")
+        self.numeric: Dict[str, array] = {name: array("d") for name in NUMERIC_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.category_codes)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_ipos(cls, ipos: Iterable[IpoInput], *, validate: bool = True) -> "EncodedBatch":
+        batch = cls(validate=validate)
+        for ipo in ipos:
+            batch.add_ipo(ipo)
+        return batch
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Mapping[str, Any]], *, validate: bool = True
+    ) -> "EncodedBatch":
+        """
+        Load flat records (e.g. parsed JSONL or CSV rows) keyed by the
+        ``IpoInput`` field names, with the deal-term and financial fields at
+        top level (``price_low``, ``revenue_ttm``, ...).
+        """
+        batch = cls(validate=validate)
+        for record in records:
+            batch.add_record(record)
+        return batch
+
+    def add_ipo(self, ipo: IpoInput) -> int:
+        deal = ipo.deal_terms
+        fin = ipo.financials
+        return self._add(
+            (ipo.ticker, ipo.company_name, ipo.country, ipo.sector),
+            (
+                ipo.underwriter_tier,
+                ipo.auditor_is_big4,
+                ipo.sector_cyclicality,
+                ipo.region_risk_tier,
+            ),
+            (
+                deal.price_low,
+                deal.price_high,
+                deal.offer_shares,
+                deal.free_float_pct,
+                deal.lockup_days,
+                fin.revenue_ttm,
+                fin.gross_margin,
+                fin.net_margin,
+                fin.growth_yoy,
+                ipo.sector_ps_multiple,
+            ),
+            getattr(ipo, "prospectus_text", None),
+        )
+
+    def add_record(self, record: Mapping[str, Any]) -> int:
+        get = record.get
+        try:
+            categorical = tuple(record[field] for field in CATEGORICAL_FIELDS)
+            numeric = tuple(
+                get(name) if name == "sector_ps_multiple" else record[name]
+                for name in NUMERIC_COLUMNS
+            )
+        except KeyError as exc:
+            raise ValidationError(f"row {len(self)}: missing field {exc.args[0]!r}") from None
+        return self._add(
+            tuple(get(field) for field in STRING_FIELDS),
+            categorical,  # type: ignore[arg-type]
+            numeric,
+            get("prospectus_text"),
+        )
+
+    def _add(
+        self,
+        strings: Tuple[Optional[str], ...],
+        categorical: Category,
+        numeric: Tuple[Any, ...],
+        text: Optional[str],
+    ) -> int:
+        row = len(self)
+        uw, big4, cyc, region = categorical
+        category: Category = (uw, bool(big4), cyc, region)
+        price_low, price_high, shares, free_float, lockup, revenue, gross, net, growth, ps = numeric
+        if ps is not None and math.isnan(ps):
+            ps = None
+        pools = self.strings
+        try:
+            # Validate the whole row before interning anything, so a rejected
+            # row leaves no strings behind in the pools.
+            for field, value in zip(STRING_FIELDS, strings):
+                pools[field].check(value)
+            if self.validate:
+                # Integer fields may arrive as floats from JSON or CSV; NaN
+                # would slip through the range checks below.
+                _ensure_finite("offer_shares", shares)
+                _ensure_finite("lockup_days", lockup)
+                _validate_deal_values(price_low, price_high, shares, free_float, lockup)
+                _validate_financial_values(revenue, gross, net, growth)
+                _validate_categorical_values(uw, cyc, region, ps)
+        except ValidationError as exc:
+            raise ValidationError(f"row {row}: {exc}") from exc
+
+        for field, value in zip(STRING_FIELDS, strings):
+            self.string_codes[field].append(pools[field]._intern(value))
+        self.text_codes.append(self.texts.code(text) if text else -1)
+        code = self._category_index.get(category)
+        if code is None:
+            code = len(self.categories)
+            self._category_index[category] = code
+            self.categories.append(category)
+        self.category_codes.append(code)
+        values = (price_low, price_high, shares, free_float, lockup, revenue, gross, net, growth)
+        for name, value in zip(NUMERIC_COLUMNS, values):
+            self.numeric[name].append(value)
+        self.numeric["sector_ps_multiple"].append(math.nan if ps is None else ps)
+        return row
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def ipo(self, row: int) -> IpoInput:
+        """Rebuild the ``IpoInput`` of one row."""
+        num = {name: col[row] for name, col in self.numeric.items()}
+        ps = num["sector_ps_multiple"]
+        uw, big4, cyc, region = self.categories[self.category_codes[row]]
+        strings = {f: self.strings[f].value(self.string_codes[f][row]) for f in STRING_FIELDS}
+        return IpoInput(
+            **strings,
+            deal_terms=DealTermsDomain(
+                num["price_low"],
+                num["price_high"],
+                _stored_int(num["offer_shares"]),
+                num["free_float_pct"],
+                _stored_int(num["lockup_days"]),
+            ),
+            financials=FinancialSnapshotDomain(
+                num["revenue_ttm"], num["gross_margin"], num["net_margin"], num["growth_yoy"]
+            ),
+            underwriter_tier=uw,
+            auditor_is_big4=big4,
+            sector_cyclicality=cyc,
+            region_risk_tier=region,
+            sector_ps_multiple=None if math.isnan(ps) else ps,
+            prospectus_text=self.texts.value(self.text_codes[row]),
+        )
+
+    def __iter__(self) -> Iterator[IpoInput]:
+        return (self.ipo(row) for row in range(len(self)))
+
+    # ------------------------------------------------------------------
+    # Features and scores
+    # ------------------------------------------------------------------
+
+    def category_features(self) -> List[Tuple[float, float, float]]:
+        """``(f_uw, f_aud, f_geo)`` per distinct categorical combination."""
+        return [
+            (_underwriter_feature(uw), _auditor_feature(big4), _geo_feature(cyc, region))
+            for uw, big4, cyc, region in self.categories
+        ]
+
+    def text_features(self) -> List[float]:
+        """``f_text`` per distinct prospectus text."""
+        return [_text_feature(text) for text in self.texts.values]
+
+    def _iter_feature_rows(self) -> Iterator[Tuple[float, ...]]:
+        category_features = self.category_features()
+        text_features = self.text_features()
+        neutral_text = _text_feature(None)
+        num = self.numeric
+        rows = zip(
+            num["price_low"],
+            num["price_high"],
+            num["offer_shares"],
+            num["free_float_pct"],
+            num["lockup_days"],
+            num["revenue_ttm"],
+            num["net_margin"],
+            num["growth_yoy"],
+            num["sector_ps_multiple"],
+            self.category_codes,
+            self.text_codes,
+        )
+        for (
+            price_low,
+            price_high,
+            shares,
+            free_float,
+            lockup,
+            revenue,
+            net,
+            growth,
+            ps,
+            cat,
+            txt,
+        ) in rows:
+            offer_usd = (price_low + price_high) / 2.0 * shares
+            dollar_float = offer_usd * min(max(free_float, 0.0) / 100.0, 1.0)
+            f_liq = _liquidity_core(free_float, dollar_float)
+            f_lock = _lockup_feature(lockup)
+            f_liq_total = max(
+                0.0, min(DEFAULT_WEIGHT_LIQUIDITY * f_liq + DEFAULT_WEIGHT_LOCKUP * f_lock, 1.0)
+            )
+            f_uw, f_aud, f_geo = category_features[cat]
+            yield (
+                f_liq,
+                f_lock,
+                f_liq_total,
+                _valuation_feature(offer_usd, revenue, None if math.isnan(ps) else ps),
+                f_uw,
+                f_aud,
+                f_geo,
+                _financial_feature(net, growth),
+                text_features[txt] if txt >= 0 else neutral_text,
+            )
+
+    def build_features(self) -> Dict[str, array]:
+        """Feature columns (``FEATURE_KEYS`` -> ``array("d")``), one value per row."""
+        out = {name: array("d") for name in FEATURE_KEYS}
+        appenders = [out[name].append for name in FEATURE_KEYS]
+        for row in self._iter_feature_rows():
+            for append, value in zip(appenders, row):
+                append(value)
+        return out
+
+    def score(self, coeffs: Optional[Mapping[str, float]] = None) -> array:
+        """Risk scores in [0, 100], one per row (``array("d")``)."""
+        coeffs_to_use = coeffs if coeffs is not None else COEFFS_V1
+        _reject_text_engine_weights(coeffs_to_use, "EncodedBatch.score")
+        intercept = float(coeffs_to_use.get("intercept", 0.0))
+        # Summation in feature order, as in ``risk_score_from_features``.
+        weights = tuple(float(coeffs_to_use.get(name, 0.0)) for name in FEATURE_KEYS)
+        scores = array("d")
+        append = scores.append
+        for row in self._iter_feature_rows():
+            z = intercept
+            for w, value in zip(weights, row):
+                z += w * value
+            append(100.0 * _logistic(z))
+        return scores
@@ -0,0 +1,384 @@
+"""
+Bayesian calibration with expert priors.
+
+The paper ("Bayesian Updating with Expert Priors") combines expert beliefs
+about the coefficients with observed outcomes.  ``fit_posterior`` places an
+independent Gaussian prior on every coefficient, centred on ``COEFFS_V1``
+by default, and computes the Laplace approximation of the posterior: the
+posterior mode found by Newton's method, with covariance equal to the
+inverse Hessian of the negative log posterior at the mode.  Everything is
+plain Python; the linear algebra is a Cholesky factorisation of a matrix
+with one row per coefficient.
+
+Under a Gaussian posterior the logit of a deal is itself Gaussian, with
+mean ``m . x`` and variance ``x' S x``.  The logistic link is monotone, so
+score quantiles are the logistic of logit quantiles and the credible
+interval of each deal is exact, with no sampling.  ``PosteriorModel.sample``
+still draws coefficient vectors for callers who need Monte Carlo.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .entities import IpoInput
+from .features.builder import FEATURE_KEYS
+from .features.config import FeatureConfig
+from .fused import compile_feature_extractor
+from .logistic import COEFFS_V1, _logistic
+from .model import CompiledModel, compile_model
+
+Matrix = List[List[float]]
+
+
+def _cholesky(a: Matrix) -> Matrix:
+    """Lower-triangular ``L`` with ``L L' = a`` for a symmetric positive-definite ``a``."""
+    n = len(a)
+    low = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        row_i = low[i]
+        for j in range(i + 1):
+            row_j = low[j]
+            s = a[i][j]
+            for k in range(j):
+                s -= row_i[k] * row_j[k]
+            if i == j:
+                if s <= 0.0:
+                    raise ValueError("Posterior precision matrix is not positive definite")
+                row_i[i] = math.sqrt(s)
+            else:
+                row_i[j] = s / row_j[j]
+    return low
+
+
+def _solve_lower(low: Matrix, b: Sequence[float]) -> List[float]:
+    x: List[float] = []
+    for i, row in enumerate(low):
+        s = b[i]
+        for k in range(i):
+            s -= row[k] * x[k]
+        x.append(s / row[i])
+    return x
+
+
+def _solve_upper_t(low: Matrix, b: Sequence[float]) -> List[float]:
+    """Solve ``L' x = b`` for lower-triangular ``L``."""
+    n = len(low)
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        s = b[i]
+        for k in range(i + 1, n):
+            s -= low[k][i] * x[k]
+        x[i] = s / low[i][i]
+    return x
+
+
+def _inverse_lower(low: Matrix) -> Matrix:
+    n = len(low)
+    columns = [_solve_lower(low, [1.0 if i == j else 0.0 for i in range(n)]) for j in range(n)]
+    return [[columns[j][i] for j in range(n)] for i in range(n)]
+
+
+def _log1pexp(z: float) -> float:
+    return z + math.log1p(math.exp(-z)) if z > 0 else math.log1p(math.exp(z))
+
+
+@dataclass(frozen=True)
+class ScoreInterval:
+    """Posterior summary of one deal's risk score (points in [0, 100])."""
+
+    score: float
+    mean: float
+    lower: float
+    upper: float
+    level: float
+
+
+@dataclass(frozen=True)
+class PosteriorModel:
+    """
+    Laplace posterior over ``("intercept", *feature_names)`` coefficients.
+
+    ``mode`` is the posterior mode and ``whitening`` the inverse Cholesky
+    factor of the posterior precision, so the covariance is
+    ``whitening' whitening`` and ``|whitening x|^2`` is the logit variance.
+    """
+
+    feature_names: Tuple[str, ...]
+    mode: Tuple[float, ...]
+    whitening: Tuple[Tuple[float, ...], ...]
+    n_observations: int
+    iterations: int
+
+    @property
+    def coeffs(self) -> Dict[str, float]:
+        """Posterior-mode coefficients, usable as ``compute_ipo_risk(coeffs=...)``."""
+        return dict(zip(("intercept",) + self.feature_names, self.mode))
+
+    def std(self) -> Dict[str, float]:
+        """Posterior standard deviation of every coefficient."""
+        names = ("intercept",) + self.feature_names
+        n = len(names)
+        return {
+            name: math.sqrt(sum(self.whitening[k][j] ** 2 for k in range(n)))
+            for j, name in enumerate(names)
+        }
+
+    def to_model(self, version: str) -> CompiledModel:
+        return compile_model(self.coeffs, version)
+
+    def sample(self, n_draws: int, *, seed: Optional[int] = None) -> List[Dict[str, float]]:
+        """``n_draws`` coefficient dicts drawn from the Laplace posterior."""
+        rng = random.Random(seed)
+        names = ("intercept",) + self.feature_names
+        n = len(names)
+        w = self.whitening
+        draws: List[Dict[str, float]] = []
+        for _ in range(n_draws):
+            z = [rng.gauss(0.0, 1.0) for _ in range(n)]
+            # b = mode + W' z has covariance W' W.
+            draws.append(
+                {
+                    name: self.mode[j] + sum(w[k][j] * z[k] for k in range(j, n))
+                    for j, name in enumerate(names)
+                }
+            )
+        return draws
+
+    def _row(self, features: Mapping[str, float]) -> List[float]:
+        return [1.0] + [float(features.get(name, 0.0)) for name in self.feature_names]
+
+    def logit_distribution(self, features: Mapping[str, float]) -> Tuple[float, float]:
+        """Posterior mean and standard deviation of the logit for a feature dict."""
+        return self._logit_moments(self._row(features))
+
+    def _logit_moments(self, x: Sequence[float]) -> Tuple[float, float]:
+        mu = 0.0
+        for m_j, x_j in zip(self.mode, x):
+            mu += m_j * x_j
+        var = 0.0
+        for row in self.whitening:
+            u = 0.0
+            for w_j, x_j in zip(row, x):
+                u += w_j * x_j
+            var += u * u
+        return mu, math.sqrt(var)
+
+    def interval(self, features: Mapping[str, float], level: float = 0.9) -> ScoreInterval:
+        """Equal-tailed credible interval of the score for a feature dict."""
+        return _interval(*self._logit_moments(self._row(features)), level, _quantile(level))
+
+    def score_intervals(
+        self,
+        ipos: Union[IpoInput, Iterable[IpoInput]],
+        level: float = 0.9,
+        *,
+        validate: bool = True,
+        feature_config: Optional[FeatureConfig] = None,
+    ) -> List[ScoreInterval]:
+        """
+        Credible intervals for deals (each with its own ``prospectus_text``).
+
+        Features come from ``compile_feature_extractor``, so validation errors and
+        feature values match ``compute_ipo_risk``.
+        """
+        q = _quantile(level)
+        extract = compile_feature_extractor(feature_config)
+        positions = [FEATURE_KEYS.index(name) for name in self.feature_names]
+        if isinstance(ipos, IpoInput):
+            ipos = [ipos]
+        out: List[ScoreInterval] = []
+        append = out.append
+        moments = self._logit_moments
+        for ipo in ipos:
+            row = extract(ipo, ipo.prospectus_text, validate)
+            x = [1.0]
+            x.extend(row[p] for p in positions)
+            append(_interval(*moments(x), level, q))
+        return out
+
+
+def _quantile(level: float) -> float:
+    if not 0.0 < level < 1.0:
+        raise ValueError("level must be in (0, 1)")
+    return NormalDist().inv_cdf(0.5 + level / 2.0)
+
+
+def _interval(mu: float, sd: float, level: float, q: float) -> ScoreInterval:
+    # Posterior mean of the logistic of a Gaussian logit (probit approximation).
+    mean_z = mu / math.sqrt(1.0 + math.pi * sd * sd / 8.0)
+    return ScoreInterval(
+        score=100.0 * _logistic(mu),
+        mean=100.0 * _logistic(mean_z),
+        lower=100.0 * _logistic(mu - q * sd),
+        upper=100.0 * _logistic(mu + q * sd),
+        level=level,
+    )
+
+
+def fit_posterior_from_matrix(
+    feature_matrix: Sequence[Sequence[float]],
+    targets: Sequence[int],
+    feature_names: Sequence[str],
+    *,
+    prior: Optional[Mapping[str, float]] = None,
+    prior_sd: Union[float, Mapping[str, float]] = 1.0,
+    max_iter: int = 50,
+    tol: float = 1e-9,
+) -> PosteriorModel:
+    """
+    Laplace posterior from a precomputed feature matrix.
+
+    ``feature_matrix`` has one row per observation with columns ordered as
+    ``feature_names``.  ``prior`` gives the prior mean of each coefficient
+    (missing keys default to 0.0; ``COEFFS_V1`` when omitted) and
+    ``prior_sd`` its standard deviation, either one value for all
+    coefficients or a mapping (missing keys default to 1.0).
+    """
+    names = tuple(feature_names)
+    unknown = sorted(set(names) - set(FEATURE_KEYS))
+    if unknown:
+        raise ValueError(f"Unknown feature keys: {', '.join(unknown)}")
+    if len(feature_matrix) != len(targets):
+        raise ValueError("feature_matrix and targets must have the same length")
+    y = [int(t) for t in targets]
+    if any(t not in (0, 1) for t in y):
+        raise ValueError("targets must be 0 or 1")
+
+    all_names = ("intercept",) + names
+    prior_mean_map = COEFFS_V1 if prior is None else prior
+    prior_mean = [float(prior_mean_map.get(name, 0.0)) for name in all_names]
+    if isinstance(prior_sd, Mapping):
+        sds = [float(prior_sd.get(name, 1.0)) for name in all_names]
+    else:
+        sds = [float(prior_sd)] * len(all_names)
+    if any(not math.isfinite(s) or s <= 0.0 for s in sds):
+        raise ValueError("prior_sd must be positive and finite")
+    prior_precision = [1.0 / (s * s) for s in sds]
+
+    rows = [[1.0] + [float(v) for v in row] for row in feature_matrix]
+    for row in rows:
+        if len(row) != len(all_names):
+            raise ValueError("feature_matrix rows must match feature_names")
+    n = len(all_names)
+
+    def neg_log_posterior(b: Sequence[float]) -> float:
+        total = 0.0
+        for row, t in zip(rows, y):
+            z = 0.0
+            for b_j, x_j in zip(b, row):
+                z += b_j * x_j
+            total += _log1pexp(z) - t * z
+        for b_j, m_j, p_j in zip(b, prior_mean, prior_precision):
+            total += 0.5 * p_j * (b_j - m_j) ** 2
+        return total
+
+    def gradient_and_precision(b: Sequence[float]) -> Tuple[List[float], Matrix]:
+        grad = [p_j * (b_j - m_j) for b_j, m_j, p_j in zip(b, prior_mean, prior_precision)]
+        hess = [[0.0] * n for _ in range(n)]
+        for j in range(n):
+            hess[j][j] = prior_precision[j]
+        for row, t in zip(rows, y):
+            z = 0.0
+            for b_j, x_j in zip(b, row):
+                z += b_j * x_j
+            p = _logistic(z)
+            r = p - t
+            w = p * (1.0 - p)
+            for j in range(n):
+                x_j = row[j]
+                grad[j] += r * x_j
+                wx = w * x_j
+                h_j = hess[j]
+                for k in range(j + 1):
+                    h_j[k] += wx * row[k]
+        for j in range(n):
+            for k in range(j):
+                hess[k][j] = hess[j][k]
+        return grad, hess
+
+    # Newton's method from the prior mean; the objective is strictly convex.
+    b = list(prior_mean)
+    objective = neg_log_posterior(b)
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        grad, hess = gradient_and_precision(b)
+        low = _cholesky(hess)
+        step = _solve_upper_t(low, _solve_lower(low, grad))
+
+        # Halve the step until the objective does not increase.
+        scale = 1.0
+        while True:
+            candidate = [b_j - scale * s_j for b_j, s_j in zip(b, step)]
+            value = neg_log_posterior(candidate)
+            if value <= objective or scale < 1e-10:
+                break
+            scale /= 2.0
+        b, objective = candidate, value
+        if max(abs(scale * s_j) for s_j in step) < tol:
+            break
+
+    # Precision at the mode; its inverse Cholesky factor whitens the logit.
+    _, hess = gradient_and_precision(b)
+    whitening = _inverse_lower(_cholesky(hess))
+    return PosteriorModel(
+        feature_names=names,
+        mode=tuple(b),
+        whitening=tuple(tuple(row) for row in whitening),
+        n_observations=len(rows),
+        iterations=iterations,
+    )
+
+
+def fit_posterior(
+    ipos: Sequence[IpoInput],
+    targets: Sequence[int],
+    *,
+    feature_keys: Optional[Iterable[str]] = None,
+    prior: Optional[Mapping[str, float]] = None,
+    prior_sd: Union[float, Mapping[str, float]] = 1.0,
+    feature_config: Optional[FeatureConfig] = None,
+    max_iter: int = 50,
+) -> PosteriorModel:
+    """
+    Bayesian counterpart of ``fit_coefficients``.
+
+    Parameters
+    ----------
+    ipos, targets:
+        Training deals and their 0/1 outcomes, as for ``fit_coefficients``.
+    feature_keys:
+        Features to weight; defaults to the keys of ``prior`` (the features
+        of ``COEFFS_V1`` when no prior is given).
+    prior, prior_sd:
+        Gaussian prior mean (default ``COEFFS_V1``) and standard deviation
+        (one value or a per-key mapping) of every coefficient.  Small
+        ``prior_sd`` keeps the expert weights when data are sparse.
+    feature_config:
+        Optional ``FeatureConfig``; score with the same configuration.
+
+    Examples
+    --------
+    >>> posterior = fit_posterior(ipos, outcomes, prior_sd=0.5)
+    >>> posterior.coeffs                        # posterior mode
+    >>> posterior.score_intervals(new_ipos, level=0.9)[0].upper
+    """
+    prior_map = COEFFS_V1 if prior is None else prior
+    if feature_keys is None:
+        names = [name for name in FEATURE_KEYS if name in prior_map]
+    else:
+        names = list(feature_keys)
+    extract = compile_feature_extractor(feature_config)
+    positions = [FEATURE_KEYS.index(name) if name in FEATURE_KEYS else -1 for name in names]
+    if -1 in positions:
+        unknown = sorted(n for n, p in zip(names, positions) if p == -1)
+        raise ValueError(f"Unknown feature keys: {', '.join(unknown)}")
+    matrix = []
+    for ipo in ipos:
+        row = extract(ipo, ipo.prospectus_text, True)
+        matrix.append([row[p] for p in positions])
+    return fit_posterior_from_matrix(
+        matrix, targets, names, prior=prior_map, prior_sd=prior_sd, max_iter=max_iter
+    )
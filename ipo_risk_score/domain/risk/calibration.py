@@ -20,10 +20,11 @@ customise the target definition, handle class imbalance or regularise the
 model.  Ensure scikit‑learn is installed (``pip install scikit-learn``).
 """
 
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from .entities import IpoInput
 from .features import build_feature_vector
+from .features.config import FeatureConfig
 
 
 def fit_coefficients(
@@ -34,6 +35,7 @@ def fit_coefficients(
     penalty: str = "l2",
     C: float = 1.0,
     solver: str = "lbfgs",
+    feature_config: Optional[FeatureConfig] = None,
 ) -> Dict[str, float]:
     """
     Fit logistic regression coefficients from a dataset of IPOs.
@@ -54,6 +56,9 @@ def fit_coefficients(
         used.
     penalty, C, solver:
         Hyperparameters passed through to ``sklearn.linear_model.LogisticRegression``.
+    feature_config:
+        Optional ``FeatureConfig`` used to build the feature vectors; pass the
+        same configuration to ``compute_ipo_risk`` when scoring.
 
     Returns
     -------
@@ -68,6 +73,39 @@ def fit_coefficients(
     >>> # Use the learned coefficients
     >>> result = compute_ipo_risk(ipo, coeffs=coeffs, model_version="v1-trained")
     """
+    # Build feature matrix
+    feature_matrix: List[List[float]] = []
+    feature_names: List[str] = []
+    for ipo in ipos:
+        features = build_feature_vector(ipo, config=feature_config)
+        # Determine feature order on first pass
+        if not feature_names:
+            feature_names = list(features.keys()) if feature_keys is None else list(feature_keys)
+        # Append row in order of feature_names
+        feature_matrix.append([float(features.get(k, 0.0)) for k in feature_names])
+
+    return fit_coefficients_from_matrix(
+        feature_matrix, targets, feature_names, penalty=penalty, C=C, solver=solver
+    )
+
+
+def fit_coefficients_from_matrix(
+    feature_matrix: Sequence[Sequence[float]],
+    targets: Sequence[int],
+    feature_names: Sequence[str],
+    *,
+    penalty: str = "l2",
+    C: float = 1.0,
+    solver: str = "lbfgs",
+) -> Dict[str, float]:
+    """
+    Fit logistic regression coefficients from a precomputed feature matrix.
+
+    ``feature_matrix`` has one row per observation with columns ordered as
+    ``feature_names``.  This is the fitting step of ``fit_coefficients``,
+    exposed so callers that cache feature matrices (e.g. walk-forward
+    backtests) can refit without rebuilding features.
+    """
     try:
         import numpy as np  # type: ignore
         from sklearn.linear_model import LogisticRegression  # type: ignore
@@ -82,18 +120,7 @@ def fit_coefficients(
             "Install them via `pip install scikit-learn numpy`."
         ) from exc
 
-    # Build feature matrix
-    feature_matrix: List[List[float]] = []
-    feature_names: List[str] = []
-    for ipo in ipos:
-        features = build_feature_vector(ipo)
-        # Determine feature order on first pass
-        if not feature_names:
-            feature_names = list(features.keys()) if feature_keys is None else list(feature_keys)
-        # Append row in order of feature_names
-        feature_matrix.append([float(features.get(k, 0.0)) for k in feature_names])
-
-    X = np.array(feature_matrix)
+    X = np.array(feature_matrix, dtype=float)
     y = np.array(targets, dtype=int)
 
     model = LogisticRegression(penalty=penalty, C=C, solver=solver, max_iter=1000)
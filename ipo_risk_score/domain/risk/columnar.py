@@ -0,0 +1,252 @@
+"""
+Columnar scoring entry point.
+
+``score_columns`` scores a batch of IPOs laid out as columns (one buffer per
+input field) instead of nested ``IpoInput`` objects.  Columns may be NumPy
+arrays, ``array.array``s, ``memoryview``s, any other object exposing the
+buffer protocol, or Arrow arrays (read through their zero-copy NumPy view).
+The buffers are wrapped in ``memoryview``s and never copied; rows are
+validated, featurised and scored straight from them without building any
+per-row entity objects.
+
+The returned score column is an ``array.array("d")``, which itself exposes
+the buffer protocol (``numpy.frombuffer(scores)`` is zero-copy).
+"""
+
+import math
+from array import array
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from .features.builder import FEATURE_KEYS, _reject_text_engine_weights
+from .features.context import _geo_feature
+from .features.financials import _financial_feature
+from .features.liquidity import (
+    DEFAULT_WEIGHT_LIQUIDITY,
+    DEFAULT_WEIGHT_LOCKUP,
+    _liquidity_core,
+    _lockup_feature,
+)
+from .features.quality import _auditor_feature, _underwriter_feature
+from .features.valuation import _valuation_feature
+from .logistic import COEFFS_V1, _logistic
+from .validators import (
+    ValidationError,
+    _ensure_finite,
+    _validate_categorical_values,
+    _validate_deal_values,
+    _validate_financial_values,
+)
+
+# Input columns, in the order rows are unpacked.
+REQUIRED_COLUMNS: Tuple[str, ...] = (
+    "price_low",
+    "price_high",
+    "offer_shares",
+    "free_float_pct",
+    "lockup_days",
+    "revenue_ttm",
+    "gross_margin",
+    "net_margin",
+    "growth_yoy",
+    "underwriter_tier",
+    "auditor_is_big4",
+    "sector_cyclicality",
+    "region_risk_tier",
+)
+# Optional column; NaN marks a missing sector multiple.
+OPTIONAL_COLUMNS: Tuple[str, ...] = ("sector_ps_multiple",)
+
+# Feature order of the rows produced by ``_iter_feature_rows``.
+FEATURE_COLUMNS: Tuple[str, ...] = FEATURE_KEYS
+
+# Text is not carried in numeric buffers, so the textual feature stays neutral.
+NEUTRAL_TEXT_FEATURE = 0.5
+
+# memoryview formats accepted as numeric columns.
+_NUMERIC_FORMATS = frozenset("bBhHiIlLqQfd?")
+
+
+def _as_column(name: str, obj: Any) -> memoryview:
+    """Wrap ``obj`` in a one-dimensional numeric ``memoryview`` without copying."""
+    if not isinstance(obj, memoryview) and hasattr(obj, "to_numpy") and hasattr(obj, "null_count"):
+        # Arrow array: primitive arrays without nulls expose a zero-copy NumPy
+        # view; booleans are bit-packed in Arrow and must be unpacked once.
+        if obj.null_count:
+            raise ValidationError(f"column {name!r} contains nulls")
+        try:
+            obj = obj.to_numpy(zero_copy_only=True)
+        except Exception:  # pragma: no cover - depends on pyarrow internals
+            obj = obj.to_numpy(zero_copy_only=False)
+    try:
+        view = obj if isinstance(obj, memoryview) else memoryview(obj)
+    except TypeError as exc:
+        raise TypeError(
+            f"column {name!r} must support the buffer protocol, got {type(obj).__name__}"
+        ) from exc
+    if view.ndim != 1:
+        raise ValueError(f"column {name!r} must be one-dimensional, got ndim={view.ndim}")
+    fmt = view.format.lstrip("@=")
+    if fmt not in _NUMERIC_FORMATS:
+        raise TypeError(f"column {name!r} has unsupported element format {view.format!r}")
+    return view
+
+
+def _prepare_columns(columns: Mapping[str, Any]) -> Tuple[int, Tuple[memoryview, ...]]:
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"missing required columns: {', '.join(missing)}")
+
+    views = [_as_column(name, columns[name]) for name in REQUIRED_COLUMNS]
+    for name in OPTIONAL_COLUMNS:
+        if name in columns:
+            views.append(_as_column(name, columns[name]))
+
+    n_rows = len(views[0])
+    names = REQUIRED_COLUMNS + tuple(n for n in OPTIONAL_COLUMNS if n in columns)
+    for name, view in zip(names, views):
+        if len(view) != n_rows:
+            raise ValueError(
+                f"column {name!r} has {len(view)} rows; expected {n_rows} "
+                f"(from {REQUIRED_COLUMNS[0]!r})"
+            )
+    return n_rows, tuple(views)
+
+
+def _iter_feature_rows(
+    columns: Mapping[str, Any],
+    *,
+    validate: bool = True,
+    on_error: Optional[Callable[[int, ValidationError], None]] = None,
+) -> Iterator[Tuple[float, ...]]:
+    """
+    Yield one feature tuple per row, ordered as ``FEATURE_COLUMNS``.
+
+    A row failing validation raises, or with ``on_error`` is reported as
+    ``on_error(row, exc)`` and skipped.
+    """
+    n_rows, views = _prepare_columns(columns)
+    if len(views) == len(REQUIRED_COLUMNS):
+        # No sector multiple column: every row falls back to the PS heuristic.
+        rows = ((*row, None) for row in zip(*views))
+    else:
+        rows = zip(*views)
+
+    for i, (
+        price_low,
+        price_high,
+        offer_shares,
+        free_float_pct,
+        lockup_days,
+        revenue_ttm,
+        gross_margin,
+        net_margin,
+        growth_yoy,
+        underwriter_tier,
+        auditor_is_big4,
+        sector_cyclicality,
+        region_risk_tier,
+        sector_ps,
+    ) in enumerate(rows):
+        if sector_ps is not None and math.isnan(sector_ps):
+            sector_ps = None
+        if validate:
+            try:
+                # Integer fields may arrive in float buffers; NaN would slip
+                # through the range checks below, which assume Python ints.
+                _ensure_finite("offer_shares", offer_shares)
+                _ensure_finite("lockup_days", lockup_days)
+                _validate_deal_values(
+                    price_low, price_high, offer_shares, free_float_pct, lockup_days
+                )
+                _validate_financial_values(revenue_ttm, gross_margin, net_margin, growth_yoy)
+                _validate_categorical_values(
+                    underwriter_tier, sector_cyclicality, region_risk_tier, sector_ps
+                )
+            except ValidationError as exc:
+                if on_error is None:
+                    raise ValidationError(f"row {i}: {exc}") from exc
+                on_error(i, exc)
+                continue
+
+        # Shared intermediates: offer value feeds both liquidity and valuation.
+        offer_usd = (price_low + price_high) / 2.0 * offer_shares
+        dollar_float = offer_usd * min(max(free_float_pct, 0.0) / 100.0, 1.0)
+        f_liq = _liquidity_core(free_float_pct, dollar_float)
+        f_lock = _lockup_feature(lockup_days)
+        f_liq_total = max(
+            0.0, min(DEFAULT_WEIGHT_LIQUIDITY * f_liq + DEFAULT_WEIGHT_LOCKUP * f_lock, 1.0)
+        )
+        yield (
+            f_liq,
+            f_lock,
+            f_liq_total,
+            _valuation_feature(offer_usd, revenue_ttm, sector_ps),
+            _underwriter_feature(underwriter_tier),
+            _auditor_feature(auditor_is_big4),
+            _geo_feature(sector_cyclicality, region_risk_tier),
+            _financial_feature(net_margin, growth_yoy),
+            NEUTRAL_TEXT_FEATURE,
+        )
+
+
+def build_feature_columns(columns: Mapping[str, Any], *, validate: bool = True) -> Dict[str, array]:
+    """
+    Compute every feature for a columnar batch.
+
+    Returns a dict mapping each name in ``FEATURE_COLUMNS`` to an
+    ``array.array("d")`` with one value per input row.
+    """
+    out = {name: array("d") for name in FEATURE_COLUMNS}
+    appenders = [out[name].append for name in FEATURE_COLUMNS]
+    for row in _iter_feature_rows(columns, validate=validate):
+        for append, value in zip(appenders, row):
+            append(value)
+    return out
+
+
+def score_columns(
+    columns: Mapping[str, Any],
+    coeffs: Optional[Mapping[str, float]] = None,
+    *,
+    validate: bool = True,
+) -> array:
+    """
+    Validate, featurise and score a columnar batch of IPOs.
+
+    Parameters
+    ----------
+    columns:
+        Mapping from input field name to a one-dimensional numeric buffer.
+        Required names are listed in ``REQUIRED_COLUMNS``;
+        ``sector_ps_multiple`` is optional and NaN entries mean "not
+        provided".  All columns must have the same length.
+    coeffs:
+        Logistic coefficients; defaults to ``COEFFS_V1``.
+    validate:
+        Apply the same domain checks as ``validate_ipo_input`` to each row.
+        Failing rows raise ``ValidationError`` naming the row index.
+
+    Returns
+    -------
+    array.array
+        Risk scores in [0, 100], one per row (typecode ``"d"``).
+
+    Notes
+    -----
+    Scores match ``compute_ipo_risk`` for the same inputs without prospectus
+    text.  Feature values are clamped to [0, 1] by construction, so the
+    per-feature range check of ``risk_score_from_features`` is not repeated.
+    """
+    coeffs_to_use = coeffs if coeffs is not None else COEFFS_V1
+    _reject_text_engine_weights(coeffs_to_use, "score_columns")
+    intercept = float(coeffs_to_use.get("intercept", 0.0))
+    weights = tuple(float(coeffs_to_use.get(name, 0.0)) for name in FEATURE_COLUMNS)
+
+    scores = array("d")
+    append = scores.append
+    for row in _iter_feature_rows(columns, validate=validate):
+        z = intercept
+        for w, value in zip(weights, row):
+            z += w * value
+        append(100.0 * _logistic(z))
+    return scores
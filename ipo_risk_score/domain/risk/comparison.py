@@ -0,0 +1,170 @@
+"""
+Multi-model scoring in one pass.
+
+``score_models`` validates and featurises every deal once and evaluates all
+coefficient sets against the shared feature rows: the ``deals x features``
+matrix times the ``features x models`` weight matrix, followed by the
+logistic link.  Each logit is accumulated in feature order, so every score
+equals ``compute_ipo_risk(ipo, coeffs=...)`` for that model exactly.
+
+The result keeps one score per deal per model and the champion/challenger
+differences used to compare calibrated candidates against production.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .entities import IpoInput
+from .features.builder import FEATURE_KEYS, _reject_text_engine_weights
+from .features.config import FeatureConfig
+from .fused import compile_feature_extractor
+from .logistic import _logistic
+from .model import CompiledModel
+
+ModelSpec = Union[Mapping[str, float], CompiledModel]
+
+
+@dataclass
+class ChallengerSummary:
+    """Distribution of ``challenger - champion`` score differences (points)."""
+
+    challenger: str
+    mean_diff: float
+    mean_abs_diff: float
+    max_abs_diff: float
+    n_higher: int
+    n_lower: int
+
+
+@dataclass
+class MultiModelScores:
+    """Scores of ``n`` deals under ``k`` models (``scores[deal][model]``)."""
+
+    model_names: Tuple[str, ...]
+    champion: str
+    scores: List[Tuple[float, ...]]
+
+    def _index(self, name: str) -> int:
+        try:
+            return self.model_names.index(name)
+        except ValueError:
+            raise KeyError(f"Unknown model {name!r}") from None
+
+    def column(self, name: str) -> List[float]:
+        """Scores of every deal under one model."""
+        j = self._index(name)
+        return [row[j] for row in self.scores]
+
+    def diff(self, challenger: str, champion: Optional[str] = None) -> List[float]:
+        """Per-deal ``challenger - champion`` in score points."""
+        c = self._index(challenger)
+        b = self._index(champion if champion is not None else self.champion)
+        return [row[c] - row[b] for row in self.scores]
+
+    def challengers(self) -> Tuple[str, ...]:
+        return tuple(name for name in self.model_names if name != self.champion)
+
+    def summary(self) -> Dict[str, ChallengerSummary]:
+        """One ``ChallengerSummary`` per non-champion model."""
+        out: Dict[str, ChallengerSummary] = {}
+        n = len(self.scores)
+        for name in self.challengers():
+            diffs = self.diff(name)
+            out[name] = ChallengerSummary(
+                challenger=name,
+                mean_diff=sum(diffs) / n if n else 0.0,
+                mean_abs_diff=sum(abs(d) for d in diffs) / n if n else 0.0,
+                max_abs_diff=max((abs(d) for d in diffs), default=0.0),
+                n_higher=sum(1 for d in diffs if d > 0),
+                n_lower=sum(1 for d in diffs if d < 0),
+            )
+        return out
+
+
+def _weight_rows(
+    models: Mapping[str, ModelSpec],
+) -> Tuple[Tuple[str, ...], List[float], List[Tuple[float, ...]]]:
+    names = tuple(models)
+    intercepts: List[float] = []
+    weights: List[Tuple[float, ...]] = []
+    for name in names:
+        spec = models[name]
+        coeffs = spec.coeffs if isinstance(spec, CompiledModel) else spec
+        _reject_text_engine_weights(coeffs, f"score_models (model {name!r})")
+        intercepts.append(float(coeffs.get("intercept", 0.0)))
+        weights.append(tuple(float(coeffs.get(key, 0.0)) for key in FEATURE_KEYS))
+    return names, intercepts, weights
+
+
+def _named_models(models: Sequence[ModelSpec]) -> Dict[str, ModelSpec]:
+    # A CompiledModel is named by its version, a plain coefficient set by
+    # its position ("model_0", "model_1", ...).
+    named: Dict[str, ModelSpec] = {}
+    for i, spec in enumerate(models):
+        name = spec.version if isinstance(spec, CompiledModel) else f"model_{i}"
+        if name in named:
+            raise ValueError(f"Duplicate model name {name!r}; pass a mapping to name models")
+        named[name] = spec
+    return named
+
+
+def score_models(
+    ipos: Union[IpoInput, Iterable[IpoInput]],
+    models: Union[Mapping[str, ModelSpec], Sequence[ModelSpec]],
+    *,
+    champion: Optional[str] = None,
+    validate: bool = True,
+    feature_config: Optional[FeatureConfig] = None,
+) -> MultiModelScores:
+    """
+    Score deals under several coefficient sets with one feature pass.
+
+    Parameters
+    ----------
+    ipos:
+        One ``IpoInput`` or an iterable of them.  Each deal's own
+        ``prospectus_text`` feeds ``f_text``.
+    models:
+        ``{name: coefficient dict or CompiledModel}``, or a sequence of
+        them.  In a sequence a ``CompiledModel`` is named by its version and
+        a coefficient dict by its position (``"model_0"``, ...); duplicate
+        names raise ``ValueError``.  Order is preserved.
+    champion:
+        Reference model for ``diff``/``summary``; defaults to the first.
+    validate:
+        Apply ``validate_ipo_input`` rules once per deal.
+    feature_config:
+        Optional ``FeatureConfig`` shared by every model.
+
+    Examples
+    --------
+    >>> out = score_models(ipos, {"v1": COEFFS_V1, "tex": COEFFS_TEX_EXAMPLE})
+    >>> out.diff("tex")              # per-deal tex - v1
+    >>> out.summary()["tex"].mean_abs_diff
+    """
+    if not isinstance(models, Mapping):
+        models = _named_models(models)
+    if not models:
+        raise ValueError("score_models needs at least one model")
+    names, intercepts, weights = _weight_rows(models)
+    if champion is None:
+        champion = names[0]
+    elif champion not in names:
+        raise KeyError(f"Unknown champion model {champion!r}")
+
+    extract = compile_feature_extractor(feature_config)
+    if isinstance(ipos, IpoInput):
+        ipos = [ipos]
+    model_rows = list(zip(intercepts, weights))
+
+    scores: List[Tuple[float, ...]] = []
+    append = scores.append
+    for ipo in ipos:
+        x = extract(ipo, ipo.prospectus_text, validate)
+        row = []
+        for z, w in model_rows:
+            for w_i, x_i in zip(w, x):
+                z += w_i * x_i
+            row.append(100.0 * _logistic(z))
+        append(tuple(row))
+    return MultiModelScores(model_names=names, champion=champion, scores=scores)
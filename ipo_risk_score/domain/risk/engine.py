@@ -1,22 +1,56 @@
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional
 
 from .entities import IpoInput, RiskDriverDomain, RiskResult
 from .features import build_feature_vector
+from .features.builder import _reject_text_engine_weights
 from .logistic import COEFFS_V1, risk_score_from_features
 from .validators import validate_ipo_input
 
+if TYPE_CHECKING:  # pragma: no cover - kept off the default import path
+    from .features.config import FeatureConfig
+    from .features.text_engine import TextFeatureEngine
+    from .model import CompiledModel
+
 # Default model version and coefficient set.  Users can provide custom
 # coefficients when calling `compute_ipo_risk` to override this.
 MODEL_VERSION = "v1-logistic"
 
 
+def _driver_description(name: str, value: float, coeff: float) -> str:
+    contribution = coeff * value
+    return f"{name}: value {value:.2f} * weight {coeff:.2f} ≈ {contribution:.3f} logit points"
+
+
+def _build_drivers(
+    features: Dict[str, float], coeffs: Mapping[str, float]
+) -> List[RiskDriverDomain]:
+    """Per-feature logit contributions, in feature order."""
+    drivers: List[RiskDriverDomain] = []
+    for name, value in features.items():
+        coeff = coeffs.get(name)
+        if coeff is None:
+            # Skip features that do not influence the active coefficient set.
+            continue
+        drivers.append(
+            RiskDriverDomain(
+                name=name,
+                contribution_points=round(coeff * value, 4),
+                description=_driver_description(name, value, coeff),
+            )
+        )
+    return drivers
+
+
 def compute_ipo_risk(
     ipo: IpoInput,
     *,
-    coeffs: Optional[Dict[str, float]] = None,
+    coeffs: Optional[Mapping[str, float]] = None,
     model_version: Optional[str] = None,
     include_attractiveness: bool = True,
     prospectus_text: Optional[str] = None,
+    model: Optional["CompiledModel"] = None,
+    feature_config: Optional["FeatureConfig"] = None,
+    text_engine: Optional["TextFeatureEngine"] = None,
 ) -> RiskResult:
     """
     High-level API: validate IPO input, compute features, score risk, and
@@ -35,6 +69,18 @@ def compute_ipo_risk(
     model_version:
         Optional string identifying the version of the model used.  If
         omitted, the global `MODEL_VERSION` is used.
+    model:
+        Optional `CompiledModel` (see `model.py` and `registry.py`).  When
+        given, it replaces `coeffs` and the reported `model_version` is the
+        model's own version; passing either of those as well is an error.
+    feature_config:
+        Optional `FeatureConfig` overriding the liquidity, valuation and
+        financial feature constants (see `features/config.py`).
+    text_engine:
+        Optional `TextFeatureEngine` adding section- and negation-aware text
+        features (`TEXT_ENGINE_KEYS`); they contribute only when the
+        coefficient set weights them.  A coefficient set that weights them
+        requires the engine; without it a `ValueError` is raised.
 
     Returns
     -------
@@ -42,6 +88,12 @@ def compute_ipo_risk(
         An object containing the risk score, attractiveness percentage,
         version string, driver breakdown and raw feature vector.
     """
+    if model is not None and (coeffs is not None or model_version is not None):
+        raise ValueError("Pass either model or coeffs/model_version, not both")
+    weights = model.coeffs if model is not None else coeffs
+    if text_engine is None and weights is not None:
+        _reject_text_engine_weights(weights, "compute_ipo_risk without a text_engine")
+
     # Defensive validation of input.
     validate_ipo_input(ipo)
 
@@ -49,33 +101,24 @@ def compute_ipo_risk(
     # If a prospectus_text is supplied explicitly, use it; otherwise, fall back
     # to any text stored on the IpoInput object (prospectus_text attribute).
     text = prospectus_text if prospectus_text is not None else getattr(ipo, "prospectus_text", None)
-    features = build_feature_vector(ipo, prospectus_text=text)
-    # Use custom coefficients if provided, otherwise default to COEFFS_V1.
-    coeffs_to_use = coeffs if coeffs is not None else COEFFS_V1
-    risk = risk_score_from_features(features, coeffs_to_use)
+    features = build_feature_vector(
+        ipo, prospectus_text=text, config=feature_config, text_engine=text_engine
+    )
+    if model is not None:
+        coeffs_to_use = model.coeffs
+        risk = model.score_features(features)
+        model_version = model.version
+    else:
+        # Use custom coefficients if provided, otherwise default to COEFFS_V1.
+        coeffs_to_use = coeffs if coeffs is not None else COEFFS_V1
+        risk = risk_score_from_features(features, coeffs_to_use)
     # The inverse of the risk score can be interpreted as an "attractiveness"
     # metric.  This concept is not described in the theoretical paper but
     # remains available for downstream applications.  Callers can disable
     # attractiveness calculation by setting include_attractiveness=False.
     attractiveness = 100.0 - risk if include_attractiveness else None
 
-    drivers: List[RiskDriverDomain] = []
-    for name, value in features.items():
-        coeff = coeffs_to_use.get(name)
-        if coeff is None:
-            # Skip features that do not influence the active coefficient set.
-            continue
-        contribution = coeff * value
-        drivers.append(
-            RiskDriverDomain(
-                name=name,
-                contribution_points=round(contribution, 4),
-                description=(
-                    f"{name}: value {value:.2f} * weight {coeff:.2f} "
-                    f"≈ {contribution:.3f} logit points"
-                ),
-            )
-        )
+    drivers = _build_drivers(features, coeffs_to_use)
 
     return RiskResult(
         risk_score=risk,
@@ -1,5 +1,5 @@
 """Feature engineering subpackage for the IPO Risk Score model."""
 
-from .builder import build_feature_vector
+from .builder import FEATURE_KEYS, build_feature_vector
 
-__all__ = ["build_feature_vector"]
+__all__ = ["FEATURE_KEYS", "build_feature_vector"]
@@ -0,0 +1,138 @@
+"""
+Incremental ``f_text`` across prospectus amendments.
+
+A deal typically files an S-1 followed by several S-1/As that each touch a
+few sections, yet ``compute_textual_features`` rescans the whole text every
+time.  ``FilingHistory`` keeps, per deal, the token / positive / negative
+counts of every paragraph of the latest filing keyed by a content hash.
+Adding an amendment hashes its paragraphs, scans only the ones not seen in
+the previous filing and sums the counts.
+
+Paragraphs are maximal runs of non-blank lines.  Tokens never span a line
+break, so the summed counts equal those of a full scan and ``f_text`` is
+identical to ``_text_feature`` on the same text, bit for bit.
+
+Input can be a string or an iterable of chunks (e.g. file reads); only the
+current paragraph is buffered.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .text_engine import _iter_lines
+from .textual import _count_text, _f_text_from_counts
+
+# (tokens, positive, negative)
+Counts = Tuple[int, int, int]
+
+
+def _iter_paragraphs(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Maximal runs of non-blank lines, joined with newlines."""
+    lines: List[str] = []
+    for line in _iter_lines(source):
+        if line.strip():
+            lines.append(line)
+        elif lines:
+            yield "\n".join(lines)
+            lines = []
+    if lines:
+        yield "\n".join(lines)
+
+
+def _digest(paragraph: str) -> bytes:
+    return hashlib.blake2b(paragraph.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+@dataclass(frozen=True)
+class FilingUpdate:
+    """Outcome of adding one filing to a ``FilingHistory``."""
+
+    form: Optional[str]
+    n_paragraphs: int
+    n_rescanned: int
+    n_removed: int
+    tokens: int
+    positive: int
+    negative: int
+
+    @property
+    def n_reused(self) -> int:
+        return self.n_paragraphs - self.n_rescanned
+
+    @property
+    def f_text(self) -> float:
+        return _f_text_from_counts(self.tokens, self.positive, self.negative)
+
+
+class FilingHistory:
+    """
+    Paragraph-level text counts of one deal's latest filing.
+
+    Examples
+    --------
+    >>> history = FilingHistory()
+    >>> history.add(s1_text, form="S-1").f_text
+    >>> update = history.add(s1a_text, form="S-1/A")   # rescans changed paragraphs only
+    >>> update.n_rescanned, update.f_text
+    >>> features = build_feature_vector(ipo)
+    >>> features.update(history.features())
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[bytes, Counts] = {}
+        self._filings: List[FilingUpdate] = []
+
+    @property
+    def filings(self) -> Tuple[FilingUpdate, ...]:
+        return tuple(self._filings)
+
+    @property
+    def latest(self) -> Optional[FilingUpdate]:
+        return self._filings[-1] if self._filings else None
+
+    def add(self, source: Union[str, Iterable[str]], *, form: Optional[str] = None) -> FilingUpdate:
+        """
+        Add the full text of a new filing (original or amendment).
+
+        Only paragraphs absent from the previous filing are scanned; counts
+        of paragraphs dropped by the amendment are discarded.
+        """
+        previous = self._counts
+        current: Dict[bytes, Counts] = {}
+        n_paragraphs = n_rescanned = 0
+        tokens = positive = negative = 0
+        for paragraph in _iter_paragraphs(source):
+            key = _digest(paragraph)
+            counts = current.get(key)
+            if counts is None:
+                counts = previous.get(key)
+                if counts is None:
+                    counts = _count_text(paragraph)
+                    n_rescanned += 1
+                current[key] = counts
+            n_paragraphs += 1
+            tokens += counts[0]
+            positive += counts[1]
+            negative += counts[2]
+        update = FilingUpdate(
+            form=form,
+            n_paragraphs=n_paragraphs,
+            n_rescanned=n_rescanned,
+            n_removed=sum(1 for key in previous if key not in current),
+            tokens=tokens,
+            positive=positive,
+            negative=negative,
+        )
+        self._counts = current
+        self._filings.append(update)
+        return update
+
+    def f_text(self) -> float:
+        """``f_text`` of the latest filing; neutral 0.5 before any filing."""
+        latest = self.latest
+        return 0.5 if latest is None else latest.f_text
+
+    def features(self) -> Dict[str, float]:
+        """Drop-in for ``compute_textual_features`` on the latest filing."""
+        return {"f_text": self.f_text()}
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
 
 from ..entities import IpoInput
 from .context import compute_context_features
@@ -8,16 +8,73 @@ from .quality import compute_quality_features
 from .textual import compute_textual_features
 from .valuation import compute_valuation_feature
 
+if TYPE_CHECKING:  # pragma: no cover - keeps config off the default import path
+    from .config import FeatureConfig
+    from .text_engine import TextFeatureEngine
 
-def build_feature_vector(ipo: IpoInput, prospectus_text: Optional[str] = None) -> Dict[str, float]:
+# Keys produced by ``build_feature_vector``, in insertion order.
+FEATURE_KEYS: Tuple[str, ...] = (
+    "f_liq",
+    "f_lock",
+    "f_liq_total",
+    "f_val",
+    "f_uw",
+    "f_aud",
+    "f_geo",
+    "f_fin",
+    "f_text",
+)
+
+# Extra keys appended by ``build_feature_vector`` when a ``text_engine`` is
+# given (see ``features/text_engine.py``).
+TEXT_ENGINE_KEYS: Tuple[str, ...] = (
+    "f_text_weighted",
+    "f_text_risk_factors",
+    "f_text_mdna",
+    "f_text_proceeds",
+)
+
+
+def _reject_text_engine_weights(coeffs: Mapping[str, float], scorer: str) -> None:
+    """
+    Raise ``ValueError`` if ``coeffs`` weights a ``TEXT_ENGINE_KEYS`` feature.
+
+    ``scorer`` computes ``FEATURE_KEYS`` only, so such a weight would be
+    silently dropped and the score would differ from the engine-based one.
+    """
+    weighted = [name for name in TEXT_ENGINE_KEYS if name in coeffs]
+    if weighted:
+        raise ValueError(
+            f"{scorer} computes FEATURE_KEYS only and cannot apply the text-engine "
+            f"coefficients {', '.join(weighted)}; score with a TextFeatureEngine"
+        )
+
+
+def build_feature_vector(
+    ipo: IpoInput,
+    prospectus_text: Optional[str] = None,
+    *,
+    config: Optional["FeatureConfig"] = None,
+    text_engine: Optional["TextFeatureEngine"] = None,
+) -> Dict[str, float]:
     """
     Assemble all features into a flat dict with values in [0,1].
+
+    ``config`` overrides the liquidity, valuation and financial constants
+    (see ``features/config.py``); the module defaults apply when omitted.
+    ``text_engine`` appends the ``TEXT_ENGINE_KEYS`` section/negation
+    features after ``f_text``.
     """
+    liquidity_kwargs = config.liquidity_kwargs() if config is not None else {}
+    valuation_kwargs = config.valuation_kwargs() if config is not None else {}
+    financial_kwargs = config.financial_kwargs() if config is not None else {}
     features: Dict[str, float] = {}
-    features.update(compute_liquidity_features(ipo))
-    features["f_val"] = compute_valuation_feature(ipo)
+    features.update(compute_liquidity_features(ipo, **liquidity_kwargs))
+    features["f_val"] = compute_valuation_feature(ipo, **valuation_kwargs)
     features.update(compute_quality_features(ipo))
     features.update(compute_context_features(ipo))
-    features.update(compute_financial_features(ipo))
+    features.update(compute_financial_features(ipo, **financial_kwargs))
     features.update(compute_textual_features(ipo, prospectus_text))
+    if text_engine is not None:
+        features.update(text_engine.features(prospectus_text))
     return features
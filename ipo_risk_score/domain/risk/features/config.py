@@ -0,0 +1,279 @@
+"""
+Feature configuration and precompiled feature pipelines.
+
+``FeatureConfig`` gathers every tunable constant of the feature pipeline:
+the liquidity/lock-up weights, the fallback price-to-sales breakpoints and
+the financial ramps.  Regional variants are expressed as configurations
+instead of forks of the feature modules.
+
+``compile_feature_pipeline`` bakes one configuration into a closure whose
+constants are plain local variables, so the per-deal cost is the arithmetic
+alone.  ``score_configurations`` evaluates several configurations side by
+side in a single pass over a batch, sharing the configuration-independent
+work (input validation and the text scan) across them.
+"""
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..entities import IpoInput
+from .context import _geo_feature
+from .financials import DEFAULT_GROWTH_FULL, DEFAULT_NET_MARGIN_FULL
+from .liquidity import (
+    DEFAULT_ALPHA_DOLLAR_FLOAT,
+    DEFAULT_ALPHA_FREE_FLOAT,
+    DEFAULT_LOCKUP_MAX_DAYS,
+    DEFAULT_WEIGHT_LIQUIDITY,
+    DEFAULT_WEIGHT_LOCKUP,
+)
+from .quality import _auditor_feature, _underwriter_feature
+from .textual import compute_textual_features
+from .valuation import (
+    DEFAULT_PS_HIGH,
+    DEFAULT_PS_LOW,
+    DEFAULT_PS_MID,
+    DEFAULT_VAL_RISK_LOW,
+    DEFAULT_VAL_RISK_MID,
+)
+
+
+@dataclass(frozen=True)
+class FeatureConfig:
+    """Tunable constants of the feature pipeline (defaults mirror the modules)."""
+
+    # Liquidity / lock-up (features/liquidity.py)
+    alpha_free_float: float = DEFAULT_ALPHA_FREE_FLOAT
+    alpha_dollar_float: float = DEFAULT_ALPHA_DOLLAR_FLOAT
+    lockup_max_days: int = DEFAULT_LOCKUP_MAX_DAYS
+    weight_liquidity: float = DEFAULT_WEIGHT_LIQUIDITY
+    weight_lockup: float = DEFAULT_WEIGHT_LOCKUP
+    # Fallback price-to-sales mapping (features/valuation.py)
+    ps_low: float = DEFAULT_PS_LOW
+    ps_mid: float = DEFAULT_PS_MID
+    ps_high: float = DEFAULT_PS_HIGH
+    val_risk_low: float = DEFAULT_VAL_RISK_LOW
+    val_risk_mid: float = DEFAULT_VAL_RISK_MID
+    # Financial ramps (features/financials.py)
+    net_margin_full: float = DEFAULT_NET_MARGIN_FULL
+    growth_full: float = DEFAULT_GROWTH_FULL
+
+    def __post_init__(self) -> None:
+        for name, value in asdict(self).items():
+            if not math.isfinite(value):
+                raise ValueError(f"FeatureConfig.{name} must be finite, got {value!r}")
+        if not 0.0 < self.ps_low < self.ps_mid < self.ps_high:
+            raise ValueError("FeatureConfig requires 0 < ps_low < ps_mid < ps_high")
+        if self.net_margin_full <= 0 or self.growth_full <= 0:
+            raise ValueError("FeatureConfig ramps (net_margin_full, growth_full) must be > 0")
+
+    def liquidity_kwargs(self) -> Dict[str, float]:
+        return {
+            "alpha_free_float": self.alpha_free_float,
+            "alpha_dollar_float": self.alpha_dollar_float,
+            "lockup_max_days": self.lockup_max_days,
+            "weight_liquidity": self.weight_liquidity,
+            "weight_lockup": self.weight_lockup,
+        }
+
+    def valuation_kwargs(self) -> Dict[str, float]:
+        return {
+            "ps_low": self.ps_low,
+            "ps_mid": self.ps_mid,
+            "ps_high": self.ps_high,
+            "val_risk_low": self.val_risk_low,
+            "val_risk_mid": self.val_risk_mid,
+        }
+
+    def financial_kwargs(self) -> Dict[str, float]:
+        return {"net_margin_full": self.net_margin_full, "growth_full": self.growth_full}
+
+
+DEFAULT_FEATURE_CONFIG = FeatureConfig()
+
+
+# (f_liq, f_lock, f_liq_total, f_val, f_fin)
+ContinuousFeatures = Tuple[float, float, float, float, float]
+
+
+def _compile_continuous_features(
+    config: FeatureConfig,
+    lockup_table: Optional[Sequence[float]] = None,
+    lockup_terms: Optional[Sequence[float]] = None,
+) -> Callable[[IpoInput], ContinuousFeatures]:
+    """
+    The liquidity, lock-up, valuation and financial features of one deal.
+
+    This is the one compiled copy of that arithmetic; the feature pipeline,
+    ``TableScorer`` and the fused kernel all call it, so a formula change in
+    the feature modules has a single counterpart here.
+
+    With ``lockup_table`` (``f_lock`` per day up to the cap) and
+    ``lockup_terms`` (its ``weight_lockup`` share of ``f_liq_total``), an
+    integer lock-up is looked up instead of computed; see ``FeatureTables``.
+    """
+    a_ff = config.alpha_free_float
+    a_dv = config.alpha_dollar_float
+    lock_max = config.lockup_max_days
+    lock_max_f = float(lock_max)
+    w_liq = config.weight_liquidity
+    w_lock = config.weight_lockup
+    ps_low, ps_mid, ps_high = config.ps_low, config.ps_mid, config.ps_high
+    v_low, v_mid = config.val_risk_low, config.val_risk_mid
+    slope_low = v_mid - v_low
+    span_low = ps_mid - ps_low
+    slope_high = 1.0 - v_mid
+    span_high = ps_high - ps_mid
+    nm_full = config.net_margin_full
+    gr_full = config.growth_full
+    log1p = math.log1p
+    lock_cap = -1 if lockup_table is None else len(lockup_table) - 1
+
+    def continuous_features(ipo: IpoInput) -> ContinuousFeatures:
+        deal = ipo.deal_terms
+        fin = ipo.financials
+        free_float_pct = deal.free_float_pct
+
+        # Liquidity (features/liquidity.py)
+        offer_usd = (deal.price_low + deal.price_high) / 2.0 * deal.offer_shares
+        dollar_float = offer_usd * min(max(free_float_pct, 0.0) / 100.0, 1.0)
+        ff_component = 1.0 - min(max(free_float_pct, 0.0), 100.0) / 100.0
+        dv_component = 1.0 / (1.0 + log1p(max(dollar_float, 0.0)))
+        f_liq = max(0.0, min(a_ff * ff_component + a_dv * dv_component, 1.0))
+        lockup_days = deal.lockup_days
+        if lock_cap >= 0 and type(lockup_days) is int:
+            day = min(max(lockup_days, 0), lock_cap)
+            f_lock = lockup_table[day]  # type: ignore[index]
+            lock_term = lockup_terms[day]  # type: ignore[index]
+        else:
+            if lock_max <= 0:
+                f_lock = 0.0
+            else:
+                capped = min(max(lockup_days, 0), lock_max)
+                f_lock = max(0.0, min(1.0 - capped / lock_max_f, 1.0))
+            lock_term = w_lock * f_lock
+        f_liq_total = max(0.0, min(w_liq * f_liq + lock_term, 1.0))
+
+        # Valuation (features/valuation.py)
+        revenue = fin.revenue_ttm
+        sector_ps = ipo.sector_ps_multiple
+        if revenue <= 0:
+            f_val = 1.0
+        else:
+            ps_ipo = offer_usd / revenue
+            if sector_ps is not None and sector_ps > 0:
+                f_val = max(0.0, min(1.0, (ps_ipo - sector_ps) / sector_ps))
+            elif ps_ipo <= ps_low:
+                f_val = v_low
+            elif ps_ipo <= ps_mid:
+                f_val = v_low + slope_low * (ps_ipo - ps_low) / span_low
+            elif ps_ipo <= ps_high:
+                f_val = v_mid + slope_high * (ps_ipo - ps_mid) / span_high
+            else:
+                f_val = 1.0
+
+        # Financials (features/financials.py)
+        nm = fin.net_margin
+        gr = fin.growth_yoy
+        risk_net = 1.0 if nm <= 0.0 else (0.0 if nm >= nm_full else 1.0 - nm / nm_full)
+        risk_gr = 1.0 if gr <= 0.0 else (0.0 if gr >= gr_full else 1.0 - gr / gr_full)
+        f_fin = max(0.0, min((risk_net + risk_gr) / 2.0, 1.0))
+
+        return f_liq, f_lock, f_liq_total, f_val, f_fin
+
+    return continuous_features
+
+
+def _compile_numeric_features(config: FeatureConfig) -> Callable[[IpoInput], Dict[str, float]]:
+    continuous_features = _compile_continuous_features(config)
+
+    def numeric_features(ipo: IpoInput) -> Dict[str, float]:
+        f_liq, f_lock, f_liq_total, f_val, f_fin = continuous_features(ipo)
+        return {
+            "f_liq": f_liq,
+            "f_lock": f_lock,
+            "f_liq_total": f_liq_total,
+            "f_val": f_val,
+            "f_uw": _underwriter_feature(ipo.underwriter_tier),
+            "f_aud": _auditor_feature(ipo.auditor_is_big4),
+            "f_geo": _geo_feature(ipo.sector_cyclicality, ipo.region_risk_tier),
+            "f_fin": f_fin,
+        }
+
+    return numeric_features
+
+
+class CompiledFeaturePipeline:
+    """
+    A ``FeatureConfig`` baked into a feature function.
+
+    Calling the pipeline is equivalent to
+    ``build_feature_vector(ipo, prospectus_text, config=config)``.  The
+    arithmetic of the liquidity, valuation and financial modules is inlined
+    with the configuration constants bound as closure locals, so the
+    compiled function skips keyword plumbing and intermediate dicts.
+    ``numeric_features`` computes everything except the text feature, for
+    callers that share one text scan across several pipelines.
+    """
+
+    __slots__ = ("config", "numeric_features")
+
+    def __init__(self, config: FeatureConfig = DEFAULT_FEATURE_CONFIG) -> None:
+        self.config = config
+        self.numeric_features = _compile_numeric_features(config)
+
+    def __call__(self, ipo: IpoInput, prospectus_text: Optional[str] = None) -> Dict[str, float]:
+        features = self.numeric_features(ipo)
+        features.update(compute_textual_features(ipo, prospectus_text))
+        return features
+
+
+def compile_feature_pipeline(
+    config: FeatureConfig = DEFAULT_FEATURE_CONFIG,
+) -> CompiledFeaturePipeline:
+    """Compile ``config`` once; reuse the result for every deal."""
+    return CompiledFeaturePipeline(config)
+
+
+def score_configurations(
+    ipos: Sequence[IpoInput],
+    configs: Mapping[str, FeatureConfig],
+    coeffs: Optional[Mapping[str, float]] = None,
+    *,
+    validate: bool = True,
+) -> Dict[str, List[float]]:
+    """
+    Score a batch under several feature configurations in one pass.
+
+    Each IPO is validated once and its prospectus text scanned once; the
+    compiled pipeline of every configuration then reuses that work.  Returns
+    ``{config_name: [risk_score per IPO]}`` in input order.
+    """
+    # Imported lazily: the feature layer must not import the scoring layer at
+    # module import time (builder -> config -> logistic/validators).
+    from ..logistic import COEFFS_V1, _logistic
+    from ..validators import validate_ipo_input
+    from .builder import FEATURE_KEYS, _reject_text_engine_weights
+
+    coeffs_to_use = coeffs if coeffs is not None else COEFFS_V1
+    _reject_text_engine_weights(coeffs_to_use, "score_configurations")
+    intercept = float(coeffs_to_use.get("intercept", 0.0))
+    # Feature order keeps the summation order of ``risk_score_from_features``.
+    weights = [(k, float(coeffs_to_use[k])) for k in FEATURE_KEYS if k in coeffs_to_use]
+    numeric = {
+        name: compile_feature_pipeline(cfg).numeric_features for name, cfg in configs.items()
+    }
+    out: Dict[str, List[float]] = {name: [] for name in configs}
+
+    for ipo in ipos:
+        if validate:
+            validate_ipo_input(ipo)
+        text = compute_textual_features(ipo, getattr(ipo, "prospectus_text", None))
+        for name, numeric_features in numeric.items():
+            features = numeric_features(ipo)
+            features.update(text)
+            z = intercept
+            for key, weight in weights:
+                z += weight * features[key]
+            out[name].append(100.0 * _logistic(z))
+    return out
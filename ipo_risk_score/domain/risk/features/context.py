@@ -3,6 +3,12 @@ from typing import Dict
 from ..entities import IpoInput
 
 
+def _geo_feature(sector_cyclicality: int, region_risk_tier: int) -> float:
+    """Combined sector/geography risk: (s + g) / 4 clamped to [0, 1]."""
+    f_geo_raw = (sector_cyclicality + region_risk_tier) / 4.0
+    return max(0.0, min(f_geo_raw, 1.0))
+
+
 def compute_context_features(ipo: IpoInput) -> Dict[str, float]:
     """
     Compute contextual risk features such as sector and geographic risk.
@@ -14,12 +20,6 @@ def compute_context_features(ipo: IpoInput) -> Dict[str, float]:
         ipo.sector_cyclicality in {0, 1, 2}
         ipo.region_risk_tier in {0, 1, 2}
     """
-    s = ipo.sector_cyclicality
-    g = ipo.region_risk_tier
-
-    f_geo_raw = (s + g) / 4.0
-    f_geo = max(0.0, min(f_geo_raw, 1.0))
-
     return {
-        "f_geo": f_geo,
+        "f_geo": _geo_feature(ipo.sector_cyclicality, ipo.region_risk_tier),
     }
@@ -0,0 +1,359 @@
+"""
+Streaming text extraction from EDGAR filings.
+
+``compute_textual_features`` expects plain text, but filings arrive as
+EDGAR HTML documents (``.htm``) or full SGML submissions (``.txt``) whose
+markup, inline XBRL headers and financial tables inflate the token count
+and dilute ``(neg - pos) / len(tokens)``.  ``iter_filing_text`` reads a
+filing in fixed-size chunks and yields plain text:
+
+* **Envelope.**  The SEC header and each document's SGML header are
+  dropped; uuencoded, PDF and XBRL documents are skipped, and
+  ``document_types`` keeps only the named ``<TYPE>``s (e.g. ``{"S-1"}``).
+* **Markup.**  Scripts, styles, ``<head>`` and ``<ix:header>`` blocks and
+  comments are removed, block elements become line breaks, other tags
+  vanish and entities are decoded.  Plain-text documents keep their lines.
+* **Tables.**  Each table is buffered (up to ``max_table_chars``) and kept
+  only when at most ``table_numeric_ratio`` of its words contain a digit,
+  so layout tables survive and financial statements do not.
+
+Blank lines separate paragraphs, so the output feeds ``FilingHistory``
+and ``TextFeatureEngine`` directly.  Every yielded chunk ends on a word
+boundary: per-chunk token counts add up to those of the whole text, which
+is what ``filing_text_features`` relies on.  Apart from one buffered
+table, memory is bounded by ``chunk_size``.
+"""
+
+import html
+import os
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Union
+
+from .textual import _count_text, _f_text_from_counts
+
+FilingSource = Union[str, "os.PathLike[str]", Iterable[str]]
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_TABLE_NUMERIC_RATIO = 0.25
+DEFAULT_MAX_TABLE_CHARS = 1 << 22
+
+# Longest unterminated tag, comment or partial word carried between chunks.
+_MAX_CARRY = 1 << 16
+# Characters inspected to tell HTML from plain text and binary documents.
+_SNIFF = 1024
+
+_BODY, _OUTSIDE, _DOCHEAD, _SKIP, _TABLE = range(5)
+
+_STRUCT_RE = re.compile(
+    r"<(/?)(sec-document|sec-header|ims-header|document|text|table|script|style|head|ix:header)"
+    r"\b[^<>]*>",
+    re.IGNORECASE,
+)
+_TEXT_OPEN_RE = re.compile(r"<text\b[^<>]*>", re.IGNORECASE)
+_TABLE_TAG_RE = re.compile(r"<(/?)table\b[^<>]*>", re.IGNORECASE)
+_TYPE_RE = re.compile(r"<type>\s*([^\s<]+)", re.IGNORECASE)
+_BINARY_RE = re.compile(r"begin [0-7]{3} |<(?:pdf|xbrl|xml|json|zip)>", re.IGNORECASE)
+_HTML_RE = re.compile(r"<(?:html|body|div|p|br|font|span|!doctype|\?xml)\b", re.IGNORECASE)
+_ENTITY_TAIL_RE = re.compile(r"&#?\w{0,31}$")
+
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_BLOCK_TAG_RE = re.compile(
+    r"</?(?:p|div|br|tr|li|h[1-6]|ul|ol|dl|dt|dd|hr|pre|blockquote|center|title|caption"
+    r"|section|article|header|footer|body|html|page)\b[^<>]*>",
+    re.IGNORECASE,
+)
+_CELL_TAG_RE = re.compile(r"</?t[dh]\b[^<>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<(?:[/!?]?[A-Za-z][^<>]*|!--.*?--)>", re.DOTALL)
+_HTML_NEWLINES = str.maketrans("\r\n", "  ")
+
+_SKIP_RES: Dict[str, Pattern[str]] = {
+    name: re.compile(rf"</{name}\s*>", re.IGNORECASE)
+    for name in ("text", "script", "style", "head", "ix:header", "sec-header", "ims-header")
+}
+
+_WORD_RE = re.compile(r"\w+")
+_NUMERIC_WORD_RE = re.compile(r"\b[^\W\d]*\d\w*")
+
+
+def _to_text(segment: str, is_html: bool) -> str:
+    """Plain text of a markup segment without structural tags."""
+    if "<!--" in segment:
+        segment = _COMMENT_RE.sub("", segment)
+    if is_html:
+        segment = segment.translate(_HTML_NEWLINES)
+        segment = _BLOCK_TAG_RE.sub("\n", segment)
+        segment = _CELL_TAG_RE.sub(" ", segment)
+        segment = _TAG_RE.sub("", segment)
+        if "&" in segment:
+            segment = html.unescape(segment)
+    elif "<" in segment:
+        segment = _TAG_RE.sub("", segment)
+    return segment
+
+
+def _normalize(text: str) -> str:
+    """Single spaces, no spaces around line breaks and at most one blank line."""
+    lead, trail = text[:1].isspace(), text[-1:].isspace()
+    text = "\n".join([" ".join(line.split()) for line in text.split("\n")])
+    while "\n\n\n" in text:
+        text = text.replace("\n\n\n", "\n\n")
+    # Keep a separator at either edge: it may sit next to a word of the
+    # neighbouring chunk.
+    if not text:
+        return " " if lead else ""
+    if lead and text[0] != "\n":
+        text = " " + text
+    if trail and text[-1] != "\n":
+        text += " "
+    return text
+
+
+def _safe_limit(data: str) -> int:
+    """End of the prefix of ``data`` without an unterminated tag, comment or entity."""
+    n = len(data)
+    limit = n
+    lt = data.rfind("<")
+    if lt != -1 and data.find(">", lt) == -1 and n - lt <= _MAX_CARRY:
+        limit = lt
+    comment = data.rfind("<!--", 0, limit)
+    if comment != -1 and data.find("-->", comment) == -1 and n - comment <= _MAX_CARRY:
+        limit = comment
+    amp = data.rfind("&", max(0, limit - 32), limit)
+    if amp != -1 and _ENTITY_TAIL_RE.match(data, amp, limit):
+        limit = amp
+    return limit
+
+
+class _Extractor:
+    """Incremental markup-to-text state machine; see ``iter_filing_text``."""
+
+    def __init__(
+        self,
+        document_types: Optional[FrozenSet[str]],
+        table_numeric_ratio: float,
+        max_table_chars: int,
+    ) -> None:
+        self._types = document_types
+        self._table_ratio = table_numeric_ratio
+        self._max_table = max_table_chars
+        self._state = _BODY
+        self._html: Optional[bool] = None
+        self._skip_re: Optional[Pattern[str]] = None
+        self._after_skip = _BODY
+        self._header: List[str] = []
+        self._table: List[str] = []
+        self._table_size = 0
+        self._table_depth = 0
+        self._table_overflow = False
+        self._carry = ""
+        self._tail = ""
+        self._started = False
+
+    # -- input ---------------------------------------------------------
+
+    def feed(self, chunk: str) -> str:
+        data = self._carry + chunk if self._carry else chunk
+        out: List[str] = []
+        consumed = self._process(data, _safe_limit(data), out, final=False)
+        self._carry = data[consumed:]
+        return self._emit(out, final=False)
+
+    def close(self) -> str:
+        data, self._carry = self._carry, ""
+        out: List[str] = []
+        if data:
+            self._process(data, len(data), out, final=True)
+        if self._state == _TABLE:
+            self._flush_table(out)
+        return self._emit(out, final=True)
+
+    # -- states --------------------------------------------------------
+
+    def _skip(self, name: str, after: int) -> None:
+        self._skip_re = _SKIP_RES[name]
+        self._after_skip = after
+        self._state = _SKIP
+
+    def _process(self, data: str, limit: int, out: List[str], final: bool) -> int:
+        pos = 0
+        while pos < limit:
+            state = self._state
+            if state == _BODY:
+                if self._html is None:
+                    if limit - pos < _SNIFF and not final:
+                        return pos
+                    head = data[pos : pos + _SNIFF].lstrip()
+                    if _BINARY_RE.match(head):
+                        self._skip("text", _OUTSIDE)
+                        continue
+                    self._html = _HTML_RE.search(head) is not None
+                match = _STRUCT_RE.search(data, pos, limit)
+                end = limit if match is None else match.start()
+                if end > pos:
+                    out.append(_to_text(data[pos:end], self._html))
+                if match is None:
+                    return limit
+                pos = match.end()
+                self._body_tag(match.group(1) == "/", match.group(2).lower(), out)
+            elif state == _OUTSIDE:
+                match = _STRUCT_RE.search(data, pos, limit)
+                if match is None:
+                    return limit
+                pos = match.end()
+                name = match.group(2).lower()
+                if match.group(1) != "/" and name in ("document", "sec-header", "ims-header"):
+                    self._body_tag(False, name, out)
+            elif state == _DOCHEAD:
+                match = _TEXT_OPEN_RE.search(data, pos, limit)
+                end = limit if match is None else match.start()
+                if sum(map(len, self._header)) < _MAX_CARRY:
+                    self._header.append(data[pos:end])
+                if match is None:
+                    return limit
+                pos = match.end()
+                found = _TYPE_RE.search("".join(self._header))
+                self._header = []
+                doc_type = found.group(1).upper() if found else None
+                if self._types is not None and doc_type not in self._types:
+                    self._skip("text", _OUTSIDE)
+                else:
+                    self._state = _BODY
+                    self._html = None
+            elif state == _SKIP:
+                assert self._skip_re is not None
+                match = self._skip_re.search(data, pos, limit)
+                if match is None:
+                    return limit
+                pos = match.end()
+                self._state = self._after_skip
+            else:
+                match = _TABLE_TAG_RE.search(data, pos, limit)
+                end = limit if match is None else match.end()
+                self._add_table(data[pos:end])
+                if match is None:
+                    return limit
+                pos = end
+                self._table_depth += -1 if match.group(1) == "/" else 1
+                if self._table_depth == 0:
+                    self._flush_table(out)
+                    self._state = _BODY
+        return limit
+
+    def _body_tag(self, closing: bool, name: str, out: List[str]) -> None:
+        if closing:
+            if name == "text":
+                out.append("\n\n")
+                self._state = _OUTSIDE
+            return
+        if name == "table":
+            self._state = _TABLE
+            self._table_depth = 1
+        elif name in ("script", "style", "head", "ix:header"):
+            self._skip(name, _BODY)
+        elif name in ("sec-header", "ims-header"):
+            self._skip(name, _OUTSIDE)
+        elif name == "sec-document":
+            self._state = _OUTSIDE
+        elif name == "document":
+            self._state = _DOCHEAD
+
+    def _add_table(self, piece: str) -> None:
+        if self._table_overflow:
+            return
+        self._table_size += len(piece)
+        if self._table_size > self._max_table:
+            self._table_overflow = True
+            self._table = []
+        else:
+            self._table.append(piece)
+
+    def _flush_table(self, out: List[str]) -> None:
+        if not self._table_overflow:
+            text = _to_text("".join(self._table), bool(self._html))
+            words = len(_WORD_RE.findall(text))
+            numeric = len(_NUMERIC_WORD_RE.findall(text))
+            if words and numeric <= self._table_ratio * words:
+                out.append(f"\n{text}\n")
+        self._table = []
+        self._table_size = 0
+        self._table_overflow = False
+
+    # -- output --------------------------------------------------------
+
+    def _emit(self, out: List[str], final: bool) -> str:
+        text = _normalize(self._tail + "".join(out))
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        if final:
+            self._tail = ""
+            text = text.rstrip()
+            return text + "\n" if text else ""
+        # Hold back trailing whitespace and any partial word so that every
+        # yielded chunk ends on a word boundary.
+        if text and text[-1] in " \n":
+            cut = len(text.rstrip(" \n"))
+        else:
+            cut = max(text.rfind(" "), text.rfind("\n")) + 1
+            if len(text) - cut > _MAX_CARRY:
+                cut = len(text)
+        self._tail = text[cut:]
+        return text[:cut]
+
+
+def _read_chunks(source: FilingSource, chunk_size: int, encoding: str) -> Iterator[str]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding=encoding, errors="replace") as fh:
+            yield from iter(lambda: fh.read(chunk_size), "")
+    elif hasattr(source, "read"):
+        read: Callable[[int], str] = source.read  # type: ignore[union-attr]
+        yield from iter(lambda: read(chunk_size), "")
+    else:
+        yield from source
+
+
+def iter_filing_text(
+    source: FilingSource,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+    document_types: Optional[Iterable[str]] = None,
+    table_numeric_ratio: float = DEFAULT_TABLE_NUMERIC_RATIO,
+    max_table_chars: int = DEFAULT_MAX_TABLE_CHARS,
+) -> Iterator[str]:
+    """
+    Yield the plain text of an EDGAR filing chunk by chunk.
+
+    ``source`` is a path (``.htm`` or full ``.txt`` submission), a text file
+    object or an iterable of string chunks; pass ``[html_string]`` for text
+    already in memory.  Undecodable bytes are replaced.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if not 0.0 <= table_numeric_ratio <= 1.0:
+        raise ValueError("table_numeric_ratio must be in [0, 1]")
+    types = None if document_types is None else frozenset(t.upper() for t in document_types)
+    extractor = _Extractor(types, table_numeric_ratio, max_table_chars)
+    for chunk in _read_chunks(source, chunk_size, encoding):
+        text = extractor.feed(chunk)
+        if text:
+            yield text
+    text = extractor.close()
+    if text:
+        yield text
+
+
+def extract_filing_text(source: FilingSource, **kwargs: object) -> str:
+    """``iter_filing_text`` joined into one string."""
+    return "".join(iter_filing_text(source, **kwargs))  # type: ignore[arg-type]
+
+
+def filing_text_features(source: FilingSource, **kwargs: object) -> Dict[str, float]:
+    """``compute_textual_features`` of a filing, scanned while it streams."""
+    tokens = positive = negative = 0
+    for text in iter_filing_text(source, **kwargs):  # type: ignore[arg-type]
+        n, pos, neg = _count_text(text)
+        tokens += n
+        positive += pos
+        negative += neg
+    return {"f_text": _f_text_from_counts(tokens, positive, negative)}
@@ -11,12 +11,45 @@ from typing import Dict
 
 from ..entities import IpoInput
 
+# Net margin / growth (in percent) at which the respective risk reaches 0.
+DEFAULT_NET_MARGIN_FULL = 20.0
+DEFAULT_GROWTH_FULL = 50.0
 
-def compute_financial_features(ipo: IpoInput) -> Dict[str, float]:
+
+def _financial_feature(
+    net_margin: float,
+    growth: float,
+    *,
+    net_margin_full: float = DEFAULT_NET_MARGIN_FULL,
+    growth_full: float = DEFAULT_GROWTH_FULL,
+) -> float:
+    """Scalar kernel behind ``compute_financial_features`` (see its mapping)."""
+    if net_margin <= 0.0:
+        risk_net = 1.0
+    elif net_margin >= net_margin_full:
+        risk_net = 0.0
+    else:
+        risk_net = 1.0 - (net_margin / net_margin_full)
+    if growth <= 0.0:
+        risk_growth = 1.0
+    elif growth >= growth_full:
+        risk_growth = 0.0
+    else:
+        risk_growth = 1.0 - (growth / growth_full)
+    f_fin = (risk_net + risk_growth) / 2.0
+    return max(0.0, min(f_fin, 1.0))
+
+
+def compute_financial_features(
+    ipo: IpoInput,
+    *,
+    net_margin_full: float = DEFAULT_NET_MARGIN_FULL,
+    growth_full: float = DEFAULT_GROWTH_FULL,
+) -> Dict[str, float]:
     """
     Compute a combined financial risk feature f_fin in [0, 1].
 
-    Mapping (heuristic):
+    Mapping (heuristic; the 20% and 50% ramps are configurable):
       - Net margin <= 0%  => risk_net = 1.0
       - Net margin >= 20% => risk_net = 0.0
       - Linear in between.
@@ -26,20 +59,10 @@ def compute_financial_features(ipo: IpoInput) -> Dict[str, float]:
 
     f_fin is the average of risk_net and risk_growth.
     """
-    net_margin = ipo.financials.net_margin
-    growth = ipo.financials.growth_yoy
-    if net_margin <= 0.0:
-        risk_net = 1.0
-    elif net_margin >= 20.0:
-        risk_net = 0.0
-    else:
-        risk_net = 1.0 - (net_margin / 20.0)
-    if growth <= 0.0:
-        risk_growth = 1.0
-    elif growth >= 50.0:
-        risk_growth = 0.0
-    else:
-        risk_growth = 1.0 - (growth / 50.0)
-    f_fin = (risk_net + risk_growth) / 2.0
-    f_fin = max(0.0, min(f_fin, 1.0))
+    f_fin = _financial_feature(
+        ipo.financials.net_margin,
+        ipo.financials.growth_yoy,
+        net_margin_full=net_margin_full,
+        growth_full=growth_full,
+    )
     return {"f_fin": f_fin}
@@ -3,6 +3,17 @@ from typing import Dict
 from ..entities import IpoInput
 
 
+def _underwriter_feature(underwriter_tier: int) -> float:
+    """Underwriter risk: tier in [1, 5] (1 = best, 5 = weakest) mapped onto [0, 1]."""
+    f_uw_raw = (underwriter_tier - 1) / 4.0
+    return max(0.0, min(f_uw_raw, 1.0))
+
+
+def _auditor_feature(auditor_is_big4: bool) -> float:
+    """Auditor risk: 0 for Big4, 1 otherwise."""
+    return 0.0 if auditor_is_big4 else 1.0
+
+
 def compute_quality_features(ipo: IpoInput) -> Dict[str, float]:
     """
     Compute features related to deal and reporting quality:
@@ -10,13 +21,7 @@ def compute_quality_features(ipo: IpoInput) -> Dict[str, float]:
         - f_uw:  underwriter quality (higher => more risk)
         - f_aud: auditor quality (1 if non-Big4, 0 if Big4)
     """
-    # underwriter_tier is expected in [1, 5] where 1 = best, 5 = weakest.
-    f_uw_raw = (ipo.underwriter_tier - 1) / 4.0
-    f_uw = max(0.0, min(f_uw_raw, 1.0))
-
-    f_aud = 0.0 if ipo.auditor_is_big4 else 1.0
-
     return {
-        "f_uw": f_uw,
-        "f_aud": f_aud,
+        "f_uw": _underwriter_feature(ipo.underwriter_tier),
+        "f_aud": _auditor_feature(ipo.auditor_is_big4),
     }
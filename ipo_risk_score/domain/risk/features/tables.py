@@ -0,0 +1,215 @@
+"""
+Lookup tables for the bounded categorical features.
+
+``f_uw``, ``f_aud`` and ``f_geo`` depend only on four small categorical
+inputs (5 x 2 x 3 x 3 = 90 combinations) and ``f_lock`` only on the capped
+lock-up length (181 values for the default 180-day cap).  ``FeatureTables``
+precomputes them for one ``FeatureConfig``, plus the combined partial logit
+of the categorical features under a coefficient set, so a scorer indexes
+arrays instead of evaluating the feature functions and building dicts.
+
+``TableScorer`` is the table-driven scoring path built on them.
+"""
+
+from array import array
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from ..entities import IpoInput
+from ..logistic import COEFFS_V1, _logistic
+from ..validators import validate_ipo_input
+from .builder import _reject_text_engine_weights
+from .config import DEFAULT_FEATURE_CONFIG, FeatureConfig, _compile_continuous_features
+from .context import _geo_feature
+from .liquidity import _lockup_feature
+from .quality import _auditor_feature, _underwriter_feature
+from .textual import _text_feature
+
+# Valid values of (underwriter_tier, auditor_is_big4, sector_cyclicality, region_risk_tier).
+UNDERWRITER_TIERS = (1, 2, 3, 4, 5)
+SECTOR_CYCLICALITY = (0, 1, 2)
+REGION_RISK_TIERS = (0, 1, 2)
+N_CATEGORIES = len(UNDERWRITER_TIERS) * 2 * len(SECTOR_CYCLICALITY) * len(REGION_RISK_TIERS)
+
+
+def category_index(
+    underwriter_tier: int, auditor_is_big4: bool, sector_cyclicality: int, region_risk_tier: int
+) -> int:
+    """Dense index in ``[0, N_CATEGORIES)`` of a validated categorical combination."""
+    return (
+        ((underwriter_tier - 1) * 2 + (1 if auditor_is_big4 else 0)) * 3 + sector_cyclicality
+    ) * 3 + region_risk_tier
+
+
+def _is_tabulated(underwriter_tier: int, sector_cyclicality: int, region_risk_tier: int) -> bool:
+    # Validation admits e.g. a fractional underwriter tier; those rows are
+    # computed directly instead of indexed.
+    return (
+        type(underwriter_tier) is int
+        and type(sector_cyclicality) is int
+        and type(region_risk_tier) is int
+    )
+
+
+class FeatureTables:
+    """
+    Precomputed categorical and lock-up features for one ``FeatureConfig``.
+
+    ``categorical[category_index(...)]`` is ``(f_uw, f_aud, f_geo)``;
+    ``lockup[d]`` is ``f_lock`` for ``d`` days (``d`` capped at
+    ``lockup_max_days``) and ``lockup_term[d]`` its weighted share of
+    ``f_liq_total``.
+    """
+
+    __slots__ = ("config", "categorical", "lockup", "lockup_term", "lockup_cap")
+
+    def __init__(self, config: FeatureConfig = DEFAULT_FEATURE_CONFIG) -> None:
+        self.config = config
+        categorical = [(0.0, 0.0, 0.0)] * N_CATEGORIES
+        for uw in UNDERWRITER_TIERS:
+            for big4 in (False, True):
+                for cyc in SECTOR_CYCLICALITY:
+                    for region in REGION_RISK_TIERS:
+                        categorical[category_index(uw, big4, cyc, region)] = (
+                            _underwriter_feature(uw),
+                            _auditor_feature(big4),
+                            _geo_feature(cyc, region),
+                        )
+        self.categorical: Tuple[Tuple[float, float, float], ...] = tuple(categorical)
+
+        self.lockup_cap = max(int(config.lockup_max_days), 0)
+        lock_max = config.lockup_max_days
+        self.lockup = array(
+            "d", (_lockup_feature(d, lockup_max_days=lock_max) for d in range(self.lockup_cap + 1))
+        )
+        self.lockup_term = array("d", (config.weight_lockup * f for f in self.lockup))
+
+    def lockup_feature(self, lockup_days: int) -> float:
+        if type(lockup_days) is int:
+            return self.lockup[min(max(lockup_days, 0), self.lockup_cap)]
+        return _lockup_feature(lockup_days, lockup_max_days=self.config.lockup_max_days)
+
+    def categorical_features(
+        self,
+        underwriter_tier: int,
+        auditor_is_big4: bool,
+        sector_cyclicality: int,
+        region_risk_tier: int,
+    ) -> Tuple[float, float, float]:
+        if _is_tabulated(underwriter_tier, sector_cyclicality, region_risk_tier):
+            return self.categorical[
+                category_index(
+                    underwriter_tier, auditor_is_big4, sector_cyclicality, region_risk_tier
+                )
+            ]
+        return (
+            _underwriter_feature(underwriter_tier),
+            _auditor_feature(auditor_is_big4),
+            _geo_feature(sector_cyclicality, region_risk_tier),
+        )
+
+    def partial_logit(self, coeffs: Mapping[str, float]) -> array:
+        """``w_uw * f_uw + w_aud * f_aud + w_geo * f_geo`` per categorical combination."""
+        w_uw = float(coeffs.get("f_uw", 0.0))
+        w_aud = float(coeffs.get("f_aud", 0.0))
+        w_geo = float(coeffs.get("f_geo", 0.0))
+        return array("d", (w_uw * u + w_aud * a + w_geo * g for u, a, g in self.categorical))
+
+
+def _compile_table_logit(
+    tables: FeatureTables, coeffs: Mapping[str, float]
+) -> Callable[[IpoInput, Optional[str]], float]:
+    """Closure computing the logit of one deal; constants are bound as locals."""
+    _reject_text_engine_weights(coeffs, "TableScorer")
+    continuous_features = _compile_continuous_features(
+        tables.config, tables.lockup, tables.lockup_term
+    )
+
+    intercept = float(coeffs.get("intercept", 0.0))
+    c_liq = float(coeffs.get("f_liq", 0.0))
+    c_lock = float(coeffs.get("f_lock", 0.0))
+    c_liq_total = float(coeffs.get("f_liq_total", 0.0))
+    c_val = float(coeffs.get("f_val", 0.0))
+    c_uw = float(coeffs.get("f_uw", 0.0))
+    c_aud = float(coeffs.get("f_aud", 0.0))
+    c_geo = float(coeffs.get("f_geo", 0.0))
+    c_fin = float(coeffs.get("f_fin", 0.0))
+    c_text = float(coeffs.get("f_text", 0.0))
+    category_logit = tables.partial_logit(coeffs)
+
+    def logit(ipo: IpoInput, prospectus_text: Optional[str]) -> float:
+        f_liq, f_lock, f_liq_total, f_val, f_fin = continuous_features(ipo)
+
+        # Categorical features: one indexed partial logit.
+        uw, big4 = ipo.underwriter_tier, ipo.auditor_is_big4
+        cyc, region = ipo.sector_cyclicality, ipo.region_risk_tier
+        if _is_tabulated(uw, cyc, region):
+            cat = category_logit[category_index(uw, big4, cyc, region)]
+        else:
+            f_uw, f_aud, f_geo = tables.categorical_features(uw, big4, cyc, region)
+            cat = c_uw * f_uw + c_aud * f_aud + c_geo * f_geo
+
+        return (
+            intercept
+            + c_liq * f_liq
+            + c_lock * f_lock
+            + c_liq_total * f_liq_total
+            + c_val * f_val
+            + cat
+            + c_fin * f_fin
+            + c_text * _text_feature(prospectus_text)
+        )
+
+    return logit
+
+
+class TableScorer:
+    """
+    Table-driven scorer for one coefficient set and feature configuration.
+
+    The categorical features collapse into one indexed partial logit and an
+    integer lock-up indexes ``lockup``/``lockup_term``; the other continuous
+    features (liquidity, valuation, financials) come from the compiled
+    routine the feature pipeline uses, with no intermediate dicts.  Scores
+    equal ``compute_ipo_risk`` up to floating-point reassociation of the
+    logit sum (below 1e-12 points).
+
+    Examples
+    --------
+    >>> scorer = TableScorer(COEFFS_V1)
+    >>> scorer.score(ipo)
+    """
+
+    __slots__ = ("coeffs", "tables", "_logit")
+
+    def __init__(
+        self,
+        coeffs: Optional[Mapping[str, float]] = None,
+        config: FeatureConfig = DEFAULT_FEATURE_CONFIG,
+    ) -> None:
+        coeffs_to_use = coeffs if coeffs is not None else COEFFS_V1
+        self.coeffs: Dict[str, float] = {k: float(v) for k, v in coeffs_to_use.items()}
+        self.tables = FeatureTables(config)
+        self._logit = _compile_table_logit(self.tables, self.coeffs)
+
+    def logit(self, ipo: IpoInput, prospectus_text: Optional[str] = None) -> float:
+        return self._logit(ipo, prospectus_text)
+
+    def score(
+        self, ipo: IpoInput, prospectus_text: Optional[str] = None, *, validate: bool = True
+    ) -> float:
+        """Risk score in [0, 100]; ``prospectus_text`` as in ``compute_ipo_risk``."""
+        if validate:
+            validate_ipo_input(ipo)
+        text = prospectus_text if prospectus_text is not None else ipo.prospectus_text
+        return 100.0 * _logistic(self._logit(ipo, text))
+
+    def score_many(self, ipos: Iterable[IpoInput], *, validate: bool = True) -> array:
+        """Scores of ``ipos`` (each with its own ``prospectus_text``) as ``array("d")``."""
+        logit = self._logit
+        scores = array("d")
+        append = scores.append
+        for ipo in ipos:
+            if validate:
+                validate_ipo_input(ipo)
+            append(100.0 * _logistic(logit(ipo, ipo.prospectus_text)))
+        return scores
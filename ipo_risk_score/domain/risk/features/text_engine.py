@@ -0,0 +1,305 @@
+"""
+Section-aware, negation-aware text features.
+
+``f_text`` counts eight positive and eight negative words over the whole
+text with equal weight, so boilerplate such as the "Risk Factors" heading
+moves it as much as substantive language.  ``TextFeatureEngine`` scores a
+prospectus in one streaming pass over its lines:
+
+* **Sections.**  Top-level heading lines switch the current section (Risk
+  Factors, MD&A, Use of Proceeds, or another known S-1 section, scored as
+  other).  Other short upper-case lines are subheadings ("RISKS RELATED TO
+  OUR BUSINESS") and keep the current section.  Headings themselves are not
+  scored, and each section is scored separately.
+* **Lexicon weights.**  Every term carries a signed weight (positive means
+  more risk).  ``with_idf`` rescales the weights by inverse document
+  frequency over a corpus, so terms found in every filing count for less.
+* **Negation.**  A lexicon term within ``negation_window`` words after a
+  negator ("no", "not", "without", ...) in the same sentence has its sign
+  flipped, so "no significant decline" reads as reassuring.
+
+Each section yields ``0.5 + scale * (weighted score / words)``, clamped to
+[0, 1] like ``f_text``, with 0.5 for empty or absent sections.  The
+features are named in ``TEXT_ENGINE_KEYS`` and are added to the feature
+vector when a ``text_engine`` is passed to ``build_feature_vector`` /
+``compute_ipo_risk``.
+
+Input can be a string or an iterable of chunks (e.g. file reads); only the
+current partial line is buffered, so memory does not grow with the filing.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from .builder import TEXT_ENGINE_KEYS
+from .textual import NEGATIVE_WORDS, POSITIVE_WORDS
+
+SECTION_RISK_FACTORS = "risk_factors"
+SECTION_MDNA = "mdna"
+SECTION_PROCEEDS = "use_of_proceeds"
+SECTION_OTHER = "other"
+SECTIONS: Tuple[str, ...] = (SECTION_RISK_FACTORS, SECTION_MDNA, SECTION_PROCEEDS, SECTION_OTHER)
+
+_SECTION_KEYS = {
+    SECTION_RISK_FACTORS: "f_text_risk_factors",
+    SECTION_MDNA: "f_text_mdna",
+    SECTION_PROCEEDS: "f_text_proceeds",
+}
+
+# Signed weights: > 0 raises risk, < 0 lowers it.  The base lists of
+# ``textual.py`` keep unit weight except "risk", which is mostly boilerplate.
+DEFAULT_LEXICON: Mapping[str, float] = MappingProxyType(
+    {
+        **{word: 1.0 for word in NEGATIVE_WORDS},
+        **{word: -1.0 for word in POSITIVE_WORDS},
+        "risk": 0.5,
+        "litigation": 1.0,
+        "impairment": 1.0,
+        "default": 1.0,
+        "restatement": 1.0,
+        "weakness": 1.0,
+        "dilution": 0.5,
+        "fraud": 1.5,
+        "bankruptcy": 1.5,
+        "profitable": -1.0,
+        "growing": -0.5,
+    }
+)
+DEFAULT_NEGATORS: FrozenSet[str] = frozenset(
+    {"no", "not", "never", "without", "none", "nor", "neither", "cannot", "hardly"}
+)
+DEFAULT_NEGATION_WINDOW = 3
+
+# Words and sentence breaks; a break ends any negation scope.
+_TOKEN_RE = re.compile(r"\w+|[.;!?]")
+_BREAKS = frozenset(".;!?")
+_MAX_HEADING_LENGTH = 100
+_HEADING_RE = re.compile(
+    r"^(?:item\s+\d+[a-z]?\.?\s*)?"
+    r"(?P<name>risk\s+factors"
+    r"|management[’']?s\s+discussion\s+and\s+analysis\b.*"
+    r"|use\s+of\s+proceeds)"
+    r"\s*[.:]?$",
+    re.IGNORECASE,
+)
+# Other top-level S-1 sections; their headings close the current section.
+_OTHER_HEADING_RE = re.compile(
+    r"^(?:item\s+\d+[a-z]?\.?\s*)?"
+    r"(?:prospectus\s+summary|summary|the\s+offering|dividend\s+policy|capitalization"
+    r"|dilution|selected\s+(?:consolidated\s+)?financial\s+data|business|management"
+    r"|executive\s+compensation|certain\s+relationships\s+and\s+related\s+party\s+transactions"
+    r"|principal\s+(?:and\s+selling\s+)?(?:stockholders|shareholders)"
+    r"|description\s+of\s+capital\s+stock|shares\s+eligible\s+for\s+future\s+sale"
+    r"|underwriting|legal\s+matters|experts|where\s+you\s+can\s+find\s+more\s+information"
+    r"|index\s+to\s+(?:consolidated\s+)?financial\s+statements)"
+    r"\s*[.:]?$",
+    re.IGNORECASE,
+)
+# Returned by ``_heading_section`` for a subheading: not scored, section kept.
+_SUBHEADING = ""
+
+
+def _heading_section(line: str) -> Optional[str]:
+    """
+    Section started by a heading line, ``_SUBHEADING`` for a subheading
+    within the current section, else None (body text).
+    """
+    stripped = line.strip()
+    if not stripped or len(stripped) > _MAX_HEADING_LENGTH:
+        return None
+    match = _HEADING_RE.match(stripped)
+    if match is not None:
+        name = match.group("name").lower()
+        if name.startswith("risk"):
+            return SECTION_RISK_FACTORS
+        if name.startswith("use"):
+            return SECTION_PROCEEDS
+        return SECTION_MDNA
+    if _OTHER_HEADING_RE.match(stripped) is not None:
+        return SECTION_OTHER
+    # Any other short upper-case line without sentence punctuation is a
+    # subheading ("RISKS RELATED TO OUR BUSINESS"); it stays in its section.
+    if stripped.isupper() and stripped[-1] not in ".;!?," and len(stripped.split()) <= 8:
+        return _SUBHEADING
+    return None
+
+
+@dataclass
+class SectionStats:
+    words: int = 0
+    score: float = 0.0
+    hits: int = 0
+    negated: int = 0
+
+
+@dataclass
+class TextScan:
+    """Per-section accumulators of one scanned document."""
+
+    sections: Dict[str, SectionStats] = field(
+        default_factory=lambda: {name: SectionStats() for name in SECTIONS}
+    )
+
+    def total(self) -> SectionStats:
+        out = SectionStats()
+        for stats in self.sections.values():
+            out.words += stats.words
+            out.score += stats.score
+            out.hits += stats.hits
+            out.negated += stats.negated
+        return out
+
+
+def _iter_lines(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Lines of a string or of a stream of chunks, buffering one partial line."""
+    chunks = (source,) if isinstance(source, str) else source
+    carry = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        start = 0
+        end = chunk.find("\n")
+        while end != -1:
+            yield carry + chunk[start:end] if carry else chunk[start:end]
+            carry = ""
+            start = end + 1
+            end = chunk.find("\n", start)
+        carry += chunk[start:]
+    if carry:
+        yield carry
+
+
+class TextFeatureEngine:
+    """
+    Streaming text-feature scorer.
+
+    Examples
+    --------
+    >>> engine = TextFeatureEngine()
+    >>> engine.features("RISK FACTORS\\nWe expect no significant decline in demand.")
+    >>> with open("s1.txt") as fh:
+    ...     engine.features(iter(lambda: fh.read(1 << 16), ""))
+    >>> compute_ipo_risk(ipo, text_engine=engine)   # adds TEXT_ENGINE_KEYS features
+    """
+
+    def __init__(
+        self,
+        lexicon: Optional[Mapping[str, float]] = None,
+        *,
+        negators: Iterable[str] = DEFAULT_NEGATORS,
+        negation_window: int = DEFAULT_NEGATION_WINDOW,
+        scale: float = 1.0,
+    ) -> None:
+        if negation_window < 0:
+            raise ValueError("negation_window must be >= 0")
+        if not math.isfinite(scale) or scale <= 0:
+            raise ValueError("scale must be a positive finite number")
+        weights = dict(DEFAULT_LEXICON if lexicon is None else lexicon)
+        for term, weight in weights.items():
+            if not math.isfinite(weight):
+                raise ValueError(f"lexicon weight for {term!r} must be finite")
+        self.lexicon: Dict[str, float] = {term.lower(): float(w) for term, w in weights.items()}
+        self.negators: FrozenSet[str] = frozenset(n.lower() for n in negators)
+        self.negation_window = negation_window
+        self.scale = scale
+        self._lexicon_keys = frozenset(self.lexicon)
+
+    @classmethod
+    def with_idf(
+        cls,
+        documents: Iterable[Union[str, Iterable[str]]],
+        lexicon: Optional[Mapping[str, float]] = None,
+        **kwargs: object,
+    ) -> "TextFeatureEngine":
+        """
+        Rescale lexicon weights by smoothed inverse document frequency
+        ``log((1 + N) / (1 + df)) + 1`` over ``documents``, normalised so the
+        mean absolute weight is unchanged.
+        """
+        base = dict(DEFAULT_LEXICON if lexicon is None else lexicon)
+        terms = frozenset(t.lower() for t in base)
+        df: Dict[str, int] = dict.fromkeys(terms, 0)
+        n_docs = 0
+        for document in documents:
+            n_docs += 1
+            seen = set()
+            for line in _iter_lines(document):
+                seen.update(terms.intersection(_TOKEN_RE.findall(line.lower())))
+            for term in seen:
+                df[term] += 1
+        idf = {t: math.log((1 + n_docs) / (1 + df[t])) + 1.0 for t in terms}
+        raw = {t: w * idf[t.lower()] for t, w in base.items()}
+        before = sum(abs(w) for w in base.values())
+        after = sum(abs(w) for w in raw.values())
+        norm = before / after if after else 1.0
+        return cls({t: w * norm for t, w in raw.items()}, **kwargs)  # type: ignore[arg-type]
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def scan(self, source: Union[str, Iterable[str]]) -> TextScan:
+        """One pass over ``source`` (string or iterable of chunks)."""
+        result = TextScan()
+        sections = result.sections
+        stats = sections[SECTION_OTHER]
+        lexicon = self.lexicon
+        lexicon_keys = self._lexicon_keys
+        negators = self.negators
+        window = self.negation_window
+        breaks = _BREAKS
+        findall = _TOKEN_RE.findall
+        countdown = 0
+
+        for line in _iter_lines(source):
+            if len(line) <= _MAX_HEADING_LENGTH:
+                section = _heading_section(line)
+                if section is not None:
+                    if section != _SUBHEADING:
+                        stats = sections[section]
+                    countdown = 0
+                    continue
+            tokens = findall(line.lower())
+            if not tokens:
+                continue
+            if countdown == 0 and lexicon_keys.isdisjoint(tokens) and negators.isdisjoint(tokens):
+                # No lexicon term and no negation scope: count words only.
+                stats.words += len(tokens) - sum(map(breaks.__contains__, tokens))
+                continue
+            for token in tokens:
+                if token in breaks:
+                    countdown = 0
+                    continue
+                stats.words += 1
+                weight = lexicon.get(token)
+                if weight is not None:
+                    if countdown:
+                        weight = -weight
+                        stats.negated += 1
+                    stats.score += weight
+                    stats.hits += 1
+                if token in negators:
+                    countdown = window
+                elif countdown:
+                    countdown -= 1
+        return result
+
+    def _bounded(self, stats: SectionStats) -> float:
+        if not stats.words:
+            return 0.5
+        return max(0.0, min(1.0, 0.5 + self.scale * stats.score / stats.words))
+
+    def features_from_scan(self, scan: TextScan) -> Dict[str, float]:
+        out = {"f_text_weighted": self._bounded(scan.total())}
+        for section, key in _SECTION_KEYS.items():
+            out[key] = self._bounded(scan.sections[section])
+        return out
+
+    def features(self, source: Union[str, Iterable[str], None]) -> Dict[str, float]:
+        """``TEXT_ENGINE_KEYS`` features in [0, 1]; neutral 0.5 without text."""
+        if source is None:
+            return dict.fromkeys(TEXT_ENGINE_KEYS, 0.5)
+        return self.features_from_scan(self.scan(source))
@@ -5,41 +5,61 @@ Un valor alto implica mayor riesgo percibido.
 """
 
 import re
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 
 from ..entities import IpoInput
 
-POSITIVE_WORDS = {
-    "growth",
-    "profit",
-    "strong",
-    "expansion",
-    "opportunity",
-    "increase",
-    "robust",
-    "competitive",
-}
-NEGATIVE_WORDS = {
-    "decline",
-    "loss",
-    "weak",
-    "risk",
-    "competition",
-    "decrease",
-    "uncertain",
-    "volatile",
-}
+POSITIVE_WORDS: FrozenSet[str] = frozenset(
+    {
+        "growth",
+        "profit",
+        "strong",
+        "expansion",
+        "opportunity",
+        "increase",
+        "robust",
+        "competitive",
+    }
+)
+NEGATIVE_WORDS: FrozenSet[str] = frozenset(
+    {
+        "decline",
+        "loss",
+        "weak",
+        "risk",
+        "competition",
+        "decrease",
+        "uncertain",
+        "volatile",
+    }
+)
 
 
-def compute_textual_features(ipo: IpoInput, prospectus_text: Optional[str]) -> Dict[str, float]:
-    if not prospectus_text:
-        return {"f_text": 0.5}
-    tokens = re.findall(r"\b\w+\b", prospectus_text.lower())
-    if not tokens:
-        return {"f_text": 0.5}
-    pos_count = sum(1 for t in tokens if t in POSITIVE_WORDS)
-    neg_count = sum(1 for t in tokens if t in NEGATIVE_WORDS)
-    sentiment = (neg_count - pos_count) / float(len(tokens))
+# Maximal runs of word characters (equivalent to r"\b\w+\b" under findall).
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _count_text(text: str) -> Tuple[int, int, int]:
+    """``(tokens, positive, negative)`` counts of ``text``."""
+    tokens = _TOKEN_RE.findall(text.lower())
+    pos_count = sum(map(POSITIVE_WORDS.__contains__, tokens))
+    neg_count = sum(map(NEGATIVE_WORDS.__contains__, tokens))
+    return len(tokens), pos_count, neg_count
+
+
+def _f_text_from_counts(n_tokens: int, pos_count: int, neg_count: int) -> float:
+    if not n_tokens:
+        return 0.5
+    sentiment = (neg_count - pos_count) / float(n_tokens)
     f_text = 0.5 + sentiment
-    f_text = max(0.0, min(1.0, f_text))
-    return {"f_text": f_text}
+    return max(0.0, min(1.0, f_text))
+
+
+def _text_feature(prospectus_text: Optional[str]) -> float:
+    if not prospectus_text:
+        return 0.5
+    return _f_text_from_counts(*_count_text(prospectus_text))
+
+
+def compute_textual_features(ipo: IpoInput, prospectus_text: Optional[str]) -> Dict[str, float]:
+    return {"f_text": _text_feature(prospectus_text)}
@@ -1,13 +1,32 @@
+from typing import Optional
+
 from ..entities import IpoInput
 
+# Default breakpoints of the fallback price-to-sales mapping.
+DEFAULT_PS_LOW = 1.0
+DEFAULT_PS_MID = 2.0
+DEFAULT_PS_HIGH = 4.0
+DEFAULT_VAL_RISK_LOW = 0.1
+DEFAULT_VAL_RISK_MID = 0.5
+
 
-def _valuation_from_ps_multiple(offer_usd: float, revenue_ttm: float) -> float:
+def _valuation_from_ps_multiple(
+    offer_usd: float,
+    revenue_ttm: float,
+    *,
+    ps_low: float = DEFAULT_PS_LOW,
+    ps_mid: float = DEFAULT_PS_MID,
+    ps_high: float = DEFAULT_PS_HIGH,
+    val_risk_low: float = DEFAULT_VAL_RISK_LOW,
+    val_risk_mid: float = DEFAULT_VAL_RISK_MID,
+) -> float:
     """
     Approximate a valuation risk feature using an implicit price-to-sales multiple:
 
         PS_ipo = offer_value / revenue_ttm
 
-    The mapping to [0, 1] is heuristic and should be calibrated with data:
+    The mapping to [0, 1] is heuristic and should be calibrated with data
+    (breakpoints are configurable; defaults shown):
 
         PS <= 1     -> low valuation risk
         PS ~ 2      -> medium valuation risk
@@ -19,18 +38,48 @@ def _valuation_from_ps_multiple(offer_usd: float, revenue_ttm: float) -> float:
 
     ps_ipo = offer_usd / revenue_ttm
 
-    if ps_ipo <= 1.0:
-        return 0.1
-    if ps_ipo <= 2.0:
-        # Interpolate between 0.1 and 0.5.
-        return 0.1 + 0.4 * (ps_ipo - 1.0) / 1.0
-    if ps_ipo <= 4.0:
-        # Interpolate between 0.5 and 1.0.
-        return 0.5 + 0.5 * (ps_ipo - 2.0) / 2.0
+    if ps_ipo <= ps_low:
+        return val_risk_low
+    if ps_ipo <= ps_mid:
+        # Interpolate between the low and medium risk levels.
+        return val_risk_low + (val_risk_mid - val_risk_low) * (ps_ipo - ps_low) / (ps_mid - ps_low)
+    if ps_ipo <= ps_high:
+        # Interpolate between the medium risk level and 1.0.
+        return val_risk_mid + (1.0 - val_risk_mid) * (ps_ipo - ps_mid) / (ps_high - ps_mid)
     return 1.0
 
 
-def compute_valuation_feature(ipo: IpoInput) -> float:
+def _valuation_feature(
+    offer_usd: float,
+    revenue_ttm: float,
+    sector_ps_multiple: Optional[float],
+    **ps_mapping: float,
+) -> float:
+    """
+    Scalar kernel behind ``compute_valuation_feature``.  ``ps_mapping``
+    overrides the fallback breakpoints of ``_valuation_from_ps_multiple``.
+    """
+    # Price-to-sales multiple of the IPO
+    ps_ipo = offer_usd / revenue_ttm if revenue_ttm > 0 else None
+
+    if sector_ps_multiple is not None and sector_ps_multiple > 0 and ps_ipo is not None:
+        premium = (ps_ipo - sector_ps_multiple) / sector_ps_multiple
+        # Clamp premium to [0, 1]; negative premium yields 0 (no risk premium)
+        return max(0.0, min(1.0, premium))
+
+    # Fallback: heuristic based solely on the IPO's own PS multiple
+    return _valuation_from_ps_multiple(offer_usd=offer_usd, revenue_ttm=revenue_ttm, **ps_mapping)
+
+
+def compute_valuation_feature(
+    ipo: IpoInput,
+    *,
+    ps_low: float = DEFAULT_PS_LOW,
+    ps_mid: float = DEFAULT_PS_MID,
+    ps_high: float = DEFAULT_PS_HIGH,
+    val_risk_low: float = DEFAULT_VAL_RISK_LOW,
+    val_risk_mid: float = DEFAULT_VAL_RISK_MID,
+) -> float:
     """
     Compute the valuation feature f_val in [0, 1] for a given IPO.
 
@@ -38,23 +87,19 @@ def compute_valuation_feature(ipo: IpoInput) -> float:
     compute the premium as (PS_ipo - PS_sector) / PS_sector and clamp the
     result into [0, 1], reflecting the relative valuation premium suggested in
     the theoretical model. If no valid sector multiple is provided, fall back
-    to a heuristic mapping based on the price-to-sales ratio alone.
+    to a heuristic mapping based on the price-to-sales ratio alone, whose
+    breakpoints can be overridden.
     """
     offer_mid = (ipo.deal_terms.price_low + ipo.deal_terms.price_high) / 2.0
     offer_usd = offer_mid * ipo.deal_terms.offer_shares
 
-    revenue_ttm = ipo.financials.revenue_ttm
-    # Price-to-sales multiple of the IPO
-    ps_ipo = offer_usd / revenue_ttm if revenue_ttm > 0 else None
-
-    sector_ps = ipo.sector_ps_multiple
-    if sector_ps is not None and sector_ps > 0 and ps_ipo is not None:
-        premium = (ps_ipo - sector_ps) / sector_ps
-        # Clamp premium to [0, 1]; negative premium yields 0 (no risk premium)
-        return max(0.0, min(1.0, premium))
-
-    # Fallback: heuristic based solely on the IPO's own PS multiple
-    return _valuation_from_ps_multiple(
-        offer_usd=offer_usd,
-        revenue_ttm=ipo.financials.revenue_ttm,
+    return _valuation_feature(
+        offer_usd,
+        ipo.financials.revenue_ttm,
+        ipo.sector_ps_multiple,
+        ps_low=ps_low,
+        ps_mid=ps_mid,
+        ps_high=ps_high,
+        val_risk_low=val_risk_low,
+        val_risk_mid=val_risk_mid,
     )
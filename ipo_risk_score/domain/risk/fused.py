@@ -0,0 +1,215 @@
+"""
+Fused single-pass scoring kernel.
+
+``compute_ipo_risk`` composes independent stages: ``validate_ipo_input``
+walks the deal terms, the liquidity and valuation modules each recompute
+the offer value, the builder assembles a dict and
+``risk_score_from_features`` re-validates every feature value.  The fused
+kernel reads each input field once for validation, computes the features
+with the compiled routine of ``features/config.py`` (which derives the
+shared intermediates such as the offer value once), and sums the logit in
+one function with the coefficient set and ``FeatureConfig`` bound as
+closure constants.
+
+Results are bit-identical to the modular path: validation goes through the
+same scalar rule kernels (same errors, same order), the feature arithmetic
+is the same expression sequence, and the logit is summed in feature order.
+The feature range re-check is skipped because every feature is clamped to
+[0, 1] by construction.
+
+``compile_feature_extractor`` is the feature half on its own: validated
+features of a deal as a tuple in ``FEATURE_KEYS`` order, for callers that
+build matrices or apply their own weights.
+"""
+
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .engine import MODEL_VERSION, _build_drivers
+from .entities import IpoInput, RiskResult
+from .features.builder import FEATURE_KEYS, _reject_text_engine_weights
+from .features.config import DEFAULT_FEATURE_CONFIG, FeatureConfig, _compile_continuous_features
+from .features.context import _geo_feature
+from .features.quality import _auditor_feature, _underwriter_feature
+from .features.textual import _text_feature
+from .logistic import COEFFS_V1, FrozenCoeffs, _logistic
+from .validators import (
+    _validate_categorical_values,
+    _validate_deal_values,
+    _validate_financial_values,
+    _validate_identity_values,
+)
+
+# Features in FEATURE_KEYS order.
+FeatureRow = Tuple[float, float, float, float, float, float, float, float, float]
+# (logit, *features in FEATURE_KEYS order)
+KernelOutput = Tuple[float, float, float, float, float, float, float, float, float, float]
+
+
+def compile_feature_extractor(
+    config: Optional[FeatureConfig] = None,
+) -> Callable[[IpoInput, Optional[str], bool], FeatureRow]:
+    """
+    Compile ``extract(ipo, prospectus_text, validate)`` for one configuration.
+
+    ``extract`` returns the features of ``ipo`` in ``FEATURE_KEYS`` order,
+    equal to ``build_feature_vector(ipo, prospectus_text, config=config)``.
+    ``prospectus_text`` is used as given (``None`` scores as no text).  With
+    ``validate`` the deal is first checked like ``validate_ipo_input``.
+    """
+    continuous_features = _compile_continuous_features(
+        config if config is not None else DEFAULT_FEATURE_CONFIG
+    )
+
+    def extract(ipo: IpoInput, prospectus_text: Optional[str], validate: bool) -> FeatureRow:
+        uw_tier = ipo.underwriter_tier
+        big4 = ipo.auditor_is_big4
+        cyclicality = ipo.sector_cyclicality
+        region = ipo.region_risk_tier
+
+        if validate:
+            deal = ipo.deal_terms
+            fin = ipo.financials
+            _validate_identity_values(ipo.ticker, ipo.company_name, ipo.country, ipo.sector)
+            _validate_deal_values(
+                deal.price_low,
+                deal.price_high,
+                deal.offer_shares,
+                deal.free_float_pct,
+                deal.lockup_days,
+            )
+            _validate_financial_values(
+                fin.revenue_ttm, fin.gross_margin, fin.net_margin, fin.growth_yoy
+            )
+            _validate_categorical_values(uw_tier, cyclicality, region, ipo.sector_ps_multiple)
+
+        f_liq, f_lock, f_liq_total, f_val, f_fin = continuous_features(ipo)
+        return (
+            f_liq,
+            f_lock,
+            f_liq_total,
+            f_val,
+            _underwriter_feature(uw_tier),
+            _auditor_feature(big4),
+            _geo_feature(cyclicality, region),
+            f_fin,
+            _text_feature(prospectus_text),
+        )
+
+    return extract
+
+
+def compile_scoring_kernel(
+    coeffs: Mapping[str, float], config: Optional[FeatureConfig] = None
+) -> Callable[[IpoInput, Optional[str], bool], KernelOutput]:
+    """
+    Compile ``kernel(ipo, prospectus_text, validate)`` for one coefficient set.
+
+    ``kernel`` returns ``(logit, *features)`` with the features as from
+    ``compile_feature_extractor``.  Raises ``ValueError`` when ``coeffs``
+    weights ``TEXT_ENGINE_KEYS``, which the kernel does not compute.
+    """
+    _reject_text_engine_weights(coeffs, "The fused kernel")
+    extract = compile_feature_extractor(config)
+    # Absent coefficients contribute 0.0 * feature, which leaves the sum
+    # unchanged, so the running sum matches ``risk_score_from_features``.
+    intercept = float(coeffs.get("intercept", 0.0))
+    c_liq, c_lock, c_liq_total, c_val, c_uw, c_aud, c_geo, c_fin, c_text = (
+        float(coeffs.get(name, 0.0)) for name in FEATURE_KEYS
+    )
+
+    def kernel(ipo: IpoInput, prospectus_text: Optional[str], validate: bool) -> KernelOutput:
+        values = extract(ipo, prospectus_text, validate)
+        f_liq, f_lock, f_liq_total, f_val, f_uw, f_aud, f_geo, f_fin, f_text = values
+        z = intercept
+        z += c_liq * f_liq
+        z += c_lock * f_lock
+        z += c_liq_total * f_liq_total
+        z += c_val * f_val
+        z += c_uw * f_uw
+        z += c_aud * f_aud
+        z += c_geo * f_geo
+        z += c_fin * f_fin
+        z += c_text * f_text
+        return (z,) + values
+
+    return kernel
+
+
+class FusedScorer:
+    """
+    ``compute_ipo_risk`` as one compiled kernel for a fixed coefficient set.
+
+    ``score`` returns the risk score only (the fast path); ``result`` builds
+    the full ``RiskResult`` with drivers, equal to ``compute_ipo_risk``.
+
+    A scorer is immutable once compiled (``coeffs`` is a read-only copy and
+    the kernel keeps all per-call state in locals), so one instance can be
+    shared by any number of threads.
+
+    Examples
+    --------
+    >>> scorer = compile_fused_scorer(COEFFS_V1)
+    >>> scorer.score(ipo) == compute_ipo_risk(ipo).risk_score
+    True
+    """
+
+    __slots__ = ("coeffs", "model_version", "config", "_kernel")
+
+    def __init__(
+        self,
+        coeffs: Optional[Mapping[str, float]] = None,
+        *,
+        model_version: Optional[str] = None,
+        config: Optional[FeatureConfig] = None,
+    ) -> None:
+        self.coeffs: Mapping[str, float] = FrozenCoeffs(coeffs if coeffs is not None else COEFFS_V1)
+        self.model_version = model_version if model_version is not None else MODEL_VERSION
+        self.config = config if config is not None else DEFAULT_FEATURE_CONFIG
+        self._kernel = compile_scoring_kernel(self.coeffs, self.config)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The kernel is a closure; a copy (or another process) recompiles it.
+        return _rebuild_fused_scorer, (dict(self.coeffs), self.model_version, self.config)
+
+    def score(
+        self, ipo: IpoInput, prospectus_text: Optional[str] = None, *, validate: bool = True
+    ) -> float:
+        """Risk score in [0, 100]; raises ``ValidationError`` like ``compute_ipo_risk``."""
+        text = prospectus_text if prospectus_text is not None else ipo.prospectus_text
+        return 100.0 * _logistic(self._kernel(ipo, text, validate)[0])
+
+    def result(
+        self,
+        ipo: IpoInput,
+        prospectus_text: Optional[str] = None,
+        *,
+        include_attractiveness: bool = True,
+    ) -> RiskResult:
+        """Full ``RiskResult``, equal to ``compute_ipo_risk`` with the same arguments."""
+        text = prospectus_text if prospectus_text is not None else ipo.prospectus_text
+        z, *values = self._kernel(ipo, text, True)
+        risk = 100.0 * _logistic(z)
+        features = dict(zip(FEATURE_KEYS, values))
+        return RiskResult(
+            risk_score=risk,
+            attractiveness_percent=100.0 - risk if include_attractiveness else None,
+            model_version=self.model_version,
+            drivers=_build_drivers(features, self.coeffs),
+            raw_features=features,
+        )
+
+
+def compile_fused_scorer(
+    coeffs: Optional[Mapping[str, float]] = None,
+    *,
+    model_version: Optional[str] = None,
+    config: Optional[FeatureConfig] = None,
+) -> FusedScorer:
+    """Compile once per coefficient set; reuse the scorer for every deal."""
+    return FusedScorer(coeffs, model_version=model_version, config=config)
+
+
+def _rebuild_fused_scorer(
+    coeffs: Dict[str, float], model_version: str, config: FeatureConfig
+) -> FusedScorer:
+    return FusedScorer(coeffs, model_version=model_version, config=config)
@@ -0,0 +1,304 @@
+"""
+Pipelined bulk scoring of prospectus files.
+
+Scoring a directory of filings one file at a time alternates between disk
+and CPU and leaves each idle half the time.  ``score_filings`` overlaps
+three stages:
+
+1. **Read.**  A thread pool reads raw bytes; a byte budget bounds the data
+   in flight, so memory stays fixed however many files there are.
+2. **Scan.**  A process pool decodes each file, extracts its text (see
+   ``features/edgar.py``) and returns only the ``f_text`` token counts.
+3. **Score.**  The calling thread matches each file to its ``IpoInput``
+   by key (ticker by default, file stem for the path) and scores it with a
+   fused kernel, adding the text term from the counts.
+
+Results are yielded in completion order.  Scores are bit-identical to
+``compute_ipo_risk(ipo, prospectus_text=extracted_text)``: the kernel runs
+with a zero text coefficient and ``f_text`` is the last term of the logit
+sum, so adding ``c_text * f_text`` afterwards reproduces the same sum.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .engine import MODEL_VERSION, _build_drivers
+from .entities import IpoInput, RiskResult
+from .features.builder import FEATURE_KEYS
+from .features.config import DEFAULT_FEATURE_CONFIG, FeatureConfig
+from .features.edgar import iter_filing_text
+from .features.textual import _count_text, _f_text_from_counts
+from .fused import compile_scoring_kernel
+from .logistic import COEFFS_V1, _logistic
+from .validators import ValidationError
+
+PathLike = Union[str, "os.PathLike[str]"]
+# (tokens, positive, negative)
+Counts = Tuple[int, int, int]
+
+DEFAULT_MAX_BYTES = 256 << 20
+DEFAULT_READERS = 4
+
+
+@dataclass
+class FilingScore:
+    """Outcome for one file; ``error`` is set instead of ``result`` on failure."""
+
+    key: str
+    path: str
+    ipo: Optional[IpoInput] = None
+    result: Optional[RiskResult] = None
+    counts: Optional[Counts] = None
+    error: Optional[str] = None
+
+
+def _stem_key(path: str) -> str:
+    return Path(path).stem
+
+
+def _ticker_key(ipo: IpoInput) -> Optional[str]:
+    return ipo.ticker
+
+
+def _scan_bytes(data: bytes, encoding: str, extract: bool) -> Counts:
+    """Worker: ``f_text`` counts of one file's bytes."""
+    text = data.decode(encoding, errors="replace")
+    if not extract:
+        return _count_text(text)
+    tokens = positive = negative = 0
+    for chunk in iter_filing_text([text]):
+        n, pos, neg = _count_text(chunk)
+        tokens += n
+        positive += pos
+        negative += neg
+    return tokens, positive, negative
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+class _ByteBudget:
+    """Counting semaphore over bytes; one oversized item may run alone."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._used = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def acquire(self, n: int) -> int:
+        n = min(n, self._limit)
+        with self._cond:
+            while self._used and self._used + n > self._limit and not self._closed:
+                self._cond.wait()
+            self._used += n
+        return n
+
+    def release(self, n: int) -> None:
+        with self._cond:
+            self._used -= n
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+def _list_paths(paths: Union[PathLike, Iterable[PathLike]]) -> Iterator[str]:
+    if isinstance(paths, (str, os.PathLike)):
+        root = os.fspath(paths)
+        if os.path.isdir(root):
+            for name in sorted(os.listdir(root)):
+                full = os.path.join(root, name)
+                if os.path.isfile(full):
+                    yield full
+            return
+        yield root
+        return
+    for path in paths:
+        yield os.fspath(path)
+
+
+def score_filings(
+    ipos: Union[Iterable[IpoInput], Mapping[str, IpoInput]],
+    paths: Union[PathLike, Iterable[PathLike]],
+    *,
+    coeffs: Optional[Mapping[str, float]] = None,
+    model_version: Optional[str] = None,
+    config: Optional[FeatureConfig] = None,
+    key: Callable[[str], str] = _stem_key,
+    ipo_key: Callable[[IpoInput], Optional[str]] = _ticker_key,
+    extract: bool = True,
+    encoding: str = "utf-8",
+    readers: int = DEFAULT_READERS,
+    workers: Optional[int] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> Iterator[FilingScore]:
+    """
+    Read, scan and score prospectus files concurrently.
+
+    Parameters
+    ----------
+    ipos:
+        Deals to score, keyed by ``ipo_key`` (ticker by default), or a
+        mapping from key to deal.
+    paths:
+        A directory (every file in it), a single file or an iterable of
+        files.  ``key(path)`` names the deal a file belongs to (file stem
+        by default).
+    extract:
+        Strip EDGAR markup and numeric tables before counting (see
+        ``iter_filing_text``); ``False`` counts the decoded file as is.
+    readers:
+        Reader threads.
+    workers:
+        Scanner processes (default ``os.cpu_count()``); ``0`` scans in the
+        reader threads instead.
+    max_bytes:
+        Budget for file bytes read but not yet scored.
+
+    Yields
+    ------
+    FilingScore
+        One per file, in completion order.  Unreadable files, files with no
+        matching deal and deals failing validation carry ``error`` instead
+        of ``result``; scanning errors are raised.
+    """
+    if readers < 1:
+        raise ValueError("readers must be >= 1")
+    if workers is not None and workers < 0:
+        raise ValueError("workers must be >= 0")
+    if max_bytes < 1:
+        raise ValueError("max_bytes must be >= 1")
+
+    if isinstance(ipos, Mapping):
+        deals: Dict[str, IpoInput] = dict(ipos)
+    else:
+        deals = {}
+        for ipo in ipos:
+            deal_key = ipo_key(ipo)
+            if deal_key is None:
+                raise ValueError("every deal needs a key to be matched to a filing")
+            if deal_key in deals:
+                raise ValueError(f"duplicate deal key {deal_key!r}")
+            deals[deal_key] = ipo
+
+    fitted = dict(coeffs if coeffs is not None else COEFFS_V1)
+    version = model_version if model_version is not None else MODEL_VERSION
+    c_text = float(fitted.get("f_text", 0.0))
+    kernel = compile_scoring_kernel({**fitted, "f_text": 0.0}, config or DEFAULT_FEATURE_CONFIG)
+
+    def score(path: str, counts: Counts) -> FilingScore:
+        deal_key = key(path)
+        ipo = deals.get(deal_key)
+        if ipo is None:
+            return FilingScore(deal_key, path, counts=counts, error="no matching deal")
+        try:
+            z, *values = kernel(ipo, None, True)
+        except ValidationError as exc:
+            return FilingScore(deal_key, path, ipo, counts=counts, error=str(exc))
+        f_text = _f_text_from_counts(*counts)
+        values[-1] = f_text
+        z += c_text * f_text
+        risk = 100.0 * _logistic(z)
+        features = dict(zip(FEATURE_KEYS, values))
+        result = RiskResult(
+            risk_score=risk,
+            attractiveness_percent=100.0 - risk,
+            model_version=version,
+            drivers=_build_drivers(features, fitted),
+            raw_features=features,
+        )
+        return FilingScore(deal_key, path, ipo, result=result, counts=counts)
+
+    n_workers = (os.cpu_count() or 1) if workers is None else workers
+    budget = _ByteBudget(max_bytes)
+    done: "queue.Queue[Tuple[str, int, Optional[Future], Optional[BaseException]]]"
+    done = queue.Queue()
+    stop = threading.Event()
+    submitted: List[int] = []
+
+    read_pool = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="ipo-read")
+    scan_pool: Optional[Executor] = None
+    if n_workers > 0:
+        scan_pool = ProcessPoolExecutor(max_workers=n_workers)
+        # Start the workers now, before the reader threads exist: forking
+        # later, from a reader callback, could copy a lock another thread holds.
+        scan_pool.submit(int).result()
+
+    def on_scanned(path: str, held: int, future: Future) -> None:
+        done.put((path, held, future, None))
+
+    def on_read(path: str, held: int, future: Future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            done.put((path, held, None, exc))
+            return
+        data = future.result()
+        if scan_pool is None:
+            scanned: Future = Future()
+            try:
+                scanned.set_result(_scan_bytes(data, encoding, extract))
+            except BaseException as scan_exc:  # surfaced to the consumer
+                scanned.set_exception(scan_exc)
+            on_scanned(path, held, scanned)
+            return
+        try:
+            scan_pool.submit(_scan_bytes, data, encoding, extract).add_done_callback(
+                partial(on_scanned, path, held)
+            )
+        except RuntimeError as submit_exc:  # pool shut down after the consumer stopped
+            done.put((path, held, None, submit_exc))
+
+    def feed() -> None:
+        count = 0
+        try:
+            for path in _list_paths(paths):
+                if stop.is_set():
+                    break
+                try:
+                    size = os.stat(path).st_size
+                except OSError as exc:
+                    done.put((path, 0, None, exc))
+                    count += 1
+                    continue
+                held = budget.acquire(size)
+                if stop.is_set():
+                    budget.release(held)
+                    break
+                read_pool.submit(_read_bytes, path).add_done_callback(partial(on_read, path, held))
+                count += 1
+        finally:
+            submitted.append(count)
+            done.put(("", 0, None, None))
+
+    feeder = threading.Thread(target=feed, name="ipo-feed", daemon=True)
+    feeder.start()
+    received = 0
+    try:
+        while not submitted or received < submitted[0]:
+            path, held, future, exc = done.get()
+            if not path:
+                continue
+            received += 1
+            budget.release(held)
+            if future is None:
+                yield FilingScore(key(path), path, error=f"{type(exc).__name__}: {exc}")
+                continue
+            yield score(path, future.result())
+    finally:
+        stop.set()
+        budget.close()
+        feeder.join()
+        read_pool.shutdown(wait=True, cancel_futures=True)
+        if scan_pool is not None:
+            scan_pool.shutdown(wait=True, cancel_futures=True)
@@ -1,45 +1,77 @@
 import math
-from typing import Dict
+from typing import Any, Dict, Mapping, NoReturn, Tuple
+
+
+class FrozenCoeffs(Dict[str, float]):
+    """
+    Read-only coefficient dict.
+
+    Every mutator raises ``TypeError``, so a set shared by all scorers (and
+    all threads) cannot be edited in place; ``dict(coeffs)`` gives an
+    editable copy.  Being a ``dict``, it still passes to ``json.dumps``, and
+    it pickles and deep-copies as a new ``FrozenCoeffs``.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only; copy it with dict()")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, float]]]:
+        return type(self), (dict(self),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
 
 # Heuristic coefficients for model version v1.
 # These should be calibrated with historical data. They represent a
 # reasonable starting point if no other calibration is available.
-COEFFS_V1: Dict[str, float] = {
-    "intercept": -0.5,
-    # Combined liquidity risk (liquidity + lock‑up).  Liquidity is
-    # considered a primary driver of ex‑ante IPO risk.
-    "f_liq_total": 2.0,
-    # Relative valuation premium.  A higher premium implies
-    # relatively expensive pricing and therefore higher risk.
-    "f_val": 1.0,
-    # Underwriter quality.  Lower tier underwriters (higher f_uw) add risk.
-    "f_uw": 1.5,
-    # Auditor quality.  Non‑Big4 auditors add risk.
-    "f_aud": 1.5,
-    # Sector/geographic context.
-    "f_geo": 1.0,
-    # Financial strength.  Higher values indicate weaker profitability or
-    # growth and thus higher risk.  Included with weight 1.0 by default.
-    "f_fin": 1.0,
-    # Textual sentiment risk (neutral baseline).  Negative tone raises risk.
-    "f_text": 0.5,
-}
+# The shipped sets are read-only: every scorer (and every thread) shares
+# them, so they cannot be edited in place.  Copy with ``dict(COEFFS_V1)``.
+COEFFS_V1: Mapping[str, float] = FrozenCoeffs(
+    {
+        "intercept": -0.5,
+        # Combined liquidity risk (liquidity + lock‑up).  Liquidity is
+        # considered a primary driver of ex‑ante IPO risk.
+        "f_liq_total": 2.0,
+        # Relative valuation premium.  A higher premium implies
+        # relatively expensive pricing and therefore higher risk.
+        "f_val": 1.0,
+        # Underwriter quality.  Lower tier underwriters (higher f_uw) add risk.
+        "f_uw": 1.5,
+        # Auditor quality.  Non‑Big4 auditors add risk.
+        "f_aud": 1.5,
+        # Sector/geographic context.
+        "f_geo": 1.0,
+        # Financial strength.  Higher values indicate weaker profitability or
+        # growth and thus higher risk.  Included with weight 1.0 by default.
+        "f_fin": 1.0,
+        # Textual sentiment risk (neutral baseline).  Negative tone raises risk.
+        "f_text": 0.5,
+    }
+)
 
 # Example coefficients derived from the formulas presented in the
 # ipo_risk_score.tex document.  These values mirror the relative
 # importance of each feature as described in the paper.
-COEFFS_TEX_EXAMPLE: Dict[str, float] = {
-    "intercept": -0.5,
-    "f_liq_total": 2.0,
-    "f_val": 2.0,
-    "f_uw": 1.5,
-    "f_aud": 1.5,
-    "f_geo": 1.0,
-    # Financial strength weight (moderate).
-    "f_fin": 1.0,
-    # Example textual sentiment weight mirroring theoretical feature.
-    "f_text": 0.5,
-}
+COEFFS_TEX_EXAMPLE: Mapping[str, float] = FrozenCoeffs(
+    {
+        "intercept": -0.5,
+        "f_liq_total": 2.0,
+        "f_val": 2.0,
+        "f_uw": 1.5,
+        "f_aud": 1.5,
+        "f_geo": 1.0,
+        # Financial strength weight (moderate).
+        "f_fin": 1.0,
+        # Example textual sentiment weight mirroring theoretical feature.
+        "f_text": 0.5,
+    }
+)
 
 LOGIT_CLIP = 30.0  # protects against overflow in exp()
 FEATURE_MIN_SAFE = -1.0
@@ -65,7 +97,7 @@ def _validate_feature_value(name: str, value: float) -> None:
         )
 
 
-def risk_score_from_features(features: Dict[str, float], coeffs: Dict[str, float]) -> float:
+def risk_score_from_features(features: Dict[str, float], coeffs: Mapping[str, float]) -> float:
     """
     Compute a bounded risk score in [0, 100] from a normalized feature dict.
     Unknown feature keys in `features` are ignored, but each value is validated.
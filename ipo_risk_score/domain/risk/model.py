@@ -0,0 +1,83 @@
+"""
+Compiled, versioned logistic models.
+
+A ``CompiledModel`` is an immutable coefficient set bound to the version tag
+it reports.  Compiling checks the coefficient keys against the feature
+builder once, converts every weight to ``float`` once, and lays the weights
+out in feature order so scoring is a flat loop with no dict lookups on
+coefficients.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Mapping, Tuple
+
+from .features.builder import FEATURE_KEYS, TEXT_ENGINE_KEYS
+from .logistic import FrozenCoeffs, _logistic, _validate_feature_value
+
+
+@dataclass(frozen=True)
+class CompiledModel:
+    """Immutable logistic model ready for scoring."""
+
+    version: str
+    intercept: float
+    feature_names: Tuple[str, ...]
+    weights: Tuple[float, ...]
+    coeffs: Mapping[str, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Read-only coefficient mapping (including "intercept"), built once.
+        mapping = {"intercept": self.intercept, **dict(zip(self.feature_names, self.weights))}
+        object.__setattr__(self, "coeffs", FrozenCoeffs(mapping))
+
+    def logit(self, features: Dict[str, float]) -> float:
+        """Linear predictor; validates every feature value like ``risk_score_from_features``."""
+        for name, value in features.items():
+            _validate_feature_value(name, float(value))
+        z = self.intercept
+        for name, weight in zip(self.feature_names, self.weights):
+            value = features.get(name)
+            if value is not None:
+                z += weight * float(value)
+        return z
+
+    def score_features(self, features: Dict[str, float]) -> float:
+        """Risk score in [0, 100]; equivalent to ``risk_score_from_features``."""
+        return 100.0 * _logistic(self.logit(features))
+
+
+def compile_model(
+    coeffs: Mapping[str, float],
+    version: str,
+    *,
+    known_features: Iterable[str] = FEATURE_KEYS + TEXT_ENGINE_KEYS,
+) -> CompiledModel:
+    """
+    Validate ``coeffs`` and compile them into a ``CompiledModel``.
+
+    Raises ``ValueError`` when a key is not produced by the feature builder
+    (typically a typo such as ``"f_liquidity"``, which would otherwise be
+    silently ignored at scoring time) or when a weight is not finite.
+    Features without a coefficient simply do not contribute, as with plain
+    coefficient dicts.
+    """
+    if not version:
+        raise ValueError("Model version must be a non-empty string")
+    known = tuple(known_features)
+    unknown = sorted(set(coeffs) - set(known) - {"intercept"})
+    if unknown:
+        raise ValueError(
+            f"Model {version!r} has coefficients for unknown features: {', '.join(unknown)}"
+        )
+    for name, value in coeffs.items():
+        if not math.isfinite(float(value)):
+            raise ValueError(f"Model {version!r} coefficient {name!r} is non-finite: {value!r}")
+
+    names = tuple(name for name in known if name in coeffs)
+    return CompiledModel(
+        version=version,
+        intercept=float(coeffs.get("intercept", 0.0)),
+        feature_names=names,
+        weights=tuple(float(coeffs[name]) for name in names),
+    )
@@ -0,0 +1,203 @@
+"""
+Feature and score drift monitoring.
+
+``DriftMonitor`` consumes the ``raw_features`` and ``risk_score`` of every
+scored deal and keeps one fixed-bin histogram per feature for a *reference*
+window and one for the *current* window.  All features are bounded (the
+builder emits values in [0, 1], scores live in [0, 100]), so fixed bins are
+an exact constant-memory sketch: an update is a bin lookup and an integer
+increment per feature.
+
+``snapshot`` compares the windows with the Population Stability Index (PSI)
+and the Kolmogorov-Smirnov statistic (at bin resolution) and is cheap
+enough to call from a health endpoint.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .entities import RiskResult
+from .features import FEATURE_KEYS
+
+DEFAULT_BINS = 20
+SCORE_KEY = "risk_score"
+
+# Conventional PSI reading: < 0.1 stable, 0.1-0.25 moderate shift, > 0.25 major shift.
+PSI_MODERATE = 0.1
+PSI_MAJOR = 0.25
+
+# Proportion substituted for empty bins so PSI stays finite.
+_PSI_FLOOR = 1e-4
+
+
+class _BinnedCounts:
+    """Fixed-width histogram over ``[lo, hi]``; out-of-range values go to the edge bins."""
+
+    __slots__ = ("lo", "scale", "bins", "counts", "total")
+
+    def __init__(self, lo: float, hi: float, bins: int) -> None:
+        self.lo = lo
+        self.scale = bins / (hi - lo)
+        self.bins = bins
+        self.counts = [0] * bins
+        self.total = 0
+
+    def add(self, value: float) -> None:
+        idx = int((value - self.lo) * self.scale)
+        if idx < 0:
+            idx = 0
+        elif idx >= self.bins:
+            idx = self.bins - 1
+        self.counts[idx] += 1
+        self.total += 1
+
+    def copy(self) -> "_BinnedCounts":
+        clone = _BinnedCounts.__new__(_BinnedCounts)
+        clone.lo, clone.scale, clone.bins = self.lo, self.scale, self.bins
+        clone.counts = list(self.counts)
+        clone.total = self.total
+        return clone
+
+    def proportions(self) -> List[float]:
+        return [c / self.total for c in self.counts] if self.total else [0.0] * self.bins
+
+
+def population_stability_index(reference: List[float], current: List[float]) -> float:
+    """PSI between two binned distributions given as proportions."""
+    psi = 0.0
+    for r, c in zip(reference, current):
+        r = max(r, _PSI_FLOOR)
+        c = max(c, _PSI_FLOOR)
+        psi += (c - r) * math.log(c / r)
+    return psi
+
+
+def ks_statistic(reference: List[float], current: List[float]) -> float:
+    """Maximum CDF gap between two binned distributions given as proportions."""
+    cdf_r = cdf_c = 0.0
+    gap = 0.0
+    for r, c in zip(reference, current):
+        cdf_r += r
+        cdf_c += c
+        gap = max(gap, abs(cdf_c - cdf_r))
+    return gap
+
+
+@dataclass
+class FeatureDrift:
+    name: str
+    n_reference: int
+    n_current: int
+    psi: Optional[float]
+    ks: Optional[float]
+
+    @property
+    def status(self) -> str:
+        if self.psi is None:
+            return "insufficient-data"
+        if self.psi >= PSI_MAJOR:
+            return "major"
+        if self.psi >= PSI_MODERATE:
+            return "moderate"
+        return "stable"
+
+
+class DriftMonitor:
+    """
+    Streaming drift detector over feature values and risk scores.
+
+    Typical lifecycle: observe a stable population, call
+    ``freeze_reference()``, keep observing, and poll ``snapshot()``.  Call
+    ``reset_current()`` to start a new comparison window (e.g. daily).
+
+    Examples
+    --------
+    >>> monitor = DriftMonitor()
+    >>> for result in baseline_results:
+    ...     monitor.observe_result(result)
+    >>> monitor.freeze_reference()
+    >>> monitor.observe_result(compute_ipo_risk(ipo))
+    >>> monitor.snapshot()["f_liq_total"].psi
+    """
+
+    def __init__(
+        self,
+        feature_names: Iterable[str] = FEATURE_KEYS,
+        *,
+        bins: int = DEFAULT_BINS,
+        feature_range: Tuple[float, float] = (0.0, 1.0),
+        score_range: Tuple[float, float] = (0.0, 100.0),
+    ) -> None:
+        if bins <= 0:
+            raise ValueError("bins must be > 0")
+        self.bins = bins
+        self._ranges: Dict[str, Tuple[float, float]] = {
+            name: feature_range for name in feature_names
+        }
+        self._ranges[SCORE_KEY] = score_range
+        self._current = self._empty()
+        self._reference: Optional[Dict[str, _BinnedCounts]] = None
+        # Bound adders, resolved once so ``observe`` does no attribute lookups.
+        self._adders = [(name, hist.add) for name, hist in self._current.items()]
+
+    def _empty(self) -> Dict[str, _BinnedCounts]:
+        return {name: _BinnedCounts(lo, hi, self.bins) for name, (lo, hi) in self._ranges.items()}
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def observe(self, raw_features: Mapping[str, float], risk_score: float) -> None:
+        """Fold one scored deal into the current window.  Unknown keys are ignored."""
+        for name, add in self._adders:
+            if name == SCORE_KEY:
+                add(risk_score)
+            else:
+                value = raw_features.get(name)
+                if value is not None:
+                    add(value)
+
+    def observe_result(self, result: RiskResult) -> None:
+        self.observe(result.raw_features, result.risk_score)
+
+    def freeze_reference(self) -> None:
+        """Use the current window as the reference and start a fresh current window."""
+        self._reference = {name: hist.copy() for name, hist in self._current.items()}
+        self.reset_current()
+
+    def reset_current(self) -> None:
+        self._current = self._empty()
+        self._adders = [(name, hist.add) for name, hist in self._current.items()]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def has_reference(self) -> bool:
+        return self._reference is not None
+
+    def snapshot(self) -> Dict[str, FeatureDrift]:
+        """PSI/KS per feature (and ``"risk_score"``) of current vs reference."""
+        out: Dict[str, FeatureDrift] = {}
+        for name, current in self._current.items():
+            reference = self._reference.get(name) if self._reference is not None else None
+            n_ref = reference.total if reference is not None else 0
+            if n_ref and current.total:
+                ref_p = reference.proportions()
+                cur_p = current.proportions()
+                psi: Optional[float] = population_stability_index(ref_p, cur_p)
+                ks: Optional[float] = ks_statistic(ref_p, cur_p)
+            else:
+                psi = ks = None
+            out[name] = FeatureDrift(name, n_ref, current.total, psi, ks)
+        return out
+
+    def drifted(self, threshold: float = PSI_MAJOR) -> List[str]:
+        """Names whose PSI is at or above ``threshold``."""
+        return [
+            name
+            for name, drift in self.snapshot().items()
+            if drift.psi is not None and drift.psi >= threshold
+        ]
@@ -0,0 +1,430 @@
+"""
+Nearest-comparable search over historical feature vectors.
+
+``ComparableIndex`` stores the feature vectors (``raw_features`` in
+``FEATURE_KEYS`` order by default) of past deals together with their
+realised outcomes and answers "the k most similar past IPOs" for a new
+deal.  It is a KD-tree over bucketed leaves, split at the median of the
+widest dimension:
+
+* the search descends to the query's leaf and queues each skipped subtree
+  with its exact distance to the query's cell, updated incrementally along
+  the split dimension only (Arya & Mount), then visits queued subtrees
+  nearest first and stops once none can beat the current k-th neighbour;
+* coordinates are pre-multiplied by the square root of the per-feature
+  weights, so distances are plain Euclidean and each leaf is scanned with
+  ``math.dist`` (a C loop) over points stored contiguously in tree order.
+
+Results are exact: ties are broken by the original row index.
+
+The index is persisted as a header plus raw little-endian arrays, so
+loading is a few ``array.frombytes`` calls and does not rebuild the tree:
+
+    magic  b"IPNN"                 4 bytes
+    format version                 1 byte
+    header length                  uint32
+    header                         UTF-8 JSON: feature_names, weights,
+                                   dimensions, sizes, ids
+    arrays                         points, outcomes, rows, node starts,
+                                   ends, right children, split dimensions,
+                                   split values
+"""
+
+import bisect
+import heapq
+import json
+import math
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from itertools import repeat
+from typing import BinaryIO, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .entities import IpoInput, RiskResult
+from .features.builder import FEATURE_KEYS
+from .features.config import FeatureConfig
+from .fused import compile_feature_extractor
+
+MAGIC = b"IPNN"
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<4sBI")
+_NAN = float("nan")
+
+
+@dataclass(frozen=True)
+class Comparable:
+    """One neighbour: its row in the build matrix, id, distance and outcome."""
+
+    row: int
+    id: Optional[str]
+    distance: float
+    outcome: Optional[float]
+
+
+def _to_le(values: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - little-endian hosts only in CI
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return values
+
+
+class ComparableIndex:
+    """
+    Exact k-nearest-neighbour index over past deals.
+
+    Examples
+    --------
+    >>> index = ComparableIndex.build(matrix, outcomes, ids=tickers)
+    >>> index.query(new_ipo, k=10)
+    >>> index.save("comparables.ipnn")
+    >>> ComparableIndex.load("comparables.ipnn").query_batch(ipos, k=10)
+    """
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        weights: Sequence[float],
+        points: List[Tuple[float, ...]],
+        outcomes: array,
+        rows: array,
+        ids: Optional[List[Optional[str]]],
+        nodes: Tuple[array, array, array, array, array],
+    ) -> None:
+        self.feature_names: Tuple[str, ...] = tuple(feature_names)
+        self.weights: Tuple[float, ...] = tuple(weights)
+        self._scale = tuple(math.sqrt(w) for w in self.weights)
+        self._points = points
+        self._outcomes = outcomes
+        self._rows = rows
+        self._ids = ids
+        self._starts, self._ends, self._rights, self._dims, self._splits = nodes
+        self._positions = [FEATURE_KEYS.index(name) for name in self.feature_names]
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        feature_matrix: Iterable[Sequence[float]],
+        outcomes: Optional[Sequence[Optional[float]]] = None,
+        *,
+        ids: Optional[Sequence[Optional[str]]] = None,
+        feature_names: Sequence[str] = FEATURE_KEYS,
+        weights: Optional[Mapping[str, float]] = None,
+        leaf_size: int = 16,
+    ) -> "ComparableIndex":
+        """
+        Build from one row per past deal, columns ordered as ``feature_names``.
+
+        ``outcomes`` (e.g. the realised 0/1 target, ``None`` when unknown) and
+        ``ids`` (e.g. tickers) are returned with every neighbour.
+        ``weights`` scales each feature's squared distance (default 1.0).
+        """
+        names = tuple(feature_names)
+        unknown = sorted(set(names) - set(FEATURE_KEYS))
+        if unknown:
+            raise ValueError(f"Unknown feature keys: {', '.join(unknown)}")
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be >= 1")
+        w = [1.0 if weights is None else float(weights.get(name, 1.0)) for name in names]
+        if any(not math.isfinite(v) or v < 0.0 for v in w):
+            raise ValueError("weights must be finite and non-negative")
+        scale = [math.sqrt(v) for v in w]
+        d = len(names)
+
+        points: List[Tuple[float, ...]] = []
+        for i, row in enumerate(feature_matrix):
+            if len(row) != d:
+                raise ValueError(f"row {i}: expected {d} features, got {len(row)}")
+            point = tuple(float(x) * s for x, s in zip(row, scale))
+            if not all(map(math.isfinite, point)):
+                raise ValueError(f"row {i}: features must be finite")
+            points.append(point)
+        n = len(points)
+        if outcomes is not None and len(outcomes) != n:
+            raise ValueError("outcomes must have one value per row")
+        if ids is not None and len(ids) != n:
+            raise ValueError("ids must have one value per row")
+
+        order = list(range(n))
+        starts, ends, rights, dims = array("q"), array("q"), array("q"), array("q")
+        splits = array("d")
+        # Iterative pre-order build: the left child of node i is node i + 1.
+        stack: List[Tuple[int, int, int]] = [(0, n, -1)] if n else []
+        while stack:
+            lo, hi, parent = stack.pop()
+            node = len(starts)
+            if parent >= 0:
+                rights[parent] = node
+            starts.append(lo)
+            ends.append(hi)
+            rights.append(-1)
+            dims.append(0)
+            splits.append(0.0)
+            if hi - lo <= leaf_size:
+                continue
+            columns = list(zip(*(points[j] for j in order[lo:hi])))
+            spread = [max(column) - min(column) for column in columns]
+            dim = spread.index(max(spread))
+            if spread[dim] == 0.0:
+                continue  # identical points: keep as one leaf
+            order[lo:hi] = sorted(order[lo:hi], key=lambda j: points[j][dim])
+            keys = [points[j][dim] for j in order[lo:hi]]
+            # Split at the run boundary nearest the median so equal values
+            # (discrete features) never straddle two subtrees.
+            median = keys[(hi - lo) // 2]
+            first = bisect.bisect_left(keys, median)
+            after = bisect.bisect_right(keys, median)
+            centre = (hi - lo) / 2.0
+            if first == 0 or (after < len(keys) and after - centre < centre - first):
+                first = after
+            mid = lo + first
+            # Left points are < the split value, right points >= it.
+            dims[node] = dim
+            splits[node] = keys[first]
+            # Right subtree is pushed first and filled in when popped.
+            stack.append((mid, hi, node))
+            stack.append((lo, mid, -1))
+
+        return cls(
+            names,
+            w,
+            [points[j] for j in order],
+            array(
+                "d",
+                (
+                    _NAN if outcomes is None or outcomes[j] is None else float(outcomes[j])
+                    for j in order
+                ),
+            ),
+            array("q", order),
+            None if ids is None else [None if ids[j] is None else str(ids[j]) for j in order],
+            (starts, ends, rights, dims, splits),
+        )
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[RiskResult],
+        outcomes: Optional[Sequence[Optional[float]]] = None,
+        *,
+        ids: Optional[Sequence[Optional[str]]] = None,
+        **kwargs: object,
+    ) -> "ComparableIndex":
+        """Build from past ``RiskResult``s (e.g. read back from an audit log)."""
+        names = tuple(kwargs.get("feature_names", FEATURE_KEYS))  # type: ignore[arg-type]
+        matrix = [[result.raw_features[name] for name in names] for result in results]
+        return cls.build(matrix, outcomes, ids=ids, **kwargs)  # type: ignore[arg-type]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _search(self, query: Tuple[float, ...], k: int) -> List[Tuple[float, int, int]]:
+        """``k`` nearest as ``(distance, row, tree position)``, closest first."""
+        if k <= 0 or not self._points:
+            return []
+        dist = math.dist
+        points = self._points
+        rows = self._rows
+        starts, ends, rights = self._starts, self._ends, self._rights
+        dims, splits = self._dims, self._splits
+        # Max-heap of the best k as (-distance, -row, position).
+        best: List[Tuple[float, int, int]] = []
+        bound = bound_sq = math.inf
+        # Subtrees still to visit: (squared cell distance, node, per-dim offsets).
+        frontier: List[Tuple[float, int, Tuple[float, ...]]] = [(0.0, 0, (0.0,) * len(query))]
+        while frontier:
+            gap_sq, node, offsets = heapq.heappop(frontier)
+            if gap_sq > bound_sq:
+                break
+            right = rights[node]
+            while right >= 0:
+                dim = dims[node]
+                diff = query[dim] - splits[node]
+                if diff < 0.0:
+                    near, far = node + 1, right
+                else:
+                    near, far = right, node + 1
+                far_sq = gap_sq - offsets[dim] * offsets[dim] + diff * diff
+                if far_sq <= bound_sq:
+                    far_offsets = offsets[:dim] + (diff,) + offsets[dim + 1 :]
+                    heapq.heappush(frontier, (far_sq, far, far_offsets))
+                node = near
+                right = rights[node]
+            lo = starts[node]
+            block = points[lo : ends[node]]
+            distances = list(map(dist, repeat(query, len(block)), block))
+            if min(distances) > bound:
+                continue
+            for offset, d in enumerate(distances):
+                if d > bound:
+                    continue
+                position = lo + offset
+                entry = (-d, -rows[position], position)
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                    if len(best) < k:
+                        continue
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+                else:
+                    continue
+                bound = -best[0][0]
+                # Slack so rounding in the incremental cell distance never
+                # prunes a subtree holding a point at exactly ``bound``.
+                bound_sq = bound * bound * (1.0 + 1e-12)
+        # Equal distances are ordered by original row.
+        return sorted((-neg_d, -neg_row, position) for neg_d, neg_row, position in best)
+
+    def _neighbours(self, query: Tuple[float, ...], k: int) -> List[Comparable]:
+        out = []
+        for distance, row, position in self._search(query, k):
+            outcome = self._outcomes[position]
+            out.append(
+                Comparable(
+                    row=row,
+                    id=None if self._ids is None else self._ids[position],
+                    distance=distance,
+                    outcome=None if math.isnan(outcome) else outcome,
+                )
+            )
+        return out
+
+    def _scaled(self, values: Sequence[float]) -> Tuple[float, ...]:
+        if len(values) != len(self._scale):
+            raise ValueError(f"expected {len(self._scale)} features, got {len(values)}")
+        return tuple(float(x) * s for x, s in zip(values, self._scale))
+
+    def query_features(
+        self, features: Union[Mapping[str, float], Sequence[float]], k: int = 10
+    ) -> List[Comparable]:
+        """Neighbours of a feature dict (e.g. ``RiskResult.raw_features``) or row."""
+        if isinstance(features, Mapping):
+            features = [features[name] for name in self.feature_names]
+        return self._neighbours(self._scaled(features), k)
+
+    def query(
+        self,
+        ipo: IpoInput,
+        k: int = 10,
+        *,
+        validate: bool = True,
+        feature_config: Optional[FeatureConfig] = None,
+    ) -> List[Comparable]:
+        """Neighbours of a new deal; features are computed as in ``compute_ipo_risk``."""
+        return self.query_batch([ipo], k, validate=validate, feature_config=feature_config)[0]
+
+    def query_batch(
+        self,
+        ipos: Iterable[Union[IpoInput, Sequence[float]]],
+        k: int = 10,
+        *,
+        validate: bool = True,
+        feature_config: Optional[FeatureConfig] = None,
+    ) -> List[List[Comparable]]:
+        """Neighbours of many deals (``IpoInput`` or feature rows), in input order."""
+        extract = compile_feature_extractor(feature_config)
+        positions = self._positions
+        out: List[List[Comparable]] = []
+        for item in ipos:
+            if isinstance(item, IpoInput):
+                values = extract(item, item.prospectus_text, validate)
+                row: Sequence[float] = [values[p] for p in positions]
+            else:
+                row = item
+            out.append(self._neighbours(self._scaled(row), k))
+        return out
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def write(self, fh: BinaryIO) -> None:
+        d = len(self.feature_names)
+        arrays = [
+            array("d", (x for p in self._points for x in p)),
+            self._outcomes,
+            self._rows,
+            self._starts,
+            self._ends,
+            self._rights,
+            self._dims,
+            self._splits,
+        ]
+        header = json.dumps(
+            {
+                "feature_names": list(self.feature_names),
+                "weights": list(self.weights),
+                "dimensions": d,
+                "n_points": len(self._points),
+                "n_nodes": len(self._starts),
+                "ids": self._ids,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        fh.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+        fh.write(header)
+        for values in arrays:
+            fh.write(_to_le(values))
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as fh:
+            self.write(fh)
+
+    @classmethod
+    def read(cls, fh: BinaryIO) -> "ComparableIndex":
+        preamble = fh.read(_PREAMBLE.size)
+        if len(preamble) != _PREAMBLE.size:
+            raise ValueError("Truncated comparable index")
+        magic, version, header_len = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ValueError("Not a comparable index (bad magic)")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported comparable index version {version}")
+        header = json.loads(fh.read(header_len).decode("utf-8"))
+        d, n, m = header["dimensions"], header["n_points"], header["n_nodes"]
+
+        def take(typecode: str, count: int) -> array:
+            size = array(typecode).itemsize * count
+            data = fh.read(size)
+            if len(data) != size:
+                raise ValueError("Truncated comparable index")
+            return _from_le(typecode, data)
+
+        def rows_of(flat: array, count: int) -> List[Tuple[float, ...]]:
+            return [tuple(flat[i * d : (i + 1) * d]) for i in range(count)]
+
+        points = rows_of(take("d", n * d), n)
+        outcomes = take("d", n)
+        rows = take("q", n)
+        nodes = (take("q", m), take("q", m), take("q", m), take("q", m), take("d", m))
+        return cls(
+            header["feature_names"],
+            header["weights"],
+            points,
+            outcomes,
+            rows,
+            header["ids"],
+            nodes,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ComparableIndex":
+        with open(path, "rb") as fh:
+            return cls.read(fh)
@@ -0,0 +1,326 @@
+"""
+Online calibration as aftermarket outcomes arrive.
+
+Outcome labels (e.g. "traded below offer within a year") trickle in one
+deal at a time, and refitting ``fit_coefficients`` on the full history for
+each one repeats all the earlier work.  ``OnlineCalibrator`` keeps a
+Gaussian belief over the coefficients.  Its mean and covariance start at
+the prior, which acts as an L2 penalty of ``(b - prior)^2 / (2 prior_sd^2)``.
+Each labelled deal folds in with one Newton step on its log-likelihood.
+This is the recursive form of the Laplace fit in ``bayesian.py``:
+
+* ``u = S x`` and ``w = p (1 - p)`` at the current mean
+* ``S <- S - w u u' / (1 + w x' u)``  (Sherman-Morrison)
+* ``b <- b + (y - p) S x``
+
+An update costs O(features^2) and keeps no history.  With ``half_life_days``
+the covariance is inflated by ``2 ** (elapsed / half_life_days)`` whenever
+the observation date advances.  Older outcomes, and eventually the prior,
+then weigh less than recent ones (exponential forgetting).
+
+``coeffs()`` can be read at any time.  ``save`` and ``load`` checkpoint the
+full state, including the ``FeatureConfig``, as JSON; floats round-trip
+exactly, so a restored calibrator continues bit for bit.
+"""
+
+import json
+import math
+import os
+from dataclasses import asdict
+from datetime import date
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from .entities import IpoInput
+from .features.builder import FEATURE_KEYS
+from .features.config import DEFAULT_FEATURE_CONFIG, FeatureConfig
+from .fused import compile_feature_extractor
+from .logistic import COEFFS_V1, _logistic
+from .model import CompiledModel, compile_model
+
+CHECKPOINT_FORMAT = "ipo-risk-online-calibrator"
+CHECKPOINT_VERSION = 1
+
+Matrix = List[List[float]]
+
+
+class OnlineCalibrator:
+    """
+    Streaming logistic calibration with an L2 prior and optional time decay.
+
+    Examples
+    --------
+    >>> calibrator = OnlineCalibrator(prior_sd=0.5, half_life_days=730)
+    >>> calibrator.update(ipo, outcome=1, as_of=date(2024, 3, 1))
+    >>> compute_ipo_risk(new_ipo, coeffs=calibrator.coeffs())
+    >>> calibrator.save("calibrator.json")
+    >>> calibrator = OnlineCalibrator.load("calibrator.json")
+    """
+
+    def __init__(
+        self,
+        feature_keys: Optional[Iterable[str]] = None,
+        *,
+        prior: Optional[Mapping[str, float]] = None,
+        prior_sd: Union[float, Mapping[str, float]] = 1.0,
+        half_life_days: Optional[float] = None,
+        feature_config: Optional[FeatureConfig] = None,
+    ) -> None:
+        prior_map = COEFFS_V1 if prior is None else prior
+        if feature_keys is None:
+            names = tuple(name for name in FEATURE_KEYS if name in prior_map)
+        else:
+            names = tuple(feature_keys)
+        unknown = sorted(set(names) - set(FEATURE_KEYS))
+        if unknown:
+            raise ValueError(f"Unknown feature keys: {', '.join(unknown)}")
+        if half_life_days is not None and not (
+            math.isfinite(half_life_days) and half_life_days > 0.0
+        ):
+            raise ValueError("half_life_days must be positive and finite")
+
+        all_names = ("intercept",) + names
+        if isinstance(prior_sd, Mapping):
+            sds = [float(prior_sd.get(name, 1.0)) for name in all_names]
+        else:
+            sds = [float(prior_sd)] * len(all_names)
+        if any(not math.isfinite(s) or s <= 0.0 for s in sds):
+            raise ValueError("prior_sd must be positive and finite")
+
+        self.feature_names = names
+        self.half_life_days = half_life_days
+        self.feature_config = feature_config or DEFAULT_FEATURE_CONFIG
+        self.n_observations = 0
+        self.last_as_of: Optional[date] = None
+        self._mean = [float(prior_map.get(name, 0.0)) for name in all_names]
+        n = len(all_names)
+        self._cov: Matrix = [[sds[i] ** 2 if i == j else 0.0 for j in range(n)] for i in range(n)]
+        self._extract = compile_feature_extractor(self.feature_config)
+        self._positions = [FEATURE_KEYS.index(name) for name in names]
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _decay(self, as_of: Optional[date]) -> None:
+        if as_of is None:
+            return
+        last = self.last_as_of
+        if last is not None and as_of <= last:
+            return
+        self.last_as_of = as_of
+        if last is None or self.half_life_days is None:
+            return
+        inflate = 2.0 ** ((as_of - last).days / self.half_life_days)
+        for row in self._cov:
+            for j in range(len(row)):
+                row[j] *= inflate
+
+    def update_row(
+        self,
+        x: Sequence[float],
+        outcome: int,
+        *,
+        as_of: Optional[date] = None,
+        weight: float = 1.0,
+    ) -> float:
+        """
+        Fold in one observation given as feature values in ``feature_names`` order.
+
+        Returns the predicted probability of ``outcome == 1`` before the update.
+        """
+        if outcome not in (0, 1):
+            raise ValueError("outcome must be 0 or 1")
+        if not (math.isfinite(weight) and weight >= 0.0):
+            raise ValueError("weight must be non-negative and finite")
+        row = [1.0]
+        row.extend(float(v) for v in x)
+        if len(row) != len(self._mean):
+            raise ValueError("x must have one value per feature name")
+        self._decay(as_of)
+
+        mean, cov = self._mean, self._cov
+        n = len(row)
+        z = 0.0
+        for b_j, x_j in zip(mean, row):
+            z += b_j * x_j
+        p = _logistic(z)
+        if weight == 0.0:
+            return p
+        u = []
+        for cov_i in cov:
+            s = 0.0
+            for c_ij, x_j in zip(cov_i, row):
+                s += c_ij * x_j
+            u.append(s)
+        xu = 0.0
+        for x_j, u_j in zip(row, u):
+            xu += x_j * u_j
+        w = weight * p * (1.0 - p)
+        shrink = w / (1.0 + w * xu)
+        for i in range(n):
+            cov_i = cov[i]
+            su_i = shrink * u[i]
+            for j in range(i + 1):
+                cov_i[j] -= su_i * u[j]
+        for i in range(n):
+            for j in range(i):
+                cov[j][i] = cov[i][j]
+        # S_new x = u / (1 + w x'u), from the rank-1 update.
+        step = weight * (outcome - p) / (1.0 + w * xu)
+        for i in range(n):
+            mean[i] += step * u[i]
+        self.n_observations += 1
+        return p
+
+    def update_features(
+        self,
+        features: Mapping[str, float],
+        outcome: int,
+        *,
+        as_of: Optional[date] = None,
+        weight: float = 1.0,
+    ) -> float:
+        """``update_row`` for a feature dict (missing features count as 0.0)."""
+        return self.update_row(
+            [float(features.get(name, 0.0)) for name in self.feature_names],
+            outcome,
+            as_of=as_of,
+            weight=weight,
+        )
+
+    def update(
+        self,
+        ipo: IpoInput,
+        outcome: int,
+        *,
+        as_of: Optional[date] = None,
+        weight: float = 1.0,
+    ) -> float:
+        """
+        Fold in one labelled deal (features include its ``prospectus_text``).
+
+        ``as_of`` is the date the outcome became known; it drives the time
+        decay and must be non-decreasing to have effect.  Returns the
+        predicted probability of ``outcome == 1`` before the update.
+        """
+        values = self._extract(ipo, ipo.prospectus_text, True)
+        return self.update_row(
+            [values[p] for p in self._positions], outcome, as_of=as_of, weight=weight
+        )
+
+    def update_many(
+        self,
+        ipos: Iterable[IpoInput],
+        outcomes: Iterable[int],
+        *,
+        as_of: Optional[Iterable[Optional[date]]] = None,
+    ) -> None:
+        """
+        ``update`` for each deal in order, optionally with per-deal dates.
+
+        Raises ``ValueError`` before any update when ``outcomes`` (or
+        ``as_of``) does not have one entry per deal.
+        """
+        ipo_list = list(ipos)
+        outcome_list = list(outcomes)
+        dates = [None] * len(ipo_list) if as_of is None else list(as_of)
+        if len(outcome_list) != len(ipo_list) or len(dates) != len(ipo_list):
+            raise ValueError("ipos, outcomes and as_of must have the same length")
+        for ipo, outcome, when in zip(ipo_list, outcome_list, dates):
+            self.update(ipo, outcome, as_of=when)
+
+    # ------------------------------------------------------------------
+    # Current estimate
+    # ------------------------------------------------------------------
+
+    def coeffs(self) -> Dict[str, float]:
+        """Current coefficients, usable as ``compute_ipo_risk(coeffs=...)``."""
+        return dict(zip(("intercept",) + self.feature_names, self._mean))
+
+    def std(self) -> Dict[str, float]:
+        """Current standard deviation of every coefficient."""
+        names = ("intercept",) + self.feature_names
+        return {name: math.sqrt(max(self._cov[j][j], 0.0)) for j, name in enumerate(names)}
+
+    def to_model(self, version: str) -> CompiledModel:
+        return compile_model(self.coeffs(), version)
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """
+        Write a JSON checkpoint.  The file is written to a temporary name
+        and renamed into place, so a crash never leaves a partial checkpoint.
+        """
+        payload = {
+            "format": CHECKPOINT_FORMAT,
+            "version": CHECKPOINT_VERSION,
+            "feature_names": list(self.feature_names),
+            "half_life_days": self.half_life_days,
+            "feature_config": asdict(self.feature_config),
+            "n_observations": self.n_observations,
+            "last_as_of": None if self.last_as_of is None else self.last_as_of.isoformat(),
+            "mean": self._mean,
+            "covariance": self._cov,
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(
+        cls, path: str, *, feature_config: Optional[FeatureConfig] = None
+    ) -> "OnlineCalibrator":
+        """
+        Restore a checkpoint written by ``save``.
+
+        The checkpoint carries its ``FeatureConfig``; passing a different
+        ``feature_config`` raises ``ValueError`` rather than continuing with
+        other features.
+        """
+        with open(path, encoding="utf-8") as fh:
+            try:
+                payload = json.load(fh)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Checkpoint {path!r} is not valid JSON: {exc}") from exc
+        if not isinstance(payload, dict) or payload.get("format") != CHECKPOINT_FORMAT:
+            raise ValueError(f"{path!r} is not an online calibrator checkpoint")
+        if payload.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Checkpoint {path!r} has unsupported version {payload.get('version')!r}"
+            )
+        try:
+            stored_config = FeatureConfig(**payload["feature_config"])
+        except KeyError:
+            raise ValueError(f"Checkpoint {path!r} is missing 'feature_config'") from None
+        except TypeError as exc:
+            raise ValueError(f"Checkpoint {path!r} has an invalid feature_config: {exc}") from None
+        if feature_config is not None and feature_config != stored_config:
+            raise ValueError(
+                f"Checkpoint {path!r} was written with a different FeatureConfig; "
+                "omit feature_config to use the stored one"
+            )
+        try:
+            calibrator = cls(
+                payload["feature_names"],
+                prior={},
+                half_life_days=payload["half_life_days"],
+                feature_config=stored_config,
+            )
+            mean = [float(v) for v in payload["mean"]]
+            cov = [[float(v) for v in row] for row in payload["covariance"]]
+            n_observations = int(payload["n_observations"])
+            last = payload["last_as_of"]
+        except KeyError as exc:
+            raise ValueError(f"Checkpoint {path!r} is missing {exc.args[0]!r}") from None
+        n = len(calibrator._mean)
+        if len(mean) != n or len(cov) != n or any(len(row) != n for row in cov):
+            raise ValueError(f"Checkpoint {path!r} state does not match its feature names")
+        calibrator._mean = mean
+        calibrator._cov = cov
+        calibrator.n_observations = n_observations
+        calibrator.last_as_of = None if last is None else date.fromisoformat(last)
+        return calibrator
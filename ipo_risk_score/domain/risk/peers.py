@@ -0,0 +1,288 @@
+"""
+Sector peer-multiple index.
+
+``f_val`` compares the offer's price-to-sales ratio with
+``IpoInput.sector_ps_multiple`` and falls back to the coarse
+``_valuation_from_ps_multiple`` ramp when it is missing.
+``PeerMultipleIndex`` supplies the multiple from a set of comparable
+companies: each comparable is a ``(sector, country, as_of, ps_multiple)``
+observation, loaded from CSV/JSONL or added one by one.
+
+The index answers "median P/S of the comparables in this sector and country
+observed in the ``window_days`` up to ``as_of``".  A country group with
+fewer than ``min_peers`` comparables falls back to the sector-wide group.
+
+* ``add`` appends to the group's pending list in amortised O(1); the next
+  lookup merges the pending comparables into the date-sorted lists with one
+  sort, which is linear when they arrive in date order.
+* ``median`` locates the window by binary search on the dates and sorts the
+  window's multiples, O(w log w) for a window of w comparables.
+* ``fill_many`` answers a batch in one sweep per group: queries are sorted
+  by date and a sliding window of sorted multiples is maintained, so each
+  comparable enters and leaves the window with a binary search plus a list
+  shift, and each median is O(1).
+
+Sectors and countries are matched case-insensitively.
+"""
+
+import bisect
+import csv
+import json
+import math
+from dataclasses import replace
+from datetime import date
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .entities import IpoInput
+
+# (sector, country); country None is the sector-wide group.
+GroupKey = Tuple[str, Optional[str]]
+DateLike = Union[date, str]
+
+
+def _norm(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    value = value.strip().casefold()
+    return value or None
+
+
+def _as_ordinal(value: DateLike) -> int:
+    if isinstance(value, str):
+        value = date.fromisoformat(value.strip()[:10])
+    return value.toordinal()
+
+
+def _median(sorted_values: Sequence[float]) -> float:
+    n = len(sorted_values)
+    mid = n // 2
+    if n % 2:
+        return sorted_values[mid]
+    return (sorted_values[mid - 1] + sorted_values[mid]) / 2.0
+
+
+class _Group:
+    """Observations of one group, sorted by date once ``sort`` has run."""
+
+    __slots__ = ("days", "multiples", "_pending")
+
+    def __init__(self) -> None:
+        self.days: List[int] = []
+        self.multiples: List[float] = []
+        self._pending: List[Tuple[int, float]] = []
+
+    def add(self, day: int, multiple: float) -> None:
+        self._pending.append((day, multiple))
+
+    def sort(self) -> None:
+        """Merge pending observations; equal dates keep their insertion order."""
+        pending = self._pending
+        if not pending:
+            return
+        # Two sorted runs when comparables arrive in date order: a linear merge.
+        rows = sorted([*zip(self.days, self.multiples), *pending], key=lambda row: row[0])
+        self.days = [day for day, _ in rows]
+        self.multiples = [multiple for _, multiple in rows]
+        self._pending = []
+
+    def window(self, day: Optional[int], window_days: Optional[int]) -> Tuple[int, int]:
+        end = len(self.days) if day is None else bisect.bisect_right(self.days, day)
+        if window_days is None or end == 0:
+            return 0, end
+        last = self.days[end - 1] if day is None else day
+        return bisect.bisect_left(self.days, last - window_days + 1), end
+
+
+class PeerMultipleIndex:
+    """
+    As-of median price-to-sales multiples per sector and country.
+
+    Parameters
+    ----------
+    window_days:
+        Only comparables observed in the ``window_days`` days up to the
+        query date count (``None`` keeps all history).
+    min_peers:
+        Minimum comparables for a country-level median; below it the
+        sector-wide median is used, and below it again no multiple.
+
+    Examples
+    --------
+    >>> index = PeerMultipleIndex.from_csv("comparables.csv", window_days=365)
+    >>> index.median("Technology", "US", as_of="2024-06-30")
+    >>> ipos = index.fill_many(ipos, as_of=offer_dates)
+    """
+
+    def __init__(self, *, window_days: Optional[int] = 365, min_peers: int = 3) -> None:
+        if window_days is not None and window_days <= 0:
+            raise ValueError("window_days must be positive or None")
+        if min_peers < 1:
+            raise ValueError("min_peers must be >= 1")
+        self.window_days = window_days
+        self.min_peers = min_peers
+        self._groups: Dict[GroupKey, _Group] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, sector: str, country: Optional[str], as_of: DateLike, ps_multiple: float) -> None:
+        """Add one comparable in amortised O(1); it is sorted in on the next lookup."""
+        sector_key = _norm(sector)
+        if sector_key is None:
+            raise ValueError("sector is required")
+        multiple = float(ps_multiple)
+        if not math.isfinite(multiple) or multiple <= 0:
+            raise ValueError(f"ps_multiple must be positive and finite, got {ps_multiple!r}")
+        day = _as_ordinal(as_of)
+        keys = [(sector_key, None)]
+        country_key = _norm(country)
+        if country_key is not None:
+            keys.append((sector_key, country_key))
+        for key in keys:
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _Group()
+            group.add(day, multiple)
+        self._count += 1
+
+    def add_records(self, records: Iterable[Mapping[str, object]]) -> None:
+        """Add ``{"sector", "country", "as_of", "ps_multiple"}`` records."""
+        for i, record in enumerate(records):
+            try:
+                self.add(
+                    record["sector"],  # type: ignore[arg-type]
+                    record.get("country") or None,  # type: ignore[arg-type]
+                    record["as_of"],  # type: ignore[arg-type]
+                    record["ps_multiple"],  # type: ignore[arg-type]
+                )
+            except KeyError as exc:
+                raise ValueError(f"record {i}: missing field {exc.args[0]!r}") from None
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"record {i}: {exc}") from None
+
+    @classmethod
+    def from_csv(cls, path: str, **kwargs: object) -> "PeerMultipleIndex":
+        """Load a CSV with ``sector,country,as_of,ps_multiple`` columns (extra columns ignored)."""
+        index = cls(**kwargs)  # type: ignore[arg-type]
+        with open(path, newline="", encoding="utf-8") as fh:
+            index.add_records(csv.DictReader(fh))
+        return index
+
+    @classmethod
+    def from_jsonl(cls, path: str, **kwargs: object) -> "PeerMultipleIndex":
+        """Load one JSON object per line with the ``from_csv`` fields."""
+        index = cls(**kwargs)  # type: ignore[arg-type]
+        with open(path, encoding="utf-8") as fh:
+            index.add_records(json.loads(line) for line in fh if line.strip())
+        return index
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _group_median(self, key: GroupKey, day: Optional[int]) -> Optional[float]:
+        group = self._groups.get(key)
+        if group is None:
+            return None
+        group.sort()
+        start, end = group.window(day, self.window_days)
+        if end - start < self.min_peers:
+            return None
+        return _median(sorted(group.multiples[start:end]))
+
+    def median(
+        self, sector: Optional[str], country: Optional[str] = None, as_of: Optional[DateLike] = None
+    ) -> Optional[float]:
+        """
+        Median peer P/S for one deal, or ``None`` without enough peers.
+
+        Without ``as_of`` the window ends at the group's latest comparable.
+        """
+        sector_key = _norm(sector)
+        if sector_key is None:
+            return None
+        day = None if as_of is None else _as_ordinal(as_of)
+        country_key = _norm(country)
+        if country_key is not None:
+            value = self._group_median((sector_key, country_key), day)
+            if value is not None:
+                return value
+        return self._group_median((sector_key, None), day)
+
+    def _sweep(self, key: GroupKey, queries: List[Tuple[int, int]], out: Dict[int, float]) -> None:
+        """Answer ``(day, position)`` queries of one group with a sliding window."""
+        group = self._groups.get(key)
+        if group is None:
+            return
+        group.sort()
+        days, multiples = group.days, group.multiples
+        window_days = self.window_days
+        active: List[float] = []
+        head = tail = 0
+        for day, position in sorted(queries):
+            while head < len(days) and days[head] <= day:
+                bisect.insort(active, multiples[head])
+                head += 1
+            if window_days is not None:
+                while tail < head and days[tail] <= day - window_days:
+                    del active[bisect.bisect_left(active, multiples[tail])]
+                    tail += 1
+            if len(active) >= self.min_peers:
+                out[position] = _median(active)
+
+    def fill_many(
+        self,
+        ipos: Iterable[IpoInput],
+        as_of: Union[DateLike, Sequence[DateLike], None] = None,
+        *,
+        overwrite: bool = False,
+    ) -> List[IpoInput]:
+        """
+        Copies of ``ipos`` with ``sector_ps_multiple`` filled from the index.
+
+        ``as_of`` is one date for the whole batch or one per deal; without it
+        each group's full window up to its latest comparable is used.  Deals
+        that already carry a multiple keep it unless ``overwrite``; deals
+        without enough peers are returned unchanged.
+        """
+        ipos = list(ipos)
+        if as_of is None or isinstance(as_of, (str, date)):
+            days: List[Optional[int]] = [None if as_of is None else _as_ordinal(as_of)] * len(ipos)
+        else:
+            days = [_as_ordinal(d) for d in as_of]
+            if len(days) != len(ipos):
+                raise ValueError("as_of must have one date per deal")
+
+        pending = [
+            (i, _norm(ipo.sector), _norm(ipo.country))
+            for i, ipo in enumerate(ipos)
+            if overwrite or ipo.sector_ps_multiple is None
+        ]
+        found: Dict[int, float] = {}
+        for country_level in (True, False):
+            by_group: Dict[GroupKey, List[Tuple[int, int]]] = {}
+            for i, sector, country in pending:
+                if sector is None or i in found or (country_level and country is None):
+                    continue
+                key = (sector, country if country_level else None)
+                day = days[i]
+                if day is None:
+                    # Window ends at the group's latest comparable.
+                    group = self._groups.get(key)
+                    if group is None:
+                        continue
+                    group.sort()
+                    day = group.days[-1]
+                by_group.setdefault(key, []).append((day, i))
+            for key, queries in by_group.items():
+                self._sweep(key, queries, found)
+
+        return [
+            replace(ipo, sector_ps_multiple=found[i]) if i in found else ipo
+            for i, ipo in enumerate(ipos)
+        ]
+
+    def fill(self, ipo: IpoInput, as_of: Optional[DateLike] = None) -> IpoInput:
+        """``fill_many`` for a single deal."""
+        return self.fill_many([ipo], as_of)[0]
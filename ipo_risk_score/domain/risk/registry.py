@@ -0,0 +1,178 @@
+"""
+Model registry: versioned coefficient sets loaded from local files.
+
+Each model file is a JSON document::
+
+    {"model_version": "v2-calibrated-2024q4",
+     "coefficients": {"intercept": -0.7, "f_liq_total": 2.3, ...}}
+
+Models are validated and compiled once at load time (see ``model.py``).  A
+registry holds the compiled models plus one *active* model.  Switching the
+active model or reloading the directory replaces a single reference, so
+concurrent scorers always see either the old or the new model in full and
+never pay a reload per request.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Mapping, Optional, Tuple
+
+from .engine import compute_ipo_risk
+from .entities import IpoInput, RiskResult
+from .model import CompiledModel, compile_model
+
+MODEL_FILE_SUFFIX = ".json"
+
+
+def load_model_file(path: str) -> CompiledModel:
+    """Read, validate and compile a single model file."""
+    with open(path, encoding="utf-8") as fh:
+        try:
+            payload = json.load(fh)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Model file {path!r} is not valid JSON: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ValueError(f"Model file {path!r} must contain a JSON object")
+    try:
+        version = payload["model_version"]
+        coeffs = payload["coefficients"]
+    except KeyError as exc:
+        raise ValueError(f"Model file {path!r} is missing {exc.args[0]!r}") from None
+    if not isinstance(coeffs, dict):
+        raise ValueError(f"Model file {path!r}: 'coefficients' must be an object")
+    return compile_model(coeffs, version)
+
+
+def save_model_file(path: str, coeffs: Mapping[str, float], model_version: str) -> CompiledModel:
+    """
+    Validate ``coeffs`` (e.g. the output of ``fit_coefficients``) and write
+    them as a model file.  The file is written to a temporary name and
+    renamed into place so a registry reloading concurrently never reads a
+    partial file.
+    """
+    model = compile_model(coeffs, model_version)
+    payload = {"model_version": model.version, "coefficients": dict(model.coeffs)}
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return model
+
+
+class ModelRegistry:
+    """
+    Thread-safe collection of compiled models with one active model.
+
+    Reads (``active``, ``get``, ``score``) take no lock: they dereference a
+    single attribute that writers replace atomically.  Writers serialise on
+    an internal lock.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._models: Mapping[str, CompiledModel] = {}
+        self._active: Optional[CompiledModel] = None
+        if directory is not None:
+            self.reload()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @property
+    def active(self) -> CompiledModel:
+        model = self._active
+        if model is None:
+            raise LookupError("No active model; call activate() first")
+        return model
+
+    def get(self, version: str) -> CompiledModel:
+        try:
+            return self._models[version]
+        except KeyError:
+            raise LookupError(f"Unknown model version {version!r}") from None
+
+    def versions(self) -> Tuple[str, ...]:
+        return tuple(sorted(self._models))
+
+    def __contains__(self, version: str) -> bool:
+        return version in self._models
+
+    def score(
+        self,
+        ipo: IpoInput,
+        *,
+        version: Optional[str] = None,
+        include_attractiveness: bool = True,
+        prospectus_text: Optional[str] = None,
+    ) -> RiskResult:
+        """Score ``ipo`` with the active model (or an explicit ``version``)."""
+        model = self.get(version) if version is not None else self.active
+        return compute_ipo_risk(
+            ipo,
+            model=model,
+            include_attractiveness=include_attractiveness,
+            prospectus_text=prospectus_text,
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def register(self, model: CompiledModel, *, activate: bool = False) -> None:
+        """Add (or replace) a compiled model, optionally making it active."""
+        with self._lock:
+            models = dict(self._models)
+            models[model.version] = model
+            self._models = models
+            if activate or (self._active is not None and self._active.version == model.version):
+                self._active = model
+
+    def register_coefficients(
+        self, coeffs: Mapping[str, float], model_version: str, *, activate: bool = False
+    ) -> CompiledModel:
+        """Compile a coefficient dict and register it."""
+        model = compile_model(coeffs, model_version)
+        self.register(model, activate=activate)
+        return model
+
+    def activate(self, version: str) -> CompiledModel:
+        """Atomically switch the active model."""
+        with self._lock:
+            model = self.get(version)
+            self._active = model
+            return model
+
+    def reload(self) -> Dict[str, CompiledModel]:
+        """
+        Re-read every model file in ``directory`` and swap the whole set in.
+
+        All files are compiled before anything is swapped; if any file is
+        invalid, or the active version disappeared, the registry is left
+        unchanged and ``ValueError`` is raised.  The active model is rebound
+        to its freshly loaded version.
+        """
+        if self.directory is None:
+            raise ValueError("Registry has no directory to reload from")
+        loaded: Dict[str, CompiledModel] = {}
+        for entry in sorted(os.listdir(self.directory)):
+            if not entry.endswith(MODEL_FILE_SUFFIX):
+                continue
+            model = load_model_file(os.path.join(self.directory, entry))
+            if model.version in loaded:
+                raise ValueError(f"Duplicate model version {model.version!r} in {entry!r}")
+            loaded[model.version] = model
+
+        with self._lock:
+            active = self._active
+            if active is not None and active.version not in loaded:
+                raise ValueError(
+                    f"Reload would drop the active model {active.version!r}; "
+                    "activate another version first"
+                )
+            self._models = loaded
+            if active is not None:
+                self._active = loaded[active.version]
+        return dict(loaded)
@@ -0,0 +1,201 @@
+"""
+Top-k and threshold screening with bound-based pruning.
+
+Every feature lies in [0, 1] and the logistic link is monotone, so for a
+coefficient ``c`` the contribution ``c * f`` of a feature not yet computed
+lies between ``min(c, 0)`` and ``max(c, 0)``.  The screens first run the
+fused kernel without the prospectus text, which is cheap: validation, every
+numeric and categorical feature, and the logit without ``f_text``.  That
+gives each deal a score interval.  The text scan, which dominates the cost
+of a deal with a prospectus, runs only when the interval straddles the
+decision:
+
+* ``screen_threshold`` keeps deals whose lower bound clears the threshold
+  and drops deals whose upper bound cannot reach it, without a scan.
+* ``top_k`` visits deals in decreasing upper-bound order with a size-``k``
+  min-heap of exact scores and stops as soon as the next upper bound cannot
+  beat the heap minimum.
+
+Exact scores equal ``compute_ipo_risk`` bit for bit: ``f_text`` is last in
+``FEATURE_KEYS``, so the full logit is the text-free logit plus
+``c_text * f_text``, the same summation order as the modular path.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Iterable, List, Mapping, Optional, Tuple, Union
+
+from .entities import IpoInput
+from .features.builder import FEATURE_KEYS
+from .features.config import DEFAULT_FEATURE_CONFIG, FeatureConfig
+from .features.textual import _text_feature
+from .fused import compile_scoring_kernel
+from .logistic import COEFFS_V1, _logistic
+from .model import CompiledModel
+
+
+@dataclass(frozen=True)
+class ScreenHit:
+    """
+    One selected deal.  ``score`` is exact when the deal was fully scored
+    and ``None`` when the bounds alone selected it; ``lower``/``upper``
+    bound the score either way.
+    """
+
+    index: int
+    ipo: IpoInput
+    score: Optional[float]
+    lower: float
+    upper: float
+
+
+@dataclass
+class ScreenResult:
+    """Selected deals plus how many text scans the bounds saved."""
+
+    hits: List[ScreenHit]
+    n_deals: int
+    n_scannable: int
+    n_text_scans: int
+
+    @property
+    def n_pruned(self) -> int:
+        """Deals with weighted prospectus text decided without scanning it."""
+        return self.n_scannable - self.n_text_scans
+
+
+class _Bounds:
+    """Text-free logit and score bounds of every deal."""
+
+    def __init__(
+        self,
+        ipos: Iterable[IpoInput],
+        coeffs: Union[Mapping[str, float], CompiledModel, None],
+        validate: bool,
+        config: Optional[FeatureConfig],
+    ) -> None:
+        if isinstance(coeffs, CompiledModel):
+            coeffs = coeffs.coeffs
+        elif coeffs is None:
+            coeffs = COEFFS_V1
+        unknown = sorted(set(coeffs) - set(FEATURE_KEYS) - {"intercept"})
+        if unknown:
+            raise ValueError(f"Screening supports FEATURE_KEYS coefficients only: {unknown}")
+        self.c_text = float(coeffs.get("f_text", 0.0))
+        kernel = compile_scoring_kernel(
+            {k: v for k, v in coeffs.items() if k != "f_text"}, config or DEFAULT_FEATURE_CONFIG
+        )
+        self.ipos: List[IpoInput] = list(ipos)
+        # Logit without the text term; the kernel adds 0.0 * f_text, which
+        # leaves the sum unchanged.
+        self.base = [kernel(ipo, None, validate)[0] for ipo in self.ipos]
+        self.low_term = min(self.c_text, 0.0)
+        self.high_term = max(self.c_text, 0.0)
+        self.n_scannable = sum(1 for i in range(len(self.ipos)) if self.needs_scan(i))
+
+    def needs_scan(self, i: int) -> bool:
+        return bool(self.ipos[i].prospectus_text) and self.c_text != 0.0
+
+    def bounds(self, i: int) -> Tuple[float, float]:
+        if not self.needs_scan(i):
+            # No text (f_text is 0.5) or an unweighted one (0.0 * f_text).
+            score = 100.0 * _logistic(self.base[i] + self.c_text * 0.5)
+            return score, score
+        z = self.base[i]
+        return 100.0 * _logistic(z + self.low_term), 100.0 * _logistic(z + self.high_term)
+
+    def exact(self, i: int) -> float:
+        return 100.0 * _logistic(
+            self.base[i] + self.c_text * _text_feature(self.ipos[i].prospectus_text)
+        )
+
+
+def screen_threshold(
+    ipos: Iterable[IpoInput],
+    threshold: float,
+    *,
+    coeffs: Union[Mapping[str, float], CompiledModel, None] = None,
+    exact: bool = False,
+    validate: bool = True,
+    feature_config: Optional[FeatureConfig] = None,
+) -> ScreenResult:
+    """
+    Deals whose risk score is at least ``threshold``, in input order.
+
+    With ``exact=False`` a deal whose lower bound already clears the
+    threshold is returned without scanning its text (``score is None``);
+    ``exact=True`` scores every returned deal and only prunes rejections.
+
+    Examples
+    --------
+    >>> result = screen_threshold(ipos, 70.0)
+    >>> [hit.index for hit in result.hits]
+    """
+    b = _Bounds(ipos, coeffs, validate, feature_config)
+    hits: List[ScreenHit] = []
+    scans = 0
+    for i, ipo in enumerate(b.ipos):
+        lower, upper = b.bounds(i)
+        if upper < threshold:
+            continue
+        score: Optional[float] = lower if lower == upper else None
+        if score is None and (exact or lower < threshold):
+            score = b.exact(i)
+            scans += 1
+            if score < threshold:
+                continue
+        hits.append(ScreenHit(i, ipo, score, lower, upper))
+    return ScreenResult(hits, len(b.ipos), b.n_scannable, scans)
+
+
+def top_k(
+    ipos: Iterable[IpoInput],
+    k: int,
+    *,
+    coeffs: Union[Mapping[str, float], CompiledModel, None] = None,
+    validate: bool = True,
+    feature_config: Optional[FeatureConfig] = None,
+) -> ScreenResult:
+    """
+    The ``k`` riskiest deals, highest score first (ties: lower index first).
+
+    Every returned score is exact and the selection equals sorting all
+    ``compute_ipo_risk`` scores; deals that cannot enter are never scanned.
+
+    Examples
+    --------
+    >>> [hit.score for hit in top_k(ipos, 100).hits]
+    """
+    if k < 0:
+        raise ValueError("k must be >= 0")
+    b = _Bounds(ipos, coeffs, validate, feature_config)
+    n = len(b.ipos)
+    bounds = [b.bounds(i) for i in range(n)]
+    # Max-heap of candidates by upper bound; ties pop the lower index first.
+    candidates = [(-upper, i) for i, (_, upper) in enumerate(bounds)]
+    heapq.heapify(candidates)
+    # Min-heap of the current best k as (score, -index).
+    best: List[Tuple[float, int]] = []
+    scans = 0
+    while candidates and k:
+        neg_upper, i = candidates[0]
+        if len(best) == k and (-neg_upper, -i) < best[0]:
+            break
+        heapq.heappop(candidates)
+        lower, upper = bounds[i]
+        if lower == upper:
+            score = lower
+        else:
+            score = b.exact(i)
+            scans += 1
+        entry = (score, -i)
+        if len(best) < k:
+            heapq.heappush(best, entry)
+        elif entry > best[0]:
+            heapq.heapreplace(best, entry)
+
+    hits = [
+        ScreenHit(-neg_i, b.ipos[-neg_i], score, *bounds[-neg_i])
+        for score, neg_i in sorted(best, reverse=True)
+    ]
+    return ScreenResult(hits, n, b.n_scannable, scans)
@@ -0,0 +1,272 @@
+"""
+Compact binary serialization for ``RiskResult`` audit logs.
+
+A log is a short header followed by fixed-width rows of little-endian
+float64 values:
+
+    magic  b"IPRS"                 4 bytes
+    format version                 1 byte
+    header length                  uint32
+    header                         UTF-8 JSON: model_version, feature_names,
+                                   driver_weights (name/weight pairs)
+    row * N                        risk_score, attractiveness_percent,
+                                   raw feature values, driver contributions
+
+Feature names, the model version and the driver weights are stored once in
+the header instead of once per record.  Driver descriptions are not stored
+at all: they are regenerated from the feature value and the weight with the
+same template ``compute_ipo_risk`` uses, so a round trip reproduces the
+original ``RiskResult`` exactly.  Encoding checks every driver contribution
+against the header weight, so results scored with other coefficients are
+rejected instead of being logged under the wrong weights.  A missing
+attractiveness is encoded as NaN.
+
+Writers and readers are streaming: ``RiskResultWriter.write`` emits one row
+at a time and ``RiskResultReader`` yields results (or raw numeric rows)
+without loading the whole log into memory.
+"""
+
+import json
+import math
+import struct
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .engine import _driver_description
+from .entities import RiskDriverDomain, RiskResult
+
+MAGIC = b"IPRS"
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<4sBI")
+
+
+class LogSchema:
+    """Shared header of a binary audit log."""
+
+    def __init__(
+        self,
+        model_version: str,
+        feature_names: Sequence[str],
+        driver_weights: Dict[str, float],
+    ) -> None:
+        self.model_version = model_version
+        self.feature_names: Tuple[str, ...] = tuple(feature_names)
+        # Drivers follow feature order, exactly as ``compute_ipo_risk`` emits them.
+        self.driver_names: Tuple[str, ...] = tuple(
+            name for name in self.feature_names if name in driver_weights
+        )
+        self.driver_weights: Dict[str, float] = {
+            name: float(driver_weights[name]) for name in self.driver_names
+        }
+        self._feature_index = {name: i for i, name in enumerate(self.feature_names)}
+        self._driver_checks = tuple(
+            (name, self._feature_index[name], self.driver_weights[name])
+            for name in self.driver_names
+        )
+        self.row = struct.Struct("<" + "d" * (2 + len(self.feature_names) + len(self.driver_names)))
+
+    @classmethod
+    def for_coefficients(
+        cls, model_version: str, feature_names: Sequence[str], coeffs: Mapping[str, float]
+    ) -> "LogSchema":
+        """Build the schema for results produced by ``compute_ipo_risk(coeffs=...)``."""
+        weights = {k: v for k, v in coeffs.items() if k != "intercept"}
+        return cls(model_version, feature_names, weights)
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps(
+            {
+                "model_version": self.model_version,
+                "feature_names": list(self.feature_names),
+                "driver_weights": [[n, self.driver_weights[n]] for n in self.driver_names],
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        return _PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)) + header
+
+    @classmethod
+    def read_from(cls, stream: BinaryIO) -> "LogSchema":
+        preamble = stream.read(_PREAMBLE.size)
+        if len(preamble) != _PREAMBLE.size:
+            raise ValueError("Truncated log: missing header")
+        magic, version, length = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ValueError(f"Not a RiskResult log (magic {magic!r})")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported log format version {version}")
+        raw = stream.read(length)
+        if len(raw) != length:
+            raise ValueError("Truncated log: incomplete header")
+        header = json.loads(raw.decode("utf-8"))
+        return cls(
+            header["model_version"],
+            header["feature_names"],
+            dict((name, weight) for name, weight in header["driver_weights"]),
+        )
+
+    # ------------------------------------------------------------------
+    # Row encoding
+    # ------------------------------------------------------------------
+
+    def encode(self, result: RiskResult) -> bytes:
+        if result.model_version != self.model_version:
+            raise ValueError(
+                f"Result model_version {result.model_version!r} does not match "
+                f"log schema {self.model_version!r}"
+            )
+        features = result.raw_features
+        if len(features) != len(self.feature_names):
+            raise ValueError(
+                f"Result has features {sorted(features)}; schema expects "
+                f"{list(self.feature_names)}"
+            )
+        try:
+            values = [features[name] for name in self.feature_names]
+        except KeyError as exc:
+            raise ValueError(f"Result is missing feature {exc.args[0]!r}") from None
+        drivers = result.drivers
+        if tuple(d.name for d in drivers) != self.driver_names:
+            raise ValueError(
+                f"Result drivers {[d.name for d in drivers]} do not match "
+                f"schema drivers {list(self.driver_names)}"
+            )
+        # Descriptions are rebuilt from the header weights on read, so a
+        # result scored with other weights would come back rewritten.
+        for (name, i, weight), driver in zip(self._driver_checks, drivers):
+            if round(weight * values[i], 4) != driver.contribution_points:
+                raise ValueError(
+                    f"Result driver {name!r} contributes {driver.contribution_points!r}, "
+                    f"not weight {weight!r} * value {values[i]!r}; it was scored with "
+                    "different coefficients than the log schema"
+                )
+        attractiveness = result.attractiveness_percent
+        return self.row.pack(
+            result.risk_score,
+            math.nan if attractiveness is None else attractiveness,
+            *values,
+            *(d.contribution_points for d in drivers),
+        )
+
+    def decode(self, row: Tuple[float, ...]) -> RiskResult:
+        n_feat = len(self.feature_names)
+        values = row[2 : 2 + n_feat]
+        contributions = row[2 + n_feat :]
+        index = self._feature_index
+        drivers: List[RiskDriverDomain] = []
+        for name, points in zip(self.driver_names, contributions):
+            drivers.append(
+                RiskDriverDomain(
+                    name=name,
+                    contribution_points=points,
+                    description=_driver_description(
+                        name, values[index[name]], self.driver_weights[name]
+                    ),
+                )
+            )
+        attractiveness = row[1]
+        return RiskResult(
+            risk_score=row[0],
+            attractiveness_percent=None if math.isnan(attractiveness) else attractiveness,
+            model_version=self.model_version,
+            drivers=drivers,
+            raw_features=dict(zip(self.feature_names, values)),
+        )
+
+
+class RiskResultWriter:
+    """
+    Streaming writer: emits the schema header on construction and one
+    fixed-width row per ``write`` call.
+    """
+
+    def __init__(self, stream: BinaryIO, schema: LogSchema) -> None:
+        self._stream = stream
+        self.schema = schema
+        self.count = 0
+        stream.write(schema.to_bytes())
+
+    def write(self, result: RiskResult) -> None:
+        self._stream.write(self.schema.encode(result))
+        self.count += 1
+
+    def write_many(self, results: Iterable[RiskResult], *, chunk_rows: int = 4096) -> None:
+        """Write results in chunks of ``chunk_rows`` rows per ``stream.write`` call."""
+        encode = self.schema.encode
+        buffer: List[bytes] = []
+        for result in results:
+            buffer.append(encode(result))
+            if len(buffer) >= chunk_rows:
+                self._stream.write(b"".join(buffer))
+                self.count += len(buffer)
+                buffer.clear()
+        if buffer:
+            self._stream.write(b"".join(buffer))
+            self.count += len(buffer)
+
+
+class RiskResultReader:
+    """
+    Streaming reader over a log produced by ``RiskResultWriter``.
+
+    Iterating yields ``RiskResult`` objects; ``iter_rows`` yields the raw
+    float tuples (score, attractiveness, features..., contributions...) for
+    analytics that do not need full objects.
+    """
+
+    def __init__(self, stream: BinaryIO, *, chunk_rows: int = 4096) -> None:
+        self._stream = stream
+        self.schema = LogSchema.read_from(stream)
+        self._chunk_rows = max(1, chunk_rows)
+
+    def iter_rows(self) -> Iterator[Tuple[float, ...]]:
+        row = self.schema.row
+        chunk_size = row.size * self._chunk_rows
+        while True:
+            chunk = self._stream.read(chunk_size)
+            if not chunk:
+                return
+            if len(chunk) % row.size:
+                # A short read may still be followed by more data on pipes.
+                rest = self._stream.read(row.size - len(chunk) % row.size)
+                chunk += rest
+                if len(chunk) % row.size:
+                    raise ValueError("Truncated log: partial trailing row")
+            yield from row.iter_unpack(chunk)
+
+    def __iter__(self) -> Iterator[RiskResult]:
+        decode = self.schema.decode
+        for row in self.iter_rows():
+            yield decode(row)
+
+
+def write_results(
+    stream: BinaryIO,
+    results: Iterable[RiskResult],
+    coeffs: Mapping[str, float],
+    *,
+    schema: Optional[LogSchema] = None,
+) -> int:
+    """
+    Write ``results`` (all scored with ``coeffs``) to ``stream``.
+
+    The schema is inferred from the first result unless given.  Returns the
+    number of records written.
+    """
+    iterator = iter(results)
+    if schema is None:
+        try:
+            first = next(iterator)
+        except StopIteration:
+            return 0
+        schema = LogSchema.for_coefficients(first.model_version, list(first.raw_features), coeffs)
+        writer = RiskResultWriter(stream, schema)
+        writer.write(first)
+    else:
+        writer = RiskResultWriter(stream, schema)
+    writer.write_many(iterator)
+    return writer.count
+
+
+def read_results(stream: BinaryIO) -> List[RiskResult]:
+    """Read every record of a log into memory."""
+    return list(RiskResultReader(stream))
@@ -0,0 +1,389 @@
+"""
+Shared-memory columnar transport for multi-process scoring.
+
+Sending ``IpoInput`` objects to worker processes and ``RiskResult``s back
+pickles every dataclass, driver list and description string, which costs
+more than the scoring itself.  ``SharedBatch`` lays a batch out in a single
+``multiprocessing.shared_memory`` block instead:
+
+* the ``INPUT_COLUMNS`` of ``columnar.py`` as float64 columns (NaN marks a
+  missing sector multiple);
+* the ``OUTPUT_COLUMNS`` (risk score, then every feature) as float64;
+* one uint8 ``status`` per row (``STATUS_PENDING`` / ``STATUS_OK`` /
+  ``STATUS_INVALID``).
+
+``score_shared`` sends each worker a ``(block name, rows, start, stop)``
+task; the worker attaches to the block, scores its slice in place through
+the columnar feature path and returns the slice's invalid-row count.  Only
+those few integers cross the process boundary.
+
+Prospectus text is not transported (``f_text`` stays neutral, as in
+``score_columns``); scores equal ``compute_ipo_risk`` for deals without
+text.
+"""
+
+import math
+import os
+import sys
+import threading
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .columnar import FEATURE_COLUMNS, OPTIONAL_COLUMNS, REQUIRED_COLUMNS, _iter_feature_rows
+from .engine import MODEL_VERSION, _build_drivers
+from .entities import IpoInput, RiskResult
+from .features.builder import _reject_text_engine_weights
+from .logistic import COEFFS_V1, _logistic
+from .validators import ValidationError
+
+INPUT_COLUMNS: Tuple[str, ...] = REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+OUTPUT_COLUMNS: Tuple[str, ...] = ("risk_score",) + FEATURE_COLUMNS
+
+STATUS_PENDING = 0
+STATUS_OK = 1
+STATUS_INVALID = 2
+
+DEFAULT_CHUNK_ROWS = 16384
+
+# (block name, rows): everything a worker needs to attach.
+Handle = Tuple[str, int]
+
+_WIDTH = 8
+_N_COLUMNS = len(INPUT_COLUMNS) + len(OUTPUT_COLUMNS)
+
+
+def _block_size(n_rows: int) -> int:
+    return max(1, n_rows * (_N_COLUMNS * _WIDTH + 1))
+
+
+# Serialises the temporary ``resource_tracker.register`` swap below, so two
+# threads attaching at once cannot leave the no-op installed.
+_register_lock = threading.Lock()
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    Open an existing block without registering it with the resource tracker.
+
+    Before Python 3.13 attaching registers the block, and a worker forked
+    before the owner's tracker started gets a tracker of its own that
+    unlinks the block when the worker exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    with _register_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None  # type: ignore[assignment]
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register  # type: ignore[assignment]
+
+
+class SharedBatch:
+    """
+    A batch of deals and their results in one shared-memory block.
+
+    The creating process owns the block and must ``unlink`` it (the context
+    manager does); other processes ``attach`` with ``handle``.  Column
+    views are valid until ``close``.
+
+    Examples
+    --------
+    >>> with SharedBatch.from_ipos(ipos) as batch:
+    ...     n_invalid = score_shared(batch, COEFFS_V1, workers=8)
+    ...     scores = batch.column("risk_score")      # float64 memoryview
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, n_rows: int, *, owner: bool) -> None:
+        self._shm = shm
+        self.n_rows = n_rows
+        self.owner = owner
+        buf = shm.buf
+        self._views: Dict[str, memoryview] = {}
+        offset = 0
+        for name in INPUT_COLUMNS + OUTPUT_COLUMNS:
+            end = offset + n_rows * _WIDTH
+            self._views[name] = buf[offset:end].cast("d")
+            offset = end
+        self._views["status"] = buf[offset : offset + n_rows].cast("B")
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def create(cls, n_rows: int) -> "SharedBatch":
+        """Allocate an uninitialised batch of ``n_rows`` rows."""
+        if n_rows < 0:
+            raise ValueError("n_rows must be >= 0")
+        shm = shared_memory.SharedMemory(create=True, size=_block_size(n_rows))
+        batch = cls(shm, n_rows, owner=True)
+        batch.status[:] = bytes(n_rows)
+        return batch
+
+    @classmethod
+    def attach(cls, handle: Handle) -> "SharedBatch":
+        name, n_rows = handle
+        return cls(_attach_untracked(name), n_rows, owner=False)
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "SharedBatch":
+        """Copy ``score_columns``-style columns into a new batch."""
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"missing required columns: {', '.join(missing)}")
+        n_rows = len(columns[REQUIRED_COLUMNS[0]])
+        batch = cls.create(n_rows)
+        try:
+            for name in INPUT_COLUMNS:
+                if name not in columns:
+                    batch._views[name][:] = array("d", [math.nan]) * n_rows
+                    continue
+                values = columns[name]
+                view = values if isinstance(values, memoryview) else None
+                if view is None and not isinstance(values, (list, tuple)):
+                    try:
+                        view = memoryview(values)
+                    except TypeError:
+                        pass
+                if view is None or view.format != "d" or view.ndim != 1:
+                    # Copy element-wise into float64 (ints, bools, lists).
+                    values = array("d", values)
+                if len(values) != n_rows:
+                    raise ValueError(
+                        f"column {name!r} has {len(values)} rows; expected {n_rows} "
+                        f"(from {REQUIRED_COLUMNS[0]!r})"
+                    )
+                batch._views[name][:] = values
+        except BaseException:
+            batch.close()
+            batch.unlink()
+            raise
+        return batch
+
+    @classmethod
+    def from_ipos(cls, ipos: Iterable[IpoInput]) -> "SharedBatch":
+        """Lay out ``IpoInput``s column-wise; ``prospectus_text`` is not carried."""
+        ipos = list(ipos)
+        columns: Dict[str, array] = {name: array("d") for name in INPUT_COLUMNS}
+        appenders = [columns[name].append for name in INPUT_COLUMNS]
+        for ipo in ipos:
+            deal = ipo.deal_terms
+            fin = ipo.financials
+            ps = ipo.sector_ps_multiple
+            row = (
+                deal.price_low,
+                deal.price_high,
+                deal.offer_shares,
+                deal.free_float_pct,
+                deal.lockup_days,
+                fin.revenue_ttm,
+                fin.gross_margin,
+                fin.net_margin,
+                fin.growth_yoy,
+                ipo.underwriter_tier,
+                ipo.auditor_is_big4,
+                ipo.sector_cyclicality,
+                ipo.region_risk_tier,
+                math.nan if ps is None else ps,
+            )
+            for append, value in zip(appenders, row):
+                append(value)
+        return cls.from_columns(columns)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    @property
+    def handle(self) -> Handle:
+        return self._shm.name, self.n_rows
+
+    @property
+    def status(self) -> memoryview:
+        return self._views["status"]
+
+    def column(self, name: str) -> memoryview:
+        """Zero-copy float64 view of an input or output column."""
+        try:
+            return self._views[name]
+        except KeyError:
+            raise KeyError(f"unknown column {name!r}") from None
+
+    def input_columns(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, memoryview]:
+        """Input column views of rows ``start:stop``, ready for ``score_columns``."""
+        return {name: self._views[name][start:stop] for name in INPUT_COLUMNS}
+
+    def invalid_rows(self) -> List[int]:
+        return [i for i, status in enumerate(self.status) if status == STATUS_INVALID]
+
+    def results(
+        self,
+        coeffs: Optional[Mapping[str, float]] = None,
+        *,
+        model_version: Optional[str] = None,
+    ) -> List[Optional[RiskResult]]:
+        """
+        ``RiskResult`` per row (``None`` unless scored successfully).
+
+        Pass the coefficients the batch was scored with; they only shape
+        the driver breakdown.
+        """
+        coeffs_to_use = coeffs if coeffs is not None else COEFFS_V1
+        version = model_version if model_version is not None else MODEL_VERSION
+        scores = self._views["risk_score"]
+        features = [self._views[name] for name in FEATURE_COLUMNS]
+        out: List[Optional[RiskResult]] = []
+        for i, status in enumerate(self.status):
+            if status != STATUS_OK:
+                out.append(None)
+                continue
+            values = dict(zip(FEATURE_COLUMNS, (column[i] for column in features)))
+            risk = scores[i]
+            out.append(
+                RiskResult(
+                    risk_score=risk,
+                    attractiveness_percent=100.0 - risk,
+                    model_version=version,
+                    drivers=_build_drivers(values, coeffs_to_use),
+                    raw_features=values,
+                )
+            )
+        return out
+
+    # ------------------------------------------------------------------
+    # Lifetime
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Release this process's mapping (the block outlives it until ``unlink``)."""
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        self._shm.close()
+
+    def unlink(self) -> None:
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedBatch":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        self.unlink()
+
+
+# Worker-side attachment, reused while tasks keep naming the same block.
+# Only a process's main thread (where process-pool workers run tasks) uses
+# it; see ``_score_task``.
+_attached: Optional[SharedBatch] = None
+
+
+def _attach(handle: Handle) -> SharedBatch:
+    global _attached
+    if _attached is None or _attached.handle != handle:
+        if _attached is not None:
+            _attached.close()
+        _attached = SharedBatch.attach(handle)
+    return _attached
+
+
+def _score_slice(
+    batch: SharedBatch,
+    start: int,
+    stop: int,
+    intercept: float,
+    weights: Tuple[float, ...],
+    validate: bool,
+) -> int:
+    """Score rows ``start:stop`` in place; return the number of invalid rows."""
+    status = batch.status
+    scores = batch.column("risk_score")
+    outputs = [batch.column(name) for name in FEATURE_COLUMNS]
+    invalid: List[int] = []
+
+    def on_error(row: int, exc: ValidationError) -> None:
+        status[start + row] = STATUS_INVALID
+        invalid.append(row)
+
+    i = start
+    rows = _iter_feature_rows(
+        batch.input_columns(start, stop), validate=validate, on_error=on_error
+    )
+    for row in rows:
+        while status[i] == STATUS_INVALID:
+            i += 1
+        z = intercept
+        for w, value, column in zip(weights, row, outputs):
+            z += w * value
+            column[i] = value
+        scores[i] = 100.0 * _logistic(z)
+        status[i] = STATUS_OK
+        i += 1
+    return len(invalid)
+
+
+def _score_task(
+    handle: Handle,
+    start: int,
+    stop: int,
+    intercept: float,
+    weights: Tuple[float, ...],
+    validate: bool,
+) -> int:
+    if threading.current_thread() is threading.main_thread():
+        return _score_slice(_attach(handle), start, stop, intercept, weights, validate)
+    # On a thread pool a shared cache would let one thread close the block
+    # another is scoring, so each task maps the block for itself.
+    batch = SharedBatch.attach(handle)
+    try:
+        return _score_slice(batch, start, stop, intercept, weights, validate)
+    finally:
+        batch.close()
+
+
+def score_shared(
+    batch: SharedBatch,
+    coeffs: Optional[Mapping[str, float]] = None,
+    *,
+    executor: Optional[Executor] = None,
+    workers: Optional[int] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    validate: bool = True,
+) -> int:
+    """
+    Score every row of ``batch`` in place and return the invalid-row count.
+
+    Rows are split into ``chunk_rows`` slices and scored by ``executor``
+    (a process pool, reused across calls; a thread pool also works) or by
+    a temporary pool of ``workers`` processes; ``workers=0`` scores in this
+    process.  Invalid rows get ``STATUS_INVALID``; ``score_columns`` on the
+    row reproduces the message.
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be >= 1")
+    coeffs_to_use = coeffs if coeffs is not None else COEFFS_V1
+    _reject_text_engine_weights(coeffs_to_use, "score_shared")
+    intercept = float(coeffs_to_use.get("intercept", 0.0))
+    weights = tuple(float(coeffs_to_use.get(name, 0.0)) for name in FEATURE_COLUMNS)
+    slices = [(s, min(s + chunk_rows, batch.n_rows)) for s in range(0, batch.n_rows, chunk_rows)]
+    for start, stop in slices:
+        batch.status[start:stop] = bytes(stop - start)
+
+    if executor is None and workers == 0:
+        return sum(_score_slice(batch, s, e, intercept, weights, validate) for s, e in slices)
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+    try:
+        futures = [
+            pool.submit(_score_task, batch.handle, s, e, intercept, weights, validate)
+            for s, e in slices
+        ]
+        return sum(future.result() for future in futures)
+    finally:
+        if executor is None:
+            pool.shutdown()
@@ -1,5 +1,6 @@
 import math
 import re
+from typing import Optional
 
 from .entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
 
@@ -47,29 +48,39 @@ def _reject_control_chars(label: str, value: str) -> None:
 
 
 def _validate_identity_strings(ipo: IpoInput) -> None:
-    if ipo.ticker:
-        if len(ipo.ticker) > MAX_TICKER_LENGTH:
+    _validate_identity_values(ipo.ticker, ipo.company_name, ipo.country, ipo.sector)
+
+
+def _validate_identity_values(
+    ticker: Optional[str],
+    company_name: Optional[str],
+    country: Optional[str],
+    sector: Optional[str],
+) -> None:
+    """Scalar form of ``_validate_identity_strings``, shared with the batch loader."""
+    if ticker:
+        if len(ticker) > MAX_TICKER_LENGTH:
             raise ValidationError(f"ticker is too long (>{MAX_TICKER_LENGTH} characters)")
-        if not TICKER_PATTERN.match(ipo.ticker):
+        if not TICKER_PATTERN.match(ticker):
             raise ValidationError("ticker contains invalid characters; only [A-Z0-9.-] are allowed")
-        _reject_control_chars("ticker", ipo.ticker)
+        _reject_control_chars("ticker", ticker)
 
-    if ipo.company_name:
-        if len(ipo.company_name) > MAX_COMPANY_NAME_LENGTH:
+    if company_name:
+        if len(company_name) > MAX_COMPANY_NAME_LENGTH:
             raise ValidationError(
                 f"company_name is too long (>{MAX_COMPANY_NAME_LENGTH} characters)"
             )
-        _reject_control_chars("company_name", ipo.company_name)
+        _reject_control_chars("company_name", company_name)
 
-    if ipo.country:
-        if len(ipo.country) > MAX_COUNTRY_LENGTH:
+    if country:
+        if len(country) > MAX_COUNTRY_LENGTH:
             raise ValidationError(f"country is too long (>{MAX_COUNTRY_LENGTH} characters)")
-        _reject_control_chars("country", ipo.country)
+        _reject_control_chars("country", country)
 
-    if ipo.sector:
-        if len(ipo.sector) > MAX_SECTOR_LENGTH:
+    if sector:
+        if len(sector) > MAX_SECTOR_LENGTH:
             raise ValidationError(f"sector is too long (>{MAX_SECTOR_LENGTH} characters)")
-        _reject_control_chars("sector", ipo.sector)
+        _reject_control_chars("sector", sector)
 
 
 # ---------------------------------------------------------------------------
@@ -78,75 +89,110 @@ def _validate_identity_strings(ipo: IpoInput) -> None:
 
 
 def _validate_deal_terms(deal: DealTermsDomain) -> None:
-    if deal.price_low <= 0 or deal.price_high <= 0:
+    _validate_deal_values(
+        deal.price_low, deal.price_high, deal.offer_shares, deal.free_float_pct, deal.lockup_days
+    )
+
+
+def _validate_deal_values(
+    price_low: float,
+    price_high: float,
+    offer_shares: int,
+    free_float_pct: float,
+    lockup_days: int,
+) -> None:
+    """Scalar form of ``_validate_deal_terms``, shared with the columnar path."""
+    if price_low <= 0 or price_high <= 0:
         raise ValidationError("price_low and price_high must be > 0")
 
-    if deal.price_high < deal.price_low:
+    if price_high < price_low:
         raise ValidationError("price_high must be >= price_low")
 
-    if deal.price_low > MAX_PRICE or deal.price_high > MAX_PRICE:
+    if price_low > MAX_PRICE or price_high > MAX_PRICE:
         raise ValidationError(f"price_low/price_high look unrealistic (> {MAX_PRICE})")
 
-    if deal.offer_shares <= 0:
+    if offer_shares <= 0:
         raise ValidationError("offer_shares must be > 0")
 
-    if deal.offer_shares > MAX_OFFER_SHARES:
+    if offer_shares > MAX_OFFER_SHARES:
         raise ValidationError(f"offer_shares looks unrealistic (> {MAX_OFFER_SHARES})")
 
-    if not (0.0 <= deal.free_float_pct <= 100.0):
+    if not (0.0 <= free_float_pct <= 100.0):
         raise ValidationError("free_float_pct must be in [0, 100]")
 
-    if deal.lockup_days < 0:
+    if lockup_days < 0:
         raise ValidationError("lockup_days must be >= 0")
 
     for name, value in [
-        ("price_low", deal.price_low),
-        ("price_high", deal.price_high),
-        ("free_float_pct", deal.free_float_pct),
+        ("price_low", price_low),
+        ("price_high", price_high),
+        ("free_float_pct", free_float_pct),
     ]:
         _ensure_finite(name, value)
 
 
 def _validate_financials(fin: FinancialSnapshotDomain) -> None:
-    if fin.revenue_ttm < 0:
+    _validate_financial_values(fin.revenue_ttm, fin.gross_margin, fin.net_margin, fin.growth_yoy)
+
+
+def _validate_financial_values(
+    revenue_ttm: float, gross_margin: float, net_margin: float, growth_yoy: float
+) -> None:
+    """Scalar form of ``_validate_financials``, shared with the columnar path."""
+    if revenue_ttm < 0:
         raise ValidationError("revenue_ttm must be >= 0")
 
-    if fin.revenue_ttm > MAX_REVENUE:
+    if revenue_ttm > MAX_REVENUE:
         raise ValidationError(f"revenue_ttm looks unrealistic (> {MAX_REVENUE})")
 
     for name, value in [
-        ("revenue_ttm", fin.revenue_ttm),
-        ("gross_margin", fin.gross_margin),
-        ("net_margin", fin.net_margin),
-        ("growth_yoy", fin.growth_yoy),
+        ("revenue_ttm", revenue_ttm),
+        ("gross_margin", gross_margin),
+        ("net_margin", net_margin),
+        ("growth_yoy", growth_yoy),
     ]:
         _ensure_finite(name, value)
 
     # Optional soft bounds for margins and growth.
-    if not (-100.0 <= fin.gross_margin <= 100.0):
+    if not (-100.0 <= gross_margin <= 100.0):
         raise ValidationError("gross_margin looks out of bounds (-100, 100)")
 
-    if not (-100.0 <= fin.net_margin <= 100.0):
+    if not (-100.0 <= net_margin <= 100.0):
         raise ValidationError("net_margin looks out of bounds (-100, 100)")
 
-    if not (-100.0 <= fin.growth_yoy <= 300.0):
+    if not (-100.0 <= growth_yoy <= 300.0):
         raise ValidationError("growth_yoy looks out of bounds (-100, 300)")
 
 
 def _validate_categorical(ipo: IpoInput) -> None:
-    if not (1 <= ipo.underwriter_tier <= 5):
+    _validate_categorical_values(
+        ipo.underwriter_tier,
+        ipo.sector_cyclicality,
+        ipo.region_risk_tier,
+        ipo.sector_ps_multiple,
+    )
+
+
+def _validate_categorical_values(
+    underwriter_tier: int,
+    sector_cyclicality: int,
+    region_risk_tier: int,
+    sector_ps_multiple: Optional[float],
+) -> None:
+    """Scalar form of ``_validate_categorical``, shared with the columnar path."""
+    if not (1 <= underwriter_tier <= 5):
         raise ValidationError("underwriter_tier must be in [1, 5]")
 
-    if ipo.sector_cyclicality not in (0, 1, 2):
+    if sector_cyclicality not in (0, 1, 2):
         raise ValidationError("sector_cyclicality must be in {0, 1, 2}")
 
-    if ipo.region_risk_tier not in (0, 1, 2):
+    if region_risk_tier not in (0, 1, 2):
         raise ValidationError("region_risk_tier must be in {0, 1, 2}")
 
     # Validate sector price-to-sales multiple if provided
-    if ipo.sector_ps_multiple is not None:
-        _ensure_finite("sector_ps_multiple", ipo.sector_ps_multiple)
-        if ipo.sector_ps_multiple <= 0:
+    if sector_ps_multiple is not None:
+        _ensure_finite("sector_ps_multiple", sector_ps_multiple)
+        if sector_ps_multiple <= 0:
             raise ValidationError("sector_ps_multiple must be > 0")
 
 
@@ -0,0 +1,72 @@
+import random
+from typing import Callable, Optional, Sequence
+
+import pytest
+
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+
+
+def random_ipo(
+    rng: random.Random,
+    *,
+    texts: Sequence[Optional[str]] = (None,),
+    identity: bool = False,
+    wide: bool = False,
+) -> IpoInput:
+    """
+    A random valid deal drawn from ``rng``.
+
+    ``texts`` are the prospectus texts to choose from; ``identity`` fills the
+    ticker, country and sector; ``wide`` spreads every input over its whole
+    valid range, edge values included, to reach every feature branch.
+    """
+    if wide:
+        deal_terms = DealTermsDomain(
+            price_low=rng.uniform(1.0, 50.0),
+            price_high=rng.uniform(50.0, 60.0),
+            offer_shares=rng.randint(1, 100_000_000),
+            free_float_pct=rng.choice([0.0, 100.0, rng.uniform(0.0, 100.0)]),
+            lockup_days=rng.choice([0, 90, 180, 720]),
+        )
+        financials = FinancialSnapshotDomain(
+            revenue_ttm=rng.choice([0.0, rng.uniform(1e3, 1e10)]),
+            gross_margin=rng.uniform(-100.0, 100.0),
+            net_margin=rng.choice([0.0, 20.0, rng.uniform(-100.0, 100.0)]),
+            growth_yoy=rng.choice([0.0, 50.0, rng.uniform(-100.0, 300.0)]),
+        )
+        sector_ps_multiple = rng.choice([None, rng.uniform(0.5, 20.0)])
+    else:
+        deal_terms = DealTermsDomain(
+            price_low=10.0,
+            price_high=10.0 + rng.random() * 4,
+            offer_shares=rng.randint(100_000, 50_000_000),
+            free_float_pct=rng.uniform(0.0, 100.0),
+            lockup_days=rng.randint(0, 400),
+        )
+        financials = FinancialSnapshotDomain(
+            revenue_ttm=rng.choice([0.0, rng.uniform(1e5, 1e9)]),
+            gross_margin=20.0,
+            net_margin=rng.uniform(-60.0, 40.0),
+            growth_yoy=rng.uniform(-50.0, 150.0),
+        )
+        sector_ps_multiple = rng.choice([None, 3.0])
+    return IpoInput(
+        ticker=rng.choice([None, "AAA", "BBB", "CCC.A"]) if identity else None,
+        company_name=rng.choice([None, "Example Corp"]) if identity else None,
+        country=rng.choice(["US", "ES", "DE"]) if identity else None,
+        sector=rng.choice(["Tech", "Energy"]) if identity else None,
+        deal_terms=deal_terms,
+        financials=financials,
+        underwriter_tier=rng.randint(1, 5),
+        auditor_is_big4=rng.random() < 0.5,
+        sector_cyclicality=rng.randint(0, 2),
+        region_risk_tier=rng.randint(0, 2),
+        sector_ps_multiple=sector_ps_multiple,
+        prospectus_text=rng.choice(texts),
+    )
+
+
+@pytest.fixture(scope="session")
+def make_ipo() -> Callable[..., IpoInput]:
+    """``random_ipo``, usable from tests and module-scoped fixtures."""
+    return random_ipo
@@ -0,0 +1,92 @@
+import pytest
+
+from ipo_risk_score.domain.risk.aggregation import RiskAggregator, ScoreHistogram
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+
+
+def _make_ipo(sector: str, country: str, free_float_pct: float, underwriter_tier: int) -> IpoInput:
+    return IpoInput(
+        ticker=None,
+        company_name=None,
+        country=country,
+        sector=sector,
+        deal_terms=DealTermsDomain(
+            price_low=10.0,
+            price_high=10.0,
+            offer_shares=1_000_000,
+            free_float_pct=free_float_pct,
+            lockup_days=180,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=10_000_000.0,
+            gross_margin=30.0,
+            net_margin=10.0,
+            growth_yoy=20.0,
+        ),
+        underwriter_tier=underwriter_tier,
+        auditor_is_big4=True,
+        sector_cyclicality=1,
+        region_risk_tier=1,
+        sector_ps_multiple=2.0,
+    )
+
+
+def test_histogram_quantiles_track_inserts_and_removals():
+    hist = ScoreHistogram(bins=100)
+    for score in range(100):
+        hist.add(score + 0.5)
+    assert hist.quantile(0.5) == pytest.approx(49.5)
+    assert hist.quantile(0.0) == pytest.approx(0.5)
+    assert hist.quantile(1.0) == pytest.approx(99.5)
+
+    for score in range(50):
+        hist.remove(score + 0.5)
+    assert hist.quantile(0.0) == pytest.approx(50.5)
+
+
+def test_aggregator_matches_full_regroup_after_updates():
+    deals = {
+        "A": _make_ipo("Tech", "US", 10.0, 1),
+        "B": _make_ipo("Tech", "HK", 50.0, 4),
+        "C": _make_ipo("Energy", "US", 80.0, 2),
+    }
+    agg = RiskAggregator()
+    for deal_id, ipo in deals.items():
+        agg.add(deal_id, ipo, compute_ipo_risk(ipo))
+
+    # Rescore B into a different sector and drop C.
+    deals["B"] = _make_ipo("Energy", "HK", 20.0, 5)
+    agg.update("B", deals["B"], compute_ipo_risk(deals["B"]))
+    agg.remove("C")
+    del deals["C"]
+
+    scores = {k: compute_ipo_risk(v).risk_score for k, v in deals.items()}
+    assert len(agg) == 2
+    tech = agg.summary("sector", "Tech")
+    assert tech.count == 1
+    assert tech.mean_score == pytest.approx(scores["A"])
+    energy = agg.summary("sector", "Energy")
+    assert energy.count == 1
+    assert energy.mean_score == pytest.approx(scores["B"])
+    assert set(agg.groups("country")) == {"US", "HK"}
+    assert set(agg.groups("underwriter_tier")) == {1, 5}
+    assert agg.overall().mean_score == pytest.approx(sum(scores.values()) / 2)
+
+    expected_liq = sum(
+        d.contribution_points
+        for ipo in deals.values()
+        for d in compute_ipo_risk(ipo).drivers
+        if d.name == "f_liq_total"
+    )
+    assert agg.overall().driver_totals["f_liq_total"] == pytest.approx(expected_liq)
+
+
+def test_aggregator_rejects_duplicate_and_unknown_deals():
+    ipo = _make_ipo("Tech", "US", 30.0, 3)
+    agg = RiskAggregator()
+    agg.add("X", ipo, compute_ipo_risk(ipo))
+    with pytest.raises(KeyError):
+        agg.add("X", ipo, compute_ipo_risk(ipo))
+    with pytest.raises(KeyError):
+        agg.remove("missing")
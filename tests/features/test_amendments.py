@@ -0,0 +1,63 @@
+import random
+
+from ipo_risk_score.domain.risk import FilingHistory
+from ipo_risk_score.domain.risk.features.textual import (
+    NEGATIVE_WORDS,
+    POSITIVE_WORDS,
+    _text_feature,
+)
+
+_VOCAB = sorted(POSITIVE_WORDS | NEGATIVE_WORDS) + ["the", "company", "shares", "ÄÖ", "2024"]
+
+
+def _paragraph(rng: random.Random) -> str:
+    lines = []
+    for _ in range(rng.randint(1, 3)):
+        words = [rng.choice(_VOCAB) for _ in range(rng.randint(0, 12))]
+        lines.append(" ".join(w.upper() if rng.random() < 0.1 else w for w in words) + ".")
+    return "\n".join(lines)
+
+
+def _filing(paragraphs) -> str:
+    return "\n\n".join(paragraphs) + "\n"
+
+
+def test_amendments_match_full_rescan():
+    rng = random.Random(45)
+    paragraphs = [_paragraph(rng) for _ in range(60)]
+    history = FilingHistory()
+    first = history.add(_filing(paragraphs), form="S-1")
+    assert first.f_text == _text_feature(_filing(paragraphs))
+    assert first.n_rescanned == len(set(paragraphs))
+
+    for _ in range(5):
+        for _ in range(rng.randint(1, 4)):
+            paragraphs[rng.randrange(len(paragraphs))] = _paragraph(rng)
+        del paragraphs[rng.randrange(len(paragraphs))]
+        paragraphs.insert(rng.randrange(len(paragraphs)), _paragraph(rng))
+        text = _filing(paragraphs)
+        update = history.add(text, form="S-1/A")
+        assert update.f_text == _text_feature(text)
+        assert update.n_rescanned <= 6
+        assert update.n_reused == update.n_paragraphs - update.n_rescanned
+    assert history.f_text() == _text_feature(_filing(paragraphs))
+    assert [f.form for f in history.filings] == ["S-1"] + ["S-1/A"] * 5
+
+
+def test_unchanged_amendment_rescans_nothing_and_streams():
+    text = "RISK FACTORS\n\nDemand could decline.\nLoss is possible.\n\n\n  \nStrong growth.\n"
+    history = FilingHistory()
+    history.add(text)
+    chunks = [text[i : i + 5] for i in range(0, len(text), 5)]
+    update = history.add(iter(chunks))
+    assert update.n_paragraphs == 3
+    assert update.n_rescanned == 0 and update.n_removed == 0
+    assert history.features() == {"f_text": _text_feature(text)}
+
+
+def test_empty_history_and_empty_filing_are_neutral():
+    history = FilingHistory()
+    assert history.latest is None
+    assert history.f_text() == 0.5
+    update = history.add("")
+    assert update.n_paragraphs == 0 and update.f_text == 0.5
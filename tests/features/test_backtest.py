@@ -0,0 +1,123 @@
+from datetime import date, timedelta
+
+import pytest
+
+from ipo_risk_score.domain.risk.backtest import (
+    BacktestSample,
+    FeatureCache,
+    compute_metrics,
+    evaluate,
+    roc_auc,
+    walk_forward,
+)
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.logistic import COEFFS_V1
+
+
+def _make_ipo(i: int) -> IpoInput:
+    return IpoInput(
+        ticker=None,
+        company_name=None,
+        country=None,
+        sector=None,
+        deal_terms=DealTermsDomain(
+            price_low=5.0,
+            price_high=6.0,
+            offer_shares=1_000_000,
+            free_float_pct=float(5 + (i * 17) % 90),
+            lockup_days=(i * 29) % 200,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=5_000_000.0,
+            gross_margin=30.0,
+            net_margin=float(-5 + (i * 7) % 30),
+            growth_yoy=float((i * 11) % 60),
+        ),
+        underwriter_tier=1 + i % 5,
+        auditor_is_big4=bool(i % 2),
+        sector_cyclicality=i % 3,
+        region_risk_tier=(i // 3) % 3,
+        sector_ps_multiple=2.0,
+    )
+
+
+def _samples(n: int):
+    ipos = [_make_ipo(i) for i in range(n)]
+    scores = [compute_ipo_risk(ipo).risk_score for ipo in ipos]
+    median = sorted(scores)[n // 2]
+    out = []
+    for i, (ipo, score) in enumerate(zip(ipos, scores)):
+        # Deterministic labels correlated with the model score, plus some noise.
+        outcome = int((score >= median) != (i % 7 == 0))
+        out.append(BacktestSample(ipo, outcome, date(2005, 1, 1) + timedelta(days=15 * i)))
+    return out
+
+
+def _mean_rate_fit(rows, outcomes, names):
+    """Picklable stand-in for a fitter: COEFFS_V1 with a window-specific intercept."""
+    coeffs = dict(COEFFS_V1)
+    coeffs["intercept"] = -3.0 + sum(outcomes) / len(outcomes)
+    return coeffs
+
+
+def test_auc_handles_ties_and_degenerate_labels():
+    assert roc_auc([0.1, 0.4, 0.35, 0.8], [0, 0, 1, 1]) == pytest.approx(0.75)
+    assert roc_auc([0.5, 0.5], [0, 1]) == pytest.approx(0.5)
+    assert roc_auc([0.2, 0.3], [1, 1]) is None
+
+
+def test_metrics_on_perfect_predictions():
+    metrics = compute_metrics([0.0, 0.0, 1.0, 1.0], [0, 0, 1, 1])
+    assert metrics.auc == 1.0
+    assert metrics.brier == 0.0
+    assert metrics.log_loss < 1e-10
+    assert sum(b.count for b in metrics.calibration) == 4
+
+
+def test_evaluate_matches_engine_scores():
+    samples = _samples(80)
+    cache = FeatureCache(samples)
+    probs = cache.predict(COEFFS_V1)
+    expected = sorted(samples, key=lambda s: s.listing_date)
+    for p, s in zip(probs, expected):
+        assert 100.0 * p == pytest.approx(compute_ipo_risk(s.ipo).risk_score)
+    metrics = evaluate(samples, cache=cache)
+    assert metrics.n == 80
+    assert metrics.auc > 0.7
+    assert metrics.decile_lift[0] > 1.0
+
+
+@pytest.mark.parametrize("train_window", [None, timedelta(days=365 * 2)])
+def test_walk_forward_windows_cover_test_period(train_window):
+    samples = _samples(200)
+    results = walk_forward(
+        samples,
+        test_window=timedelta(days=365),
+        train_window=train_window,
+        fit=_mean_rate_fit,
+        min_train=10,
+    )
+    assert results
+    for r in results:
+        assert r.test_end - r.test_start == timedelta(days=365)
+        assert r.n_train >= 10
+        assert r.coeffs["intercept"] != COEFFS_V1["intercept"]
+    if train_window is None:
+        assert all(a.n_train < b.n_train for a, b in zip(results, results[1:]))
+
+
+def test_walk_forward_parallel_matches_sequential():
+    samples = _samples(150)
+    cache = FeatureCache(samples)
+    kwargs = dict(test_window=timedelta(days=300), fit=_mean_rate_fit, min_train=10, cache=cache)
+    sequential = walk_forward(samples, n_jobs=1, **kwargs)
+    parallel = walk_forward(samples, n_jobs=2, **kwargs)
+    assert [r.coeffs for r in sequential] == [r.coeffs for r in parallel]
+    assert [r.metrics.brier for r in sequential] == [r.metrics.brier for r in parallel]
+
+
+def test_walk_forward_without_refit_uses_fixed_coefficients():
+    samples = _samples(60)
+    results = walk_forward(samples, test_window=timedelta(days=180), refit=False)
+    assert results and all(r.coeffs == COEFFS_V1 for r in results)
@@ -0,0 +1,118 @@
+import math
+import random
+
+import pytest
+
+from ipo_risk_score.domain.risk.batch import EncodedBatch
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import IpoInput
+from ipo_risk_score.domain.risk.features import build_feature_vector
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE
+from ipo_risk_score.domain.risk.validators import ValidationError
+
+TEXTS = [None, "Strong growth and robust profit.", "Risk of loss; volatile and uncertain demand."]
+
+
+def _record(ipo: IpoInput) -> dict:
+    record = {k: getattr(ipo, k) for k in ("ticker", "company_name", "country", "sector")}
+    record.update(vars(ipo.deal_terms))
+    record.update(vars(ipo.financials))
+    for k in (
+        "underwriter_tier",
+        "auditor_is_big4",
+        "sector_cyclicality",
+        "region_risk_tier",
+        "sector_ps_multiple",
+        "prospectus_text",
+    ):
+        record[k] = getattr(ipo, k)
+    return record
+
+
+@pytest.fixture(scope="module")
+def ipos(make_ipo):
+    rng = random.Random(11)
+    return [make_ipo(rng, texts=TEXTS, identity=True) for _ in range(400)]
+
+
+def test_scores_and_features_match_modular_path(ipos):
+    batch = EncodedBatch.from_ipos(ipos)
+    assert list(batch.score()) == [compute_ipo_risk(ipo).risk_score for ipo in ipos]
+    tex = batch.score(COEFFS_TEX_EXAMPLE)
+    expected = [compute_ipo_risk(ipo, coeffs=COEFFS_TEX_EXAMPLE).risk_score for ipo in ipos]
+    assert list(tex) == expected
+
+    columns = batch.build_features()
+    for row, ipo in enumerate(ipos[:50]):
+        expected = build_feature_vector(ipo, ipo.prospectus_text)
+        assert {name: col[row] for name, col in columns.items()} == expected
+
+
+def test_dictionary_encoding_deduplicates(ipos):
+    batch = EncodedBatch.from_ipos(ipos)
+    assert len(batch) == len(ipos)
+    assert len(batch.strings["country"]) == 3
+    assert len(batch.strings["ticker"]) == 3
+    assert len(batch.texts) == 2
+    assert len(batch.categories) <= 5 * 2 * 3 * 3
+    assert len(batch.category_features()) == len(batch.categories)
+    # Interned: every row shares one object per distinct string.
+    assert batch.ipo(0).country is batch.strings["country"].values[batch.string_codes["country"][0]]
+
+
+def test_records_round_trip(ipos):
+    batch = EncodedBatch.from_records(_record(ipo) for ipo in ipos)
+    assert [batch.ipo(i) for i in range(len(batch))] == ipos
+    assert list(batch.score()) == list(EncodedBatch.from_ipos(ipos).score())
+
+
+def test_nan_sector_multiple_means_missing(ipos):
+    record = _record(ipos[0])
+    record["sector_ps_multiple"] = math.nan
+    batch = EncodedBatch.from_records([record])
+    assert batch.ipo(0).sector_ps_multiple is None
+
+
+@pytest.mark.parametrize("field", ["offer_shares", "lockup_days"])
+def test_nan_integer_fields_are_rejected(ipos, field):
+    batch = EncodedBatch.from_ipos(ipos[:2])
+    record = _record(ipos[2])
+    record[field] = math.nan
+    with pytest.raises(ValidationError, match=f"row 2: {field} must be a finite number"):
+        batch.add_record(record)
+    with pytest.raises(ValidationError, match=f"row 0: {field}"):
+        EncodedBatch.from_records([record])
+    assert len(batch) == 2
+
+
+def test_fractional_lockup_round_trips(ipos):
+    record = _record(ipos[0])
+    record["lockup_days"] = 45.5
+    batch = EncodedBatch.from_records([record, _record(ipos[1])])
+    assert batch.ipo(0).deal_terms.lockup_days == 45.5
+    assert type(batch.ipo(1).deal_terms.lockup_days) is int
+    assert batch.score()[0] == compute_ipo_risk(batch.ipo(0)).risk_score
+
+
+def test_invalid_rows_are_rejected_with_row_index(ipos):
+    batch = EncodedBatch.from_ipos(ipos[:3])
+    bad = _record(ipos[3])
+    bad["ticker"] = "bad ticker"
+    with pytest.raises(ValidationError, match="row 3: ticker"):
+        batch.add_record(bad)
+    bad = _record(ipos[3])
+    bad["underwriter_tier"] = 9
+    with pytest.raises(ValidationError, match="row 3: underwriter_tier"):
+        batch.add_record(bad)
+    bad["ticker"] = "NEWCO"
+    bad["sector"] = "Never Seen Sector"
+    with pytest.raises(ValidationError, match="row 3: underwriter_tier"):
+        batch.add_record(bad)
+    del bad["price_low"]
+    with pytest.raises(ValidationError, match="missing field 'price_low'"):
+        batch.add_record(bad)
+    assert len(batch) == 3
+    # Rejected rows leave nothing behind in the string pools.
+    assert "NEWCO" not in batch.strings["ticker"].values
+    assert "Never Seen Sector" not in batch.strings["sector"].values
+    assert [batch.ipo(row) for row in range(3)] == ipos[:3]
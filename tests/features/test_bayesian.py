@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from ipo_risk_score.domain.risk.bayesian import fit_posterior, fit_posterior_from_matrix
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.logistic import COEFFS_V1, risk_score_from_features
+
+
+@pytest.fixture(scope="module")
+def data(make_ipo):
+    rng = random.Random(11)
+    ipos = [make_ipo(rng) for _ in range(400)]
+    targets = [int(rng.random() * 100 < compute_ipo_risk(i).risk_score) for i in ipos]
+    return ipos, targets
+
+
+def test_tight_prior_keeps_expert_weights(data):
+    ipos, targets = data
+    posterior = fit_posterior(ipos, targets, prior_sd=1e-4)
+    for name, value in posterior.coeffs.items():
+        assert value == pytest.approx(COEFFS_V1[name], abs=1e-3)
+
+
+def test_mode_matches_map_optimum():
+    # One feature, no data: the posterior is the prior.
+    posterior = fit_posterior_from_matrix([], [], ["f_val"], prior={"f_val": 2.0}, prior_sd=0.5)
+    assert posterior.mode == (0.0, 2.0)
+    assert posterior.std() == pytest.approx({"intercept": 0.5, "f_val": 0.5})
+
+
+def test_posterior_narrows_with_data(data):
+    ipos, targets = data
+    wide = fit_posterior(ipos[:50], targets[:50])
+    narrow = fit_posterior(ipos, targets)
+    assert narrow.n_observations == 400
+    assert all(narrow.std()[k] < wide.std()[k] for k in narrow.coeffs)
+
+
+def test_intervals_match_posterior_draws(data):
+    ipos, targets = data
+    posterior = fit_posterior(ipos, targets)
+    ipo = ipos[0]
+    interval = posterior.score_intervals(ipo, level=0.8)[0]
+    assert interval.score == pytest.approx(
+        compute_ipo_risk(ipo, coeffs=posterior.coeffs).risk_score, abs=1e-9
+    )
+    assert interval.lower < interval.score < interval.upper
+
+    features = compute_ipo_risk(ipo).raw_features
+    draws = sorted(risk_score_from_features(features, d) for d in posterior.sample(4000, seed=1))
+    assert draws[400] == pytest.approx(interval.lower, abs=0.5)
+    assert draws[3600] == pytest.approx(interval.upper, abs=0.5)
+    assert sum(draws) / len(draws) == pytest.approx(interval.mean, abs=0.3)
+    assert posterior.interval(features, level=0.8) == interval
+
+
+def test_to_model_scores_posterior_mode(data):
+    ipos, targets = data
+    posterior = fit_posterior(ipos, targets)
+    model = posterior.to_model("v1-bayes")
+    assert compute_ipo_risk(ipos[1], model=model).risk_score == pytest.approx(
+        posterior.score_intervals(ipos[1])[0].score, abs=1e-9
+    )
+
+
+def test_invalid_inputs_rejected():
+    with pytest.raises(ValueError):
+        fit_posterior_from_matrix([[0.5]], [2], ["f_val"])
+    with pytest.raises(ValueError):
+        fit_posterior_from_matrix([[0.5]], [1], ["f_value"])
+    with pytest.raises(ValueError):
+        fit_posterior_from_matrix([[0.5]], [1], ["f_val"], prior_sd=0.0)
+    posterior = fit_posterior_from_matrix([[0.5]], [1], ["f_val"])
+    with pytest.raises(ValueError):
+        posterior.interval({"f_val": 0.5}, level=1.0)
@@ -0,0 +1,97 @@
+import math
+from array import array
+
+import pytest
+
+from ipo_risk_score.domain.risk.columnar import build_feature_columns, score_columns
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.features import build_feature_vector
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE
+from ipo_risk_score.domain.risk.validators import ValidationError
+
+ROWS = [
+    # price_low, price_high, shares, ff, lockup, rev, gm, nm, growth, uw, big4, cyc, reg, sector_ps
+    (10.0, 12.0, 1_000_000, 20.0, 180, 10_000_000.0, 30.0, 12.0, 40.0, 3, True, 1, 1, 2.0),
+    (4.0, 5.0, 1_500_000, 10.0, 90, 8_290_827.0, 30.5, -3.0, 43.9, 4, False, 2, 2, None),
+    (6.0, 6.0, 1_000_000, 25.0, 0, 0.0, 28.0, 11.0, 60.0, 1, True, 0, 0, 4.0),
+]
+
+
+def _to_ipo(row) -> IpoInput:
+    return IpoInput(
+        ticker=None,
+        company_name=None,
+        country=None,
+        sector=None,
+        deal_terms=DealTermsDomain(*row[:5]),
+        financials=FinancialSnapshotDomain(*row[5:9]),
+        underwriter_tier=row[9],
+        auditor_is_big4=row[10],
+        sector_cyclicality=row[11],
+        region_risk_tier=row[12],
+        sector_ps_multiple=row[13],
+    )
+
+
+def _to_columns(rows):
+    cols = list(zip(*rows))
+    return {
+        "price_low": array("d", cols[0]),
+        "price_high": array("d", cols[1]),
+        "offer_shares": array("q", cols[2]),
+        "free_float_pct": array("d", cols[3]),
+        "lockup_days": array("q", cols[4]),
+        "revenue_ttm": array("d", cols[5]),
+        "gross_margin": array("d", cols[6]),
+        "net_margin": array("d", cols[7]),
+        "growth_yoy": array("d", cols[8]),
+        "underwriter_tier": array("b", cols[9]),
+        "auditor_is_big4": memoryview(bytes(cols[10])).cast("?"),
+        "sector_cyclicality": array("b", cols[11]),
+        "region_risk_tier": array("b", cols[12]),
+        "sector_ps_multiple": array("d", [math.nan if v is None else v for v in cols[13]]),
+    }
+
+
+def test_columnar_scores_match_object_path():
+    columns = _to_columns(ROWS)
+    for coeffs in (None, COEFFS_TEX_EXAMPLE):
+        scores = score_columns(columns, coeffs)
+        assert len(scores) == len(ROWS)
+        for row, score in zip(ROWS, scores):
+            expected = compute_ipo_risk(_to_ipo(row), coeffs=coeffs).risk_score
+            assert score == pytest.approx(expected, abs=1e-12)
+
+
+def test_columnar_features_match_builder():
+    feats = build_feature_columns(_to_columns(ROWS))
+    for i, row in enumerate(ROWS):
+        expected = build_feature_vector(_to_ipo(row))
+        for name, value in expected.items():
+            assert feats[name][i] == pytest.approx(value, abs=1e-12)
+
+
+def test_columnar_accepts_memoryviews_and_missing_optional_column():
+    columns = {k: memoryview(v) for k, v in _to_columns(ROWS[:1]).items()}
+    del columns["sector_ps_multiple"]
+    scores = score_columns(columns)
+    expected = compute_ipo_risk(_to_ipo(ROWS[0][:13] + (None,))).risk_score
+    assert scores[0] == pytest.approx(expected)
+
+
+def test_columnar_reports_failing_row():
+    bad = list(ROWS)
+    bad[1] = bad[1][:3] + (-5.0,) + bad[1][4:]
+    with pytest.raises(ValidationError, match="row 1"):
+        score_columns(_to_columns(bad))
+
+
+def test_columnar_rejects_ragged_and_missing_columns():
+    columns = _to_columns(ROWS)
+    columns["net_margin"] = array("d", [1.0])
+    with pytest.raises(ValueError, match="net_margin"):
+        score_columns(columns)
+    del columns["net_margin"]
+    with pytest.raises(ValueError, match="missing"):
+        score_columns(columns)
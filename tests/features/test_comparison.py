@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from ipo_risk_score.domain.risk.comparison import score_models
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.features.config import FeatureConfig
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE, COEFFS_V1
+from ipo_risk_score.domain.risk.model import compile_model
+from ipo_risk_score.domain.risk.validators import ValidationError
+
+CHALLENGER = {"intercept": -1.2, "f_liq_total": 2.5, "f_val": 1.5, "f_fin": 0.7, "f_text": 1.0}
+
+
+TEXTS = [None, "robust growth amid volatile competition"]
+
+
+@pytest.fixture(scope="module")
+def ipos(make_ipo):
+    rng = random.Random(3)
+    return [make_ipo(rng, texts=TEXTS) for _ in range(200)]
+
+
+def test_scores_match_one_call_per_model(ipos):
+    models = {"v1": COEFFS_V1, "tex": COEFFS_TEX_EXAMPLE, "challenger": CHALLENGER}
+    out = score_models(ipos, models)
+    assert out.model_names == ("v1", "tex", "challenger")
+    assert out.champion == "v1"
+    for name, coeffs in models.items():
+        assert out.column(name) == [compute_ipo_risk(i, coeffs=coeffs).risk_score for i in ipos]
+
+
+def test_champion_challenger_diff_and_summary(ipos):
+    out = score_models(ipos, {"v1": COEFFS_V1, "challenger": CHALLENGER})
+    diffs = out.diff("challenger")
+    assert diffs == [c - v for v, c in zip(out.column("v1"), out.column("challenger"))]
+    summary = out.summary()
+    assert list(summary) == ["challenger"]
+    s = summary["challenger"]
+    assert s.n_higher + s.n_lower <= len(ipos)
+    assert s.max_abs_diff == max(abs(d) for d in diffs)
+    assert s.mean_diff == pytest.approx(sum(diffs) / len(diffs))
+    assert out.diff("v1", champion="challenger") == [-d for d in diffs]
+
+
+def test_compiled_models_single_deal_and_config(ipos):
+    config = FeatureConfig(lockup_max_days=365)
+    champion = compile_model(COEFFS_V1, "v1-prod")
+    challenger = compile_model(CHALLENGER, "v2-candidate")
+    out = score_models(
+        ipos[0], [champion, challenger], champion="v2-candidate", feature_config=config
+    )
+    assert out.model_names == ("v1-prod", "v2-candidate")
+    assert out.champion == "v2-candidate"
+    assert out.scores == [
+        (
+            compute_ipo_risk(ipos[0], model=champion, feature_config=config).risk_score,
+            compute_ipo_risk(ipos[0], model=challenger, feature_config=config).risk_score,
+        )
+    ]
+
+
+def test_sequence_of_coefficient_sets_is_named_by_position(ipos):
+    out = score_models(ipos[:20], [COEFFS_V1, compile_model(CHALLENGER, "v2"), COEFFS_TEX_EXAMPLE])
+    assert out.model_names == ("model_0", "v2", "model_2")
+    assert out.column("model_2") == [
+        compute_ipo_risk(i, coeffs=COEFFS_TEX_EXAMPLE).risk_score for i in ipos[:20]
+    ]
+
+
+def test_sequence_with_duplicate_versions_is_rejected(ipos):
+    model = compile_model(COEFFS_V1, "v1")
+    with pytest.raises(ValueError, match="Duplicate model name 'v1'"):
+        score_models(ipos, [model, compile_model(CHALLENGER, "v1")])
+    with pytest.raises(ValueError, match="Duplicate"):
+        score_models(ipos, [model, model])
+
+
+def test_rejects_unknown_champion_and_invalid_deals(ipos, make_ipo):
+    with pytest.raises(KeyError):
+        score_models(ipos, {"v1": COEFFS_V1}, champion="nope")
+    with pytest.raises(ValueError):
+        score_models(ipos, {})
+    bad = make_ipo(random.Random(0), texts=TEXTS)
+    bad.underwriter_tier = 9
+    with pytest.raises(ValidationError):
+        score_models([bad], {"v1": COEFFS_V1})
@@ -0,0 +1,113 @@
+import pytest
+
+from ipo_risk_score.domain.risk.features.edgar import (
+    extract_filing_text,
+    filing_text_features,
+    iter_filing_text,
+)
+from ipo_risk_score.domain.risk.features.text_engine import TextFeatureEngine
+from ipo_risk_score.domain.risk.features.textual import _text_feature
+
+SUBMISSION = """<SEC-DOCUMENT>0001.txt : 20240101
+<SEC-HEADER>0001.hdr.sgml : 20240101
+COMPANY CONFORMED NAME: GROWTH CORP
+</SEC-HEADER>
+<DOCUMENT>
+<TYPE>S-1
+<SEQUENCE>1
+<FILENAME>d1.htm
+<TEXT>
+<html><head><title>Strong growth</title><style>p {color: red}</style></head>
+<body><div style="x">RISK
+FACTORS</div><p>Demand could <b>decl</b>ine &amp; we may incur a
+loss.</p><!-- strong growth --><p>Strong&nbsp;growth&#8212;expected.</p>
+<table><tr><td>Revenue</td><td>1,234</td><td>5,678</td></tr>
+<tr><td>Net loss</td><td>(12)</td><td>(34)</td></tr></table>
+<table><tr><td>We face intense competition.</td></tr></table>
+<script>var growth = 1;</script>
+<div style="display:none"><ix:header><ix:hidden>loss loss</ix:hidden></ix:header></div>
+<P>USE OF PROCEEDS<P>General purposes.
+</body></html>
+</TEXT>
+</DOCUMENT>
+<DOCUMENT>
+<TYPE>GRAPHIC
+<SEQUENCE>2
+<TEXT>
+begin 644 g1.jpg
+M_]C_X``02D9)1@`!`0$`8`!@``#_VP!#``@&!@<&!0@'!P<)"0@*#!0-#`L+
+end
+</TEXT>
+</DOCUMENT>
+<DOCUMENT>
+<TYPE>EX-23.1
+<SEQUENCE>3
+<TEXT>
+CONSENT OF ACCOUNTANTS
+
+We consent to the use of our report.
+<PAGE>
+<TABLE>
+<S>        <C>
+Total      1,000  2,000
+</TABLE>
+</TEXT>
+</DOCUMENT>
+</SEC-DOCUMENT>
+"""
+
+EXPECTED = (
+    "RISK FACTORS\n\n"
+    "Demand could decline & we may incur a loss.\n\n"
+    "Strong growth\N{EM DASH}expected.\n\n"
+    "We face intense competition.\n\n"
+    "USE OF PROCEEDS\n"
+    "General purposes.\n\n"
+    "CONSENT OF ACCOUNTANTS\n\n"
+    "We consent to the use of our report.\n"
+)
+
+
+@pytest.fixture
+def submission(tmp_path):
+    path = tmp_path / "0001.txt"
+    path.write_text(SUBMISSION, encoding="utf-8")
+    return str(path)
+
+
+def test_submission_drops_envelope_markup_and_numeric_tables(submission):
+    assert extract_filing_text(submission) == EXPECTED
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1000])
+def test_output_does_not_depend_on_chunk_size(submission, chunk_size):
+    chunks = list(iter_filing_text(submission, chunk_size=chunk_size))
+    assert "".join(chunks) == EXPECTED
+    # Chunks end on word boundaries, so streamed f_text matches one pass.
+    assert filing_text_features(submission, chunk_size=chunk_size) == {
+        "f_text": _text_feature(EXPECTED)
+    }
+
+
+def test_document_types_and_in_memory_source():
+    text = extract_filing_text([SUBMISSION], document_types=["ex-23.1"])
+    assert text == "CONSENT OF ACCOUNTANTS\n\nWe consent to the use of our report.\n"
+    assert extract_filing_text([SUBMISSION], document_types=["10-K"]) == ""
+
+
+def test_table_limits():
+    table = "<html><body><table>" + "<tr><td>We may lose growth.</td></tr>" * 50 + "</table>"
+    assert extract_filing_text([table]).count("lose") == 50
+    assert extract_filing_text([table], max_table_chars=100) == ""
+    numeric = "<html><body><table><tr><td>Loss</td><td>1</td></tr></table></body></html>"
+    assert extract_filing_text([numeric]) == ""
+    assert extract_filing_text([numeric], table_numeric_ratio=1.0) == "Loss 1\n"
+    with pytest.raises(ValueError):
+        extract_filing_text([numeric], table_numeric_ratio=1.5)
+
+
+def test_output_feeds_text_engine(submission):
+    engine = TextFeatureEngine()
+    features = engine.features(iter_filing_text(submission))
+    assert features == engine.features(EXPECTED)
+    assert features["f_text_risk_factors"] > 0.5
@@ -0,0 +1,97 @@
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.features import build_feature_vector
+from ipo_risk_score.domain.risk.features.config import (
+    FeatureConfig,
+    compile_feature_pipeline,
+    score_configurations,
+)
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE
+
+CONFIGS = {
+    "default": FeatureConfig(),
+    "apac": FeatureConfig(
+        alpha_free_float=0.5,
+        alpha_dollar_float=0.5,
+        lockup_max_days=365,
+        weight_liquidity=0.6,
+        weight_lockup=0.4,
+        ps_low=2.0,
+        ps_mid=4.0,
+        ps_high=8.0,
+        val_risk_low=0.2,
+        val_risk_mid=0.6,
+        net_margin_full=10.0,
+        growth_full=30.0,
+    ),
+    "no_lockup": FeatureConfig(lockup_max_days=0),
+}
+
+
+def _make_ipo(i: int) -> IpoInput:
+    return IpoInput(
+        ticker=None,
+        company_name=None,
+        country=None,
+        sector=None,
+        deal_terms=DealTermsDomain(
+            price_low=4.0 + i % 7,
+            price_high=5.0 + i % 7,
+            offer_shares=500_000 + 250_000 * (i % 5),
+            free_float_pct=float(5 + (i * 13) % 90),
+            lockup_days=(i * 37) % 400,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=float((i % 4) * 3_000_000),
+            gross_margin=30.0,
+            net_margin=float(-10 + (i * 7) % 40),
+            growth_yoy=float(-20 + (i * 11) % 90),
+        ),
+        underwriter_tier=1 + i % 5,
+        auditor_is_big4=bool(i % 2),
+        sector_cyclicality=i % 3,
+        region_risk_tier=(i // 3) % 3,
+        sector_ps_multiple=None if i % 3 else 1.5,
+        prospectus_text="strong growth but volatile competition" if i % 4 == 0 else None,
+    )
+
+
+IPOS = [_make_ipo(i) for i in range(60)]
+
+
+def test_default_config_reproduces_module_defaults():
+    for ipo in IPOS[:10]:
+        assert build_feature_vector(ipo, config=FeatureConfig()) == build_feature_vector(ipo)
+
+
+def test_config_changes_features():
+    ipo = IPOS[1]
+    default = build_feature_vector(ipo)
+    apac = build_feature_vector(ipo, config=CONFIGS["apac"])
+    assert default["f_liq_total"] != apac["f_liq_total"]
+
+
+@pytest.mark.parametrize("name", sorted(CONFIGS))
+def test_compiled_pipeline_matches_modular_path(name):
+    config = CONFIGS[name]
+    pipeline = compile_feature_pipeline(config)
+    for ipo in IPOS:
+        text = ipo.prospectus_text
+        assert pipeline(ipo, text) == build_feature_vector(ipo, text, config=config)
+
+
+def test_score_configurations_matches_per_config_scoring():
+    scores = score_configurations(IPOS, CONFIGS, COEFFS_TEX_EXAMPLE)
+    for name, config in CONFIGS.items():
+        expected = [
+            compute_ipo_risk(ipo, coeffs=COEFFS_TEX_EXAMPLE, feature_config=config).risk_score
+            for ipo in IPOS
+        ]
+        assert scores[name] == expected
+
+
+def test_config_rejects_unordered_breakpoints():
+    with pytest.raises(ValueError):
+        FeatureConfig(ps_low=3.0, ps_mid=2.0)
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.features.config import FeatureConfig
+from ipo_risk_score.domain.risk.features.context import _geo_feature
+from ipo_risk_score.domain.risk.features.liquidity import _lockup_feature
+from ipo_risk_score.domain.risk.features.quality import _auditor_feature, _underwriter_feature
+from ipo_risk_score.domain.risk.features.tables import (
+    N_CATEGORIES,
+    FeatureTables,
+    TableScorer,
+    category_index,
+)
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE, COEFFS_V1
+
+TEXTS = [None, "strong growth despite risk of loss"]
+
+
+def test_tables_cover_every_combination():
+    tables = FeatureTables()
+    indices = set()
+    for uw in range(1, 6):
+        for big4 in (False, True):
+            for cyc in range(3):
+                for region in range(3):
+                    idx = category_index(uw, big4, cyc, region)
+                    indices.add(idx)
+                    assert tables.categorical[idx] == (
+                        _underwriter_feature(uw),
+                        _auditor_feature(big4),
+                        _geo_feature(cyc, region),
+                    )
+    assert indices == set(range(N_CATEGORIES))
+    assert len(tables.lockup) == 181
+    assert all(tables.lockup_feature(d) == _lockup_feature(d) for d in range(0, 400))
+
+
+def test_partial_logit_matches_weighted_sum():
+    tables = FeatureTables()
+    partial = tables.partial_logit(COEFFS_V1)
+    f_uw, f_aud, f_geo = tables.categorical[category_index(4, False, 2, 1)]
+    assert partial[category_index(4, False, 2, 1)] == pytest.approx(
+        1.5 * f_uw + 1.5 * f_aud + 1.0 * f_geo
+    )
+
+
+@pytest.mark.parametrize("coeffs", [COEFFS_V1, COEFFS_TEX_EXAMPLE])
+def test_table_scorer_matches_engine(coeffs, make_ipo):
+    rng = random.Random(5)
+    ipos = [make_ipo(rng, texts=TEXTS) for _ in range(300)]
+    scorer = TableScorer(coeffs)
+    expected = [compute_ipo_risk(ipo, coeffs=coeffs).risk_score for ipo in ipos]
+    assert list(scorer.score_many(ipos)) == pytest.approx(expected, abs=1e-10)
+    assert scorer.score(ipos[0]) == pytest.approx(expected[0], abs=1e-10)
+
+
+def test_table_scorer_honours_config_and_untabulated_inputs(make_ipo):
+    config = FeatureConfig(lockup_max_days=90, weight_lockup=0.5, weight_liquidity=0.5)
+    rng = random.Random(9)
+    ipo = make_ipo(rng, texts=TEXTS)
+    ipo.underwriter_tier = 2.5  # admitted by validation, not tabulated
+    ipo.deal_terms.lockup_days = 45.5
+    scorer = TableScorer(COEFFS_V1, config)
+    expected = compute_ipo_risk(ipo, feature_config=config).risk_score
+    assert scorer.score(ipo) == pytest.approx(expected, abs=1e-10)
+    assert len(scorer.tables.lockup) == 91
+
+
+def test_table_scorer_indexes_lockup_table_bit_identically(make_ipo):
+    coeffs = {"intercept": -1.0, "f_lock": 1.3, "f_liq_total": 2.0}
+    rng = random.Random(13)
+    ipos = [make_ipo(rng) for _ in range(200)]
+    scorer = TableScorer(coeffs)
+    for ipo in ipos:
+        features = compute_ipo_risk(ipo, coeffs=coeffs).raw_features
+        expected = -1.0 + 1.3 * features["f_lock"] + 2.0 * features["f_liq_total"]
+        assert scorer.logit(ipo) == expected
+        assert scorer.score(ipo) == compute_ipo_risk(ipo, coeffs=coeffs).risk_score
+
+    ipo = ipos[0]
+    ipo.deal_terms.lockup_days = 90
+    before = scorer.logit(ipo)
+    scorer.tables.lockup[90] += 0.25
+    assert scorer.logit(ipo) == pytest.approx(before + 1.3 * 0.25)
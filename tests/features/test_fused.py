@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.features import FEATURE_KEYS, build_feature_vector
+from ipo_risk_score.domain.risk.features.config import FeatureConfig
+from ipo_risk_score.domain.risk.fused import compile_feature_extractor, compile_fused_scorer
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE, COEFFS_V1
+from ipo_risk_score.domain.risk.validators import ValidationError
+
+TEXTS = [None, "", "Strong growth and robust profit.", "Risk of loss; volatile, uncertain."]
+
+
+@pytest.fixture(scope="module")
+def ipos(make_ipo):
+    rng = random.Random(2024)
+    return [make_ipo(rng, texts=TEXTS, identity=True, wide=True) for _ in range(1000)]
+
+
+@pytest.mark.parametrize(
+    "coeffs", [COEFFS_V1, COEFFS_TEX_EXAMPLE, {"intercept": 0.3, "f_val": 2.0}]
+)
+def test_fused_score_is_bit_identical(ipos, coeffs):
+    scorer = compile_fused_scorer(coeffs)
+    for ipo in ipos:
+        assert scorer.score(ipo) == compute_ipo_risk(ipo, coeffs=coeffs).risk_score
+
+
+def test_fused_result_equals_modular_result(ipos):
+    scorer = compile_fused_scorer(COEFFS_TEX_EXAMPLE, model_version="tex")
+    for ipo in ipos[:200]:
+        expected = compute_ipo_risk(ipo, coeffs=COEFFS_TEX_EXAMPLE, model_version="tex")
+        assert scorer.result(ipo) == expected
+    override = "Loss and decline."
+    assert scorer.result(ipos[0], override, include_attractiveness=False) == compute_ipo_risk(
+        ipos[0],
+        coeffs=COEFFS_TEX_EXAMPLE,
+        model_version="tex",
+        prospectus_text=override,
+        include_attractiveness=False,
+    )
+
+
+def test_fused_honours_feature_config(ipos):
+    config = FeatureConfig(lockup_max_days=365, ps_low=0.5, ps_mid=3.0, ps_high=8.0)
+    scorer = compile_fused_scorer(config=config)
+    for ipo in ipos[:200]:
+        assert scorer.score(ipo) == compute_ipo_risk(ipo, feature_config=config).risk_score
+
+
+def test_feature_extractor_matches_feature_vector(ipos):
+    config = FeatureConfig(lockup_max_days=365, ps_low=0.5, ps_mid=3.0, ps_high=8.0)
+    for cfg in (None, config):
+        extract = compile_feature_extractor(cfg)
+        for ipo in ipos[:200]:
+            expected = build_feature_vector(ipo, ipo.prospectus_text, config=cfg)
+            row = extract(ipo, ipo.prospectus_text, True)
+            assert dict(zip(FEATURE_KEYS, row)) == expected
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("ticker", "bad ticker"),
+        ("price_low", -1.0),
+        ("free_float_pct", float("nan")),
+        ("net_margin", 150.0),
+        ("underwriter_tier", 0),
+        ("sector_ps_multiple", -2.0),
+    ],
+)
+def test_fused_validation_raises_same_errors(ipos, field, value, make_ipo):
+    ipo = make_ipo(random.Random(1), texts=TEXTS, identity=True, wide=True)
+    for target in (ipo, ipo.deal_terms, ipo.financials):
+        if hasattr(target, field):
+            setattr(target, field, value)
+    with pytest.raises(ValidationError) as modular:
+        compute_ipo_risk(ipo)
+    with pytest.raises(ValidationError) as fused:
+        compile_fused_scorer().score(ipo)
+    assert str(fused.value) == str(modular.value)
@@ -0,0 +1,92 @@
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.features.edgar import extract_filing_text
+from ipo_risk_score.domain.risk.ingest import score_filings
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE
+
+FILINGS = {
+    "AAA": "<html><body><p>Strong growth and robust profit.</p>"
+    "<table><tr><td>Loss</td><td>1</td><td>2</td></tr></table></body></html>",
+    "BBB": "<html><body><div>RISK FACTORS</div><p>Demand may decline; a loss is likely.</p>",
+    "CCC": "Plain text filing with uncertain and volatile markets.\n",
+}
+
+
+def _make_ipo(ticker, net_margin=5.0) -> IpoInput:
+    return IpoInput(
+        ticker=ticker,
+        company_name=None,
+        country=None,
+        sector=None,
+        deal_terms=DealTermsDomain(
+            price_low=10.0,
+            price_high=12.0,
+            offer_shares=5_000_000,
+            free_float_pct=30.0,
+            lockup_days=180,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=50_000_000.0,
+            gross_margin=40.0,
+            net_margin=net_margin,
+            growth_yoy=25.0,
+        ),
+        underwriter_tier=2,
+        auditor_is_big4=True,
+        sector_cyclicality=1,
+        region_risk_tier=0,
+    )
+
+
+@pytest.fixture
+def filing_dir(tmp_path):
+    for ticker, text in FILINGS.items():
+        (tmp_path / f"{ticker}.htm").write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_scores_match_compute_ipo_risk(filing_dir, workers):
+    ipos = [_make_ipo(t, net_margin=i * 3.0) for i, t in enumerate(FILINGS)]
+    out = list(
+        score_filings(ipos, filing_dir, coeffs=COEFFS_TEX_EXAMPLE, workers=workers, max_bytes=64)
+    )
+    assert sorted(item.key for item in out) == sorted(FILINGS)
+    for item in out:
+        assert item.error is None
+        expected = compute_ipo_risk(
+            item.ipo,
+            coeffs=COEFFS_TEX_EXAMPLE,
+            prospectus_text=extract_filing_text(item.path),
+        )
+        assert item.result == expected
+
+
+def test_unmatched_and_failing_items_are_reported(filing_dir):
+    bad = _make_ipo("BBB")
+    bad.deal_terms.price_low = -1.0
+    paths = [filing_dir / "AAA.htm", filing_dir / "BBB.htm", filing_dir / "missing.htm"]
+    out = {item.key: item for item in score_filings({"BBB": bad}, paths, workers=0)}
+    assert out["AAA"].error == "no matching deal" and out["AAA"].counts is not None
+    assert out["BBB"].result is None and out["BBB"].error
+    assert out["missing"].error.startswith("FileNotFoundError")
+
+
+def test_raw_counts_and_early_stop(filing_dir):
+    ipos = {t: _make_ipo(t) for t in FILINGS}
+    item = next(iter(score_filings(ipos, filing_dir / "CCC.htm", extract=False, workers=0)))
+    assert item.counts == (8, 0, 2)
+    stream = score_filings(ipos, filing_dir, workers=0, readers=1, max_bytes=1)
+    assert next(stream).error is None
+    stream.close()
+
+
+def test_invalid_arguments(filing_dir):
+    with pytest.raises(ValueError, match="duplicate"):
+        list(score_filings([_make_ipo("A"), _make_ipo("A")], filing_dir))
+    with pytest.raises(ValueError, match="key"):
+        list(score_filings([_make_ipo(None)], filing_dir))
+    with pytest.raises(ValueError):
+        list(score_filings([], filing_dir, readers=0))
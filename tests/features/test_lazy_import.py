@@ -0,0 +1,48 @@
+"""Regression guard for the lightweight import path (see benchmarks/bench_import.py)."""
+
+import subprocess
+import sys
+import textwrap
+
+
+def _loaded_modules_after(code: str) -> set:
+    probe = textwrap.dedent(code) + "\nimport sys\nprint('\\n'.join(sorted(sys.modules)))\n"
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout
+    return set(out.split())
+
+
+def test_package_import_does_not_load_heavy_modules():
+    loaded = _loaded_modules_after("import ipo_risk_score.domain.risk")
+    assert "importlib.metadata" not in loaded
+    assert "ipo_risk_score.domain.risk.engine" not in loaded
+    assert "ipo_risk_score.domain.risk.calibration" not in loaded
+    assert "ipo_risk_score.domain.risk.features" not in loaded
+
+
+def test_first_score_loads_only_the_scoring_path():
+    loaded = _loaded_modules_after(
+        "from ipo_risk_score.domain.risk import compute_ipo_risk, IpoInput"
+    )
+    assert "ipo_risk_score.domain.risk.engine" in loaded
+    assert "ipo_risk_score.domain.risk.calibration" not in loaded
+    assert "ipo_risk_score.domain.risk.features.config" not in loaded
+    assert "ipo_risk_score.domain.risk.model" not in loaded
+    assert "importlib.metadata" not in loaded
+
+
+def test_lazy_attributes_resolve():
+    import ipo_risk_score
+    import ipo_risk_score.domain.risk as risk
+
+    assert isinstance(ipo_risk_score.__version__, str)
+    assert risk.COEFFS_V1["intercept"] == -0.5
+    assert "compute_ipo_risk" in dir(risk)
+
+
+def test_all_lists_every_lazy_attribute():
+    import ipo_risk_score.domain.risk as risk
+
+    assert len(risk.__all__) == len(set(risk.__all__))
+    assert set(risk.__all__) == set(risk._LAZY_ATTRS)
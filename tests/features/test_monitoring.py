@@ -0,0 +1,77 @@
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.monitoring import (
+    DriftMonitor,
+    ks_statistic,
+    population_stability_index,
+)
+
+
+def _make_ipo(free_float_pct: float, i: int) -> IpoInput:
+    return IpoInput(
+        ticker=None,
+        company_name=None,
+        country=None,
+        sector=None,
+        deal_terms=DealTermsDomain(
+            price_low=10.0,
+            price_high=10.0,
+            offer_shares=1_000_000,
+            free_float_pct=free_float_pct,
+            lockup_days=90 + i % 90,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=10_000_000.0,
+            gross_margin=30.0,
+            net_margin=float(i % 20),
+            growth_yoy=float(i % 50),
+        ),
+        underwriter_tier=1 + i % 5,
+        auditor_is_big4=bool(i % 2),
+        sector_cyclicality=i % 3,
+        region_risk_tier=i % 3,
+        sector_ps_multiple=2.0,
+    )
+
+
+def test_psi_and_ks_of_identical_distributions_are_zero():
+    p = [0.25, 0.25, 0.5]
+    assert population_stability_index(p, p) == pytest.approx(0.0)
+    assert ks_statistic(p, p) == pytest.approx(0.0)
+    assert ks_statistic([1.0, 0.0], [0.0, 1.0]) == pytest.approx(1.0)
+
+
+def test_monitor_flags_micro_float_shift_only():
+    monitor = DriftMonitor()
+    for i in range(500):
+        monitor.observe_result(compute_ipo_risk(_make_ipo(30.0 + i % 60, i)))
+    monitor.freeze_reference()
+
+    # Same population: no drift.
+    for i in range(500):
+        monitor.observe_result(compute_ipo_risk(_make_ipo(30.0 + i % 60, i)))
+    stable = monitor.snapshot()
+    assert stable["f_liq_total"].psi == pytest.approx(0.0)
+    assert stable["f_uw"].status == "stable"
+
+    # Micro-float wave pushes f_liq_total (and the score) up.
+    monitor.reset_current()
+    for i in range(500):
+        monitor.observe_result(compute_ipo_risk(_make_ipo(1.0 + i % 5, i)))
+    shifted = monitor.snapshot()
+    assert shifted["f_liq_total"].status == "major"
+    assert shifted["f_liq_total"].ks > 0.5
+    assert shifted["f_uw"].status == "stable"
+    assert "f_liq_total" in monitor.drifted()
+    assert "risk_score" in monitor.drifted()
+
+
+def test_snapshot_without_reference_reports_insufficient_data():
+    monitor = DriftMonitor()
+    monitor.observe({"f_val": 0.3}, 42.0)
+    snap = monitor.snapshot()
+    assert snap["f_val"].status == "insufficient-data"
+    assert snap["f_val"].n_current == 1
+    assert snap["f_liq"].n_current == 0
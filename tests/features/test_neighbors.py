@@ -0,0 +1,104 @@
+import io
+import math
+import random
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.features.builder import FEATURE_KEYS
+from ipo_risk_score.domain.risk.neighbors import ComparableIndex
+
+
+@pytest.fixture(scope="module")
+def history(make_ipo):
+    rng = random.Random(8)
+    results = [compute_ipo_risk(make_ipo(rng)) for _ in range(1500)]
+    outcomes = [float(rng.random() < r.risk_score / 100.0) for r in results]
+    ids = [f"T{i}" for i in range(len(results))]
+    return results, outcomes, ids
+
+
+def _brute_force(matrix, query, k, weights=None):
+    w = [1.0] * len(query) if weights is None else weights
+    dists = [
+        (math.sqrt(sum(wi * (a - b) ** 2 for wi, a, b in zip(w, row, query))), i)
+        for i, row in enumerate(matrix)
+    ]
+    return sorted(dists)[:k]
+
+
+@pytest.mark.parametrize("leaf_size", [1, 4, 16])
+def test_knn_matches_brute_force(history, leaf_size, make_ipo):
+    results, outcomes, ids = history
+    matrix = [[r.raw_features[k] for k in FEATURE_KEYS] for r in results]
+    index = ComparableIndex.build(matrix, outcomes, ids=ids, leaf_size=leaf_size)
+    rng = random.Random(leaf_size)
+    for _ in range(25):
+        query = compute_ipo_risk(make_ipo(rng)).raw_features
+        got = index.query_features(query, k=10)
+        expected = _brute_force(matrix, [query[k] for k in FEATURE_KEYS], 10)
+        assert [c.row for c in got] == [i for _, i in expected]
+        assert [c.distance for c in got] == pytest.approx([d for d, _ in expected], abs=1e-12)
+        assert [c.id for c in got] == [ids[i] for _, i in expected]
+        assert [c.outcome for c in got] == [outcomes[i] for _, i in expected]
+
+
+def test_duplicate_points_tie_by_row():
+    matrix = [[0.5, 0.5]] * 40 + [[0.0, 0.0]]
+    index = ComparableIndex.build(matrix, feature_names=("f_val", "f_fin"), leaf_size=4)
+    got = index.query_features({"f_val": 0.5, "f_fin": 0.5}, k=5)
+    assert [c.row for c in got] == [0, 1, 2, 3, 4]
+    assert all(c.distance == 0.0 and c.outcome is None and c.id is None for c in got)
+    assert len(index.query_features([0.0, 0.0], k=100)) == 41
+
+
+def test_weights_and_feature_subset(history):
+    results, _, _ = history
+    names = ("f_val", "f_fin", "f_uw")
+    weights = {"f_val": 4.0, "f_uw": 0.25}
+    matrix = [[r.raw_features[k] for k in names] for r in results]
+    index = ComparableIndex.from_results(results, feature_names=names, weights=weights)
+    query = [0.3, 0.7, 0.5]
+    got = index.query_features(query, k=7)
+    expected = _brute_force(matrix, query, 7, [4.0, 1.0, 0.25])
+    assert [c.row for c in got] == [i for _, i in expected]
+
+
+def test_query_ipo_and_batch(history, make_ipo):
+    results, outcomes, _ = history
+    index = ComparableIndex.from_results(results, outcomes)
+    rng = random.Random(2)
+    ipos = [make_ipo(rng) for _ in range(5)]
+    batch = index.query_batch(ipos, k=3)
+    for ipo, neighbours in zip(ipos, batch):
+        assert neighbours == index.query(ipo, k=3)
+        assert neighbours == index.query_features(compute_ipo_risk(ipo).raw_features, k=3)
+
+
+def test_save_and_load_round_trip(history, tmp_path, make_ipo):
+    results, outcomes, ids = history
+    index = ComparableIndex.from_results(results, outcomes, ids=ids)
+    path = tmp_path / "comparables.ipnn"
+    index.save(str(path))
+    loaded = ComparableIndex.load(str(path))
+    assert len(loaded) == len(index)
+    assert loaded.feature_names == index.feature_names
+    rng = random.Random(3)
+    ipos = [make_ipo(rng) for _ in range(10)]
+    assert loaded.query_batch(ipos, k=5) == index.query_batch(ipos, k=5)
+
+    with pytest.raises(ValueError, match="bad magic"):
+        ComparableIndex.read(io.BytesIO(b"XXXX" + path.read_bytes()[4:]))
+    with pytest.raises(ValueError, match="Truncated"):
+        ComparableIndex.read(io.BytesIO(path.read_bytes()[:-8]))
+
+
+def test_invalid_inputs_rejected():
+    with pytest.raises(ValueError, match="Unknown feature"):
+        ComparableIndex.build([[0.1]], feature_names=("f_liquidity",))
+    with pytest.raises(ValueError, match="row 1"):
+        ComparableIndex.build([[0.1], [0.2, 0.3]], feature_names=("f_val",))
+    with pytest.raises(ValueError):
+        ComparableIndex.build([[0.1]], [1.0, 0.0], feature_names=("f_val",))
+    empty = ComparableIndex.build([], feature_names=("f_val",))
+    assert empty.query_features([0.5]) == []
@@ -0,0 +1,148 @@
+import math
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from ipo_risk_score.domain.risk.bayesian import fit_posterior_from_matrix
+from ipo_risk_score.domain.risk.features import build_feature_vector
+from ipo_risk_score.domain.risk.features.config import FeatureConfig
+from ipo_risk_score.domain.risk.logistic import COEFFS_V1
+from ipo_risk_score.domain.risk.online import OnlineCalibrator
+
+_NAMES = ["f_liq_total", "f_val", "f_uw"]
+
+
+TEXTS = [None, "strong growth", "volatile decline and loss"]
+
+
+def _sample(rng: random.Random, coeffs, n: int):
+    rows, outcomes = [], []
+    for _ in range(n):
+        x = [rng.random() for _ in _NAMES]
+        z = coeffs["intercept"] + sum(coeffs[name] * v for name, v in zip(_NAMES, x))
+        rows.append(x)
+        outcomes.append(int(rng.random() < 1.0 / (1.0 + math.exp(-z))))
+    return rows, outcomes
+
+
+def test_online_tracks_batch_posterior():
+    rng = random.Random(50)
+    rows, outcomes = _sample(
+        rng, {"intercept": -1.0, "f_liq_total": 2.0, "f_val": -1.0, "f_uw": 0.5}, 3000
+    )
+    calibrator = OnlineCalibrator(_NAMES, prior={}, prior_sd=10.0)
+    for x, y in zip(rows, outcomes):
+        calibrator.update_row(x, y)
+    batch = fit_posterior_from_matrix(rows, outcomes, _NAMES, prior={}, prior_sd=10.0)
+    assert calibrator.n_observations == 3000
+    for name, value in batch.coeffs.items():
+        assert calibrator.coeffs()[name] == pytest.approx(value, abs=0.05)
+    for name, value in batch.std().items():
+        assert calibrator.std()[name] == pytest.approx(value, rel=0.1)
+
+
+def test_online_defaults_start_at_prior_and_match_feature_dicts(make_ipo):
+    calibrator = OnlineCalibrator()
+    assert calibrator.coeffs() == dict(COEFFS_V1)
+    rng = random.Random(1)
+    ipos = [make_ipo(rng, texts=TEXTS) for _ in range(40)]
+    outcomes = [rng.randint(0, 1) for _ in ipos]
+    twin = OnlineCalibrator()
+    calibrator.update_many(ipos, outcomes)
+    for ipo, outcome in zip(ipos, outcomes):
+        features = build_feature_vector(ipo, prospectus_text=ipo.prospectus_text)
+        twin.update_features(features, outcome)
+    assert calibrator.coeffs() == twin.coeffs()
+    assert calibrator.to_model("v1-online").coeffs["intercept"] == calibrator.coeffs()["intercept"]
+
+
+def test_time_decay_adapts_to_regime_change():
+    rng = random.Random(5)
+    before, after = (
+        {"intercept": -2.0, "f_liq_total": 0.0, "f_val": 0.0, "f_uw": 0.0},
+        {"intercept": 2.0, "f_liq_total": 0.0, "f_val": 0.0, "f_uw": 0.0},
+    )
+    stream = [_sample(rng, before, 1500), _sample(rng, after, 300)]
+    static = OnlineCalibrator(_NAMES, prior={}, prior_sd=5.0)
+    decayed = OnlineCalibrator(_NAMES, prior={}, prior_sd=5.0, half_life_days=30)
+    day = date(2020, 1, 1)
+    for rows, outcomes in stream:
+        for x, y in zip(rows, outcomes):
+            day += timedelta(days=1)
+            static.update_row(x, y, as_of=day)
+            decayed.update_row(x, y, as_of=day)
+    assert decayed.coeffs()["intercept"] > 1.0
+    assert static.coeffs()["intercept"] < decayed.coeffs()["intercept"] - 1.0
+    assert decayed.last_as_of == day
+
+
+def test_checkpoint_round_trip_continues_exactly(tmp_path):
+    rng = random.Random(9)
+    rows, outcomes = _sample(
+        rng, {"intercept": 0.3, "f_liq_total": 1.0, "f_val": 1.0, "f_uw": -1.0}, 400
+    )
+    calibrator = OnlineCalibrator(_NAMES, half_life_days=365.0)
+    day = date(2023, 1, 1)
+    for i, (x, y) in enumerate(zip(rows[:200], outcomes[:200])):
+        calibrator.update_row(x, y, as_of=day + timedelta(days=i))
+    path = str(tmp_path / "calibrator.json")
+    calibrator.save(path)
+    restored = OnlineCalibrator.load(path)
+    assert restored.coeffs() == calibrator.coeffs()
+    assert restored.n_observations == 200 and restored.last_as_of == calibrator.last_as_of
+    for i, (x, y) in enumerate(zip(rows[200:], outcomes[200:]), start=200):
+        calibrator.update_row(x, y, as_of=day + timedelta(days=i))
+        restored.update_row(x, y, as_of=day + timedelta(days=i))
+    assert restored.coeffs() == calibrator.coeffs()
+    assert restored.std() == calibrator.std()
+
+
+def test_checkpoint_keeps_feature_config(tmp_path, make_ipo):
+    config = FeatureConfig(lockup_max_days=365, ps_low=0.5, ps_mid=3.0, ps_high=8.0)
+    rng = random.Random(3)
+    ipos = [make_ipo(rng, texts=TEXTS) for _ in range(60)]
+    outcomes = [rng.randint(0, 1) for _ in ipos]
+    calibrator = OnlineCalibrator(feature_config=config)
+    calibrator.update_many(ipos[:30], outcomes[:30])
+    path = str(tmp_path / "calibrator.json")
+    calibrator.save(path)
+    restored = OnlineCalibrator.load(path)
+    assert restored.feature_config == config
+    assert OnlineCalibrator.load(path, feature_config=config).feature_config == config
+    with pytest.raises(ValueError, match="different FeatureConfig"):
+        OnlineCalibrator.load(path, feature_config=FeatureConfig())
+    calibrator.update_many(ipos[30:], outcomes[30:])
+    restored.update_many(ipos[30:], outcomes[30:])
+    assert restored.coeffs() == calibrator.coeffs()
+
+
+def test_update_many_rejects_mismatched_lengths(make_ipo):
+    rng = random.Random(4)
+    ipos = [make_ipo(rng, texts=TEXTS) for _ in range(3)]
+    calibrator = OnlineCalibrator()
+    with pytest.raises(ValueError, match="same length"):
+        calibrator.update_many(ipos, [1, 0])
+    with pytest.raises(ValueError, match="same length"):
+        calibrator.update_many(ipos, [1, 0, 1], as_of=[date(2024, 1, 1)])
+    assert calibrator.n_observations == 0
+
+
+def test_online_errors(tmp_path):
+    with pytest.raises(ValueError, match="Unknown feature keys"):
+        OnlineCalibrator(["f_liquidity"])
+    with pytest.raises(ValueError):
+        OnlineCalibrator(prior_sd=0.0)
+    with pytest.raises(ValueError):
+        OnlineCalibrator(half_life_days=-1.0)
+    calibrator = OnlineCalibrator(_NAMES)
+    with pytest.raises(ValueError):
+        calibrator.update_row([0.5, 0.5, 0.5], 2)
+    with pytest.raises(ValueError):
+        calibrator.update_row([0.5, 0.5], 1)
+    with pytest.raises(ValueError):
+        calibrator.update_row([0.5, 0.5, 0.5], 1, weight=-1.0)
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"format": "something-else"}', encoding="utf-8")
+    with pytest.raises(ValueError, match="not an online calibrator checkpoint"):
+        OnlineCalibrator.load(str(bad))
@@ -0,0 +1,147 @@
+import json
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.peers import PeerMultipleIndex
+
+
+def _make_ipo(sector="Tech", country="US", sector_ps_multiple=None) -> IpoInput:
+    return IpoInput(
+        ticker=None,
+        company_name=None,
+        country=country,
+        sector=sector,
+        deal_terms=DealTermsDomain(
+            price_low=10.0,
+            price_high=12.0,
+            offer_shares=5_000_000,
+            free_float_pct=30.0,
+            lockup_days=180,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=20_000_000.0,
+            gross_margin=40.0,
+            net_margin=5.0,
+            growth_yoy=25.0,
+        ),
+        underwriter_tier=2,
+        auditor_is_big4=True,
+        sector_cyclicality=1,
+        region_risk_tier=1,
+        sector_ps_multiple=sector_ps_multiple,
+    )
+
+
+def _index(**kwargs) -> PeerMultipleIndex:
+    index = PeerMultipleIndex(**kwargs)
+    index.add("Tech", "US", "2024-01-10", 4.0)
+    index.add("tech", "us", "2024-02-10", 6.0)
+    index.add("Tech", "US", "2024-03-10", 8.0)
+    index.add("Tech", "DE", "2024-03-01", 2.0)
+    return index
+
+
+def test_country_median_with_sector_fallback():
+    index = _index(window_days=None, min_peers=3)
+    assert len(index) == 4
+    assert index.median("TECH", "US") == 6.0
+    # Germany has one peer: fall back to the sector-wide median (4 peers).
+    assert index.median("Tech", "DE") == 5.0
+    assert index.median("Tech", None, as_of="2024-02-15") is None
+    assert index.median("Energy", "US") is None
+
+
+def test_as_of_and_rolling_window():
+    index = _index(window_days=45, min_peers=1)
+    assert index.median("Tech", "US", as_of="2024-01-31") == 4.0
+    assert index.median("Tech", "US", as_of=date(2024, 3, 10)) == 7.0
+    assert index.median("Tech", "US") == 7.0
+    assert index.median("Tech", "US", as_of="2023-12-31") is None
+
+
+def test_fill_many_matches_single_lookups():
+    rng = random.Random(4)
+    index = PeerMultipleIndex(window_days=90, min_peers=3)
+    start = date(2023, 1, 1)
+    for _ in range(2000):
+        index.add(
+            rng.choice(["Tech", "Energy"]),
+            rng.choice(["US", "UK", "JP", None]),
+            start + timedelta(days=rng.randint(0, 700)),
+            rng.uniform(0.5, 12.0),
+        )
+    ipos = [
+        _make_ipo(rng.choice(["Tech", "Energy", "Retail"]), rng.choice(["US", "FR"]))
+        for _ in range(300)
+    ]
+    dates = [start + timedelta(days=rng.randint(-30, 760)) for _ in ipos]
+    filled = index.fill_many(ipos, as_of=dates)
+    for ipo, day, out in zip(ipos, dates, filled):
+        assert out.sector_ps_multiple == index.median(ipo.sector, ipo.country, as_of=day)
+        assert ipo.sector_ps_multiple is None
+    assert index.fill(ipos[0]).sector_ps_multiple == index.median(ipos[0].sector, ipos[0].country)
+
+
+def test_out_of_order_adds_between_lookups():
+    rng = random.Random(8)
+    index = PeerMultipleIndex(window_days=60, min_peers=1)
+    start = date(2024, 1, 1)
+    seen = []
+    for _ in range(300):
+        day = start + timedelta(days=rng.randint(0, 200))
+        multiple = rng.uniform(0.5, 12.0)
+        index.add("Tech", "US", day, multiple)
+        seen.append((day, multiple))
+        as_of = start + timedelta(days=rng.randint(0, 220))
+        window = sorted(m for d, m in seen if as_of - timedelta(days=60) < d <= as_of)
+        expected = None
+        if window:
+            mid = len(window) // 2
+            expected = window[mid] if len(window) % 2 else (window[mid - 1] + window[mid]) / 2.0
+        assert index.median("Tech", "US", as_of=as_of) == expected
+
+
+def test_fill_keeps_existing_multiples_and_feeds_valuation():
+    index = _index(window_days=None, min_peers=1)
+    given = _make_ipo(sector_ps_multiple=3.0)
+    assert index.fill(given) is given
+    assert index.fill_many([given], overwrite=True)[0].sector_ps_multiple == 6.0
+    missing = _make_ipo()
+    filled = index.fill(missing, as_of="2024-06-01")
+    assert (
+        compute_ipo_risk(filled).risk_score
+        == compute_ipo_risk(_make_ipo(sector_ps_multiple=6.0)).risk_score
+    )
+
+
+def test_load_csv_and_jsonl(tmp_path):
+    csv_path = tmp_path / "peers.csv"
+    csv_path.write_text(
+        "ticker,sector,country,as_of,ps_multiple\n"
+        "AAA,Tech,US,2024-01-10,4.0\n"
+        "BBB,Tech,,2024-02-10,6.0\n"
+    )
+    index = PeerMultipleIndex.from_csv(str(csv_path), window_days=None, min_peers=1)
+    assert index.median("Tech", "US") == 4.0
+    assert index.median("Tech") == 5.0
+
+    jsonl_path = tmp_path / "peers.jsonl"
+    rows = [{"sector": "Tech", "country": "US", "as_of": "2024-01-10", "ps_multiple": 4.0}]
+    jsonl_path.write_text("\n".join(json.dumps(r) for r in rows) + "\n")
+    assert PeerMultipleIndex.from_jsonl(str(jsonl_path), min_peers=1).median("Tech") == 4.0
+
+
+def test_invalid_comparables_rejected():
+    index = PeerMultipleIndex()
+    with pytest.raises(ValueError, match="record 0"):
+        index.add_records([{"sector": "Tech", "as_of": "2024-01-01", "ps_multiple": -1.0}])
+    with pytest.raises(ValueError, match="missing field 'as_of'"):
+        index.add_records([{"sector": "Tech", "ps_multiple": 1.0}])
+    with pytest.raises(ValueError):
+        PeerMultipleIndex(window_days=0)
+    with pytest.raises(ValueError):
+        index.fill_many([_make_ipo()], as_of=["2024-01-01", "2024-01-02"])
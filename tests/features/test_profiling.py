@@ -0,0 +1,120 @@
+import cProfile
+import io
+import pstats
+import sys
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.profiling import ScoringProfiler, profile_scoring, stage_of
+
+
+def _make_ipo(i: int) -> IpoInput:
+    return IpoInput(
+        ticker=f"T{i}",
+        company_name=None,
+        country="US",
+        sector="Tech",
+        deal_terms=DealTermsDomain(
+            price_low=10.0,
+            price_high=12.0,
+            offer_shares=1_000_000 + i,
+            free_float_pct=20.0 + i % 50,
+            lockup_days=180,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=20_000_000.0,
+            gross_margin=40.0,
+            net_margin=5.0,
+            growth_yoy=25.0,
+        ),
+        underwriter_tier=2,
+        auditor_is_big4=True,
+        sector_cyclicality=1,
+        region_risk_tier=1,
+        prospectus_text="Strong growth but significant risk of loss and litigation. " * 20,
+    )
+
+
+def test_stage_mapping():
+    assert stage_of("validators:_validate_deal_terms") == "validation"
+    assert stage_of("features.textual:compute_textual_features") == "text scan"
+    assert stage_of("engine:_build_drivers") == "drivers"
+    assert stage_of("engine:compute_ipo_risk") == "other"
+
+
+def test_deterministic_profile_attributes_every_stage(tmp_path):
+    ipos = [_make_ipo(i) for i in range(50)]
+    report = io.StringIO()
+    path = tmp_path / "scoring.folded"
+
+    results, profiler = profile_scoring(ipos, collapsed_path=str(path), report=report)
+
+    assert [r.risk_score for r in results] == [compute_ipo_risk(ipo).risk_score for ipo in ipos]
+    stages = profiler.stage_seconds()
+    for stage in (
+        "validation",
+        "liquidity features",
+        "valuation features",
+        "quality features",
+        "context features",
+        "financial features",
+        "text scan",
+        "logistic",
+        "drivers",
+    ):
+        assert stages.get(stage, 0.0) > 0.0, stage
+
+    lines = path.read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, _, micros = line.rpartition(" ")
+        assert int(micros) > 0
+        assert stack.startswith("engine:compute_ipo_risk")
+        assert "dataclasses" not in stack
+
+    assert "text scan" in report.getvalue()
+    assert sum(t.share for t in profiler.stage_timings()) == pytest.approx(1.0)
+    # Profiler is detached on exit.
+    import sys
+
+    assert sys.getprofile() is None
+
+
+def test_sampling_profile_collects_package_stacks():
+    ipos = [_make_ipo(i) for i in range(20)]
+    with ScoringProfiler("sample", interval=0.0002) as profiler:
+        for _ in range(100):
+            for ipo in ipos:
+                compute_ipo_risk(ipo)
+    assert profiler.stacks
+    assert all(stack[0] == "engine:compute_ipo_risk" for stack in profiler.stacks)
+    assert profiler.wall_seconds > 0
+
+
+def test_deterministic_profile_restores_outer_profiler():
+    previous = sys.getprofile()
+
+    def outer(frame, event, arg):
+        return None
+
+    try:
+        sys.setprofile(outer)
+        with ScoringProfiler():
+            compute_ipo_risk(_make_ipo(0))
+        assert sys.getprofile() is outer
+    finally:
+        sys.setprofile(previous)
+
+    # An enclosing cProfile keeps recording after the profiler stops.
+    outer_profile = cProfile.Profile()
+    outer_profile.enable()
+    try:
+        with ScoringProfiler():
+            compute_ipo_risk(_make_ipo(1))
+        compute_ipo_risk(_make_ipo(2))
+    finally:
+        outer_profile.disable()
+    calls = {func[2]: counts[1] for func, counts in pstats.Stats(outer_profile).stats.items()}
+    assert calls.get("compute_ipo_risk", 0) >= 1
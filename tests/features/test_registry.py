@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE, COEFFS_V1
+from ipo_risk_score.domain.risk.model import compile_model
+from ipo_risk_score.domain.risk.registry import ModelRegistry, save_model_file
+
+
+def _make_ipo() -> IpoInput:
+    return IpoInput(
+        ticker="REG",
+        company_name=None,
+        country="US",
+        sector="Tech",
+        deal_terms=DealTermsDomain(
+            price_low=10.0,
+            price_high=12.0,
+            offer_shares=2_000_000,
+            free_float_pct=15.0,
+            lockup_days=120,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=12_000_000.0,
+            gross_margin=30.0,
+            net_margin=4.0,
+            growth_yoy=25.0,
+        ),
+        underwriter_tier=4,
+        auditor_is_big4=False,
+        sector_cyclicality=2,
+        region_risk_tier=1,
+        sector_ps_multiple=1.5,
+    )
+
+
+def test_compiled_model_matches_coefficient_dict():
+    ipo = _make_ipo()
+    model = compile_model(COEFFS_TEX_EXAMPLE, "tex")
+    via_model = compute_ipo_risk(ipo, model=model)
+    via_dict = compute_ipo_risk(ipo, coeffs=COEFFS_TEX_EXAMPLE, model_version="tex")
+    assert via_model == via_dict
+
+
+def test_compile_rejects_unknown_or_non_finite_coefficients():
+    with pytest.raises(ValueError, match="f_liquidity"):
+        compile_model({"intercept": 0.0, "f_liquidity": 1.0}, "typo")
+    with pytest.raises(ValueError, match="non-finite"):
+        compile_model({"f_val": float("nan")}, "nan")
+
+
+def test_compute_ipo_risk_rejects_model_with_coeffs():
+    with pytest.raises(ValueError):
+        compute_ipo_risk(_make_ipo(), model=compile_model(COEFFS_V1, "v1"), coeffs=COEFFS_V1)
+
+
+def test_registry_loads_files_and_hot_swaps(tmp_path):
+    save_model_file(str(tmp_path / "v1.json"), COEFFS_V1, "v1-logistic")
+    save_model_file(str(tmp_path / "tex.json"), COEFFS_TEX_EXAMPLE, "v1-tex-example")
+
+    registry = ModelRegistry(str(tmp_path))
+    assert registry.versions() == ("v1-logistic", "v1-tex-example")
+
+    ipo = _make_ipo()
+    registry.activate("v1-logistic")
+    first = registry.score(ipo)
+    assert first.model_version == "v1-logistic"
+    assert first.risk_score == pytest.approx(compute_ipo_risk(ipo).risk_score)
+
+    registry.activate("v1-tex-example")
+    second = registry.score(ipo)
+    assert second.model_version == "v1-tex-example"
+
+    # Reload picks up edited coefficients for the active version.
+    bumped = dict(COEFFS_TEX_EXAMPLE, intercept=1.0)
+    save_model_file(str(tmp_path / "tex.json"), bumped, "v1-tex-example")
+    registry.reload()
+    assert registry.active.intercept == 1.0
+    assert registry.score(ipo).risk_score > second.risk_score
+
+
+def test_registry_reload_is_all_or_nothing(tmp_path):
+    save_model_file(str(tmp_path / "v1.json"), COEFFS_V1, "v1-logistic")
+    registry = ModelRegistry(str(tmp_path))
+    registry.activate("v1-logistic")
+
+    (tmp_path / "broken.json").write_text(
+        json.dumps({"model_version": "bad", "coefficients": {"f_oops": 1.0}})
+    )
+    with pytest.raises(ValueError):
+        registry.reload()
+    assert registry.versions() == ("v1-logistic",)
+    assert registry.active.version == "v1-logistic"
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.logistic import COEFFS_V1
+from ipo_risk_score.domain.risk.model import compile_model
+from ipo_risk_score.domain.risk.screening import screen_threshold, top_k
+from ipo_risk_score.domain.risk.validators import ValidationError
+
+TEXTS = [
+    None,
+    "",
+    "Strong growth and robust profit.",
+    "Volatile demand, weak margins and a decline in sales; losses may continue.",
+]
+
+
+@pytest.fixture(scope="module")
+def ipos(make_ipo):
+    rng = random.Random(5)
+    return [make_ipo(rng, texts=TEXTS) for _ in range(500)]
+
+
+def _reference(ipos, coeffs=None):
+    return [compute_ipo_risk(ipo, coeffs=coeffs).risk_score for ipo in ipos]
+
+
+@pytest.mark.parametrize("coeffs", [None, {**COEFFS_V1, "f_text": -3.0}, {"f_val": 1.0}])
+def test_top_k_matches_full_ranking(ipos, coeffs):
+    scores = _reference(ipos, coeffs)
+    expected = sorted(range(len(ipos)), key=lambda i: (-scores[i], i))[:25]
+    result = top_k(ipos, 25, coeffs=coeffs)
+    assert [hit.index for hit in result.hits] == expected
+    assert [hit.score for hit in result.hits] == [scores[i] for i in expected]
+    assert all(hit.lower <= hit.score <= hit.upper for hit in result.hits)
+
+
+def test_top_k_prunes_text_scans(ipos):
+    result = top_k(ipos, 10, coeffs={**COEFFS_V1, "f_text": 0.5})
+    assert result.n_scannable > 100
+    assert result.n_text_scans < result.n_scannable / 4
+    assert result.n_pruned == result.n_scannable - result.n_text_scans
+
+
+def test_top_k_edge_cases(ipos):
+    assert top_k(ipos, 0).hits == []
+    assert len(top_k(ipos[:3], 10).hits) == 3
+    with pytest.raises(ValueError):
+        top_k(ipos, -1)
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_threshold_screen_matches_full_scoring(ipos, exact):
+    scores = _reference(ipos)
+    threshold = sorted(scores)[len(scores) // 2]
+    result = screen_threshold(ipos, threshold, exact=exact)
+    assert [hit.index for hit in result.hits] == [i for i, s in enumerate(scores) if s >= threshold]
+    for hit in result.hits:
+        if hit.score is None:
+            assert not exact and hit.lower >= threshold
+        else:
+            assert hit.score == scores[hit.index]
+    assert result.n_pruned > 0
+
+
+def test_compiled_model_and_validation(ipos, make_ipo):
+    model = compile_model({**COEFFS_V1, "f_text": 2.0}, "v1-text")
+    coeffs = dict(model.coeffs)
+    assert [h.index for h in top_k(ipos, 5, coeffs=model).hits] == [
+        h.index for h in top_k(ipos, 5, coeffs=coeffs).hits
+    ]
+    with pytest.raises(ValueError):
+        top_k(ipos, 5, coeffs={"f_text_mdna": 1.0})
+    bad = make_ipo(random.Random(1), texts=TEXTS)
+    bad.deal_terms.offer_shares = 0
+    with pytest.raises(ValidationError):
+        screen_threshold([bad], 50.0)
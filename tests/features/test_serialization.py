@@ -0,0 +1,102 @@
+import io
+import json
+from dataclasses import asdict
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE, COEFFS_V1
+from ipo_risk_score.domain.risk.serialization import (
+    LogSchema,
+    RiskResultReader,
+    RiskResultWriter,
+    read_results,
+    write_results,
+)
+
+
+def _make_ipo(free_float_pct: float, net_margin: float) -> IpoInput:
+    return IpoInput(
+        ticker=None,
+        company_name=None,
+        country=None,
+        sector=None,
+        deal_terms=DealTermsDomain(
+            price_low=10.0,
+            price_high=12.0,
+            offer_shares=1_000_000,
+            free_float_pct=free_float_pct,
+            lockup_days=90,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=10_000_000.0,
+            gross_margin=30.0,
+            net_margin=net_margin,
+            growth_yoy=20.0,
+        ),
+        underwriter_tier=3,
+        auditor_is_big4=False,
+        sector_cyclicality=1,
+        region_risk_tier=2,
+        sector_ps_multiple=0.8,
+    )
+
+
+def _results(n: int, **kwargs):
+    return [compute_ipo_risk(_make_ipo(5.0 + i % 90, -10.0 + i % 40), **kwargs) for i in range(n)]
+
+
+def test_round_trip_reproduces_results_exactly():
+    results = _results(50, include_attractiveness=False) + _results(50)
+    buf = io.BytesIO()
+    assert write_results(buf, results, COEFFS_V1) == 100
+    buf.seek(0)
+    assert read_results(buf) == results
+
+
+def test_binary_log_is_much_smaller_than_json():
+    results = _results(200, coeffs=COEFFS_TEX_EXAMPLE, model_version="tex")
+    buf = io.BytesIO()
+    write_results(buf, results, COEFFS_TEX_EXAMPLE)
+    json_size = sum(len(json.dumps(asdict(r))) for r in results)
+    assert json_size > 5 * len(buf.getvalue())
+
+
+def test_streaming_reader_and_raw_rows():
+    results = _results(10)
+    schema = LogSchema.for_coefficients("v1-logistic", list(results[0].raw_features), COEFFS_V1)
+    buf = io.BytesIO()
+    writer = RiskResultWriter(buf, schema)
+    for r in results:
+        writer.write(r)
+    buf.seek(0)
+    reader = RiskResultReader(buf, chunk_rows=3)
+    rows = list(reader.iter_rows())
+    assert [row[0] for row in rows] == [r.risk_score for r in results]
+    assert reader.schema.feature_names == tuple(results[0].raw_features)
+
+
+def test_writer_rejects_mismatched_results():
+    results = _results(1)
+    schema = LogSchema.for_coefficients("other", list(results[0].raw_features), COEFFS_V1)
+    with pytest.raises(ValueError, match="model_version"):
+        RiskResultWriter(io.BytesIO(), schema).write(results[0])
+
+
+def test_writer_rejects_results_scored_with_other_coefficients():
+    results = _results(3, coeffs=COEFFS_TEX_EXAMPLE)
+    with pytest.raises(ValueError, match="f_val"):
+        write_results(io.BytesIO(), results, COEFFS_V1)
+    buf = io.BytesIO()
+    write_results(buf, results, COEFFS_TEX_EXAMPLE)
+    buf.seek(0)
+    assert read_results(buf) == results
+
+
+def test_reader_rejects_truncated_log():
+    buf = io.BytesIO()
+    write_results(buf, _results(2), COEFFS_V1)
+    truncated = io.BytesIO(buf.getvalue()[:-3])
+    with pytest.raises(ValueError, match="Truncated"):
+        read_results(truncated)
@@ -0,0 +1,88 @@
+import itertools
+import math
+import random
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.logistic import COEFFS_V1
+from ipo_risk_score.domain.risk.shapley import ShapleyExplainer
+
+
+def _brute_force_shapley(x, reference, coeffs):
+    names = [k for k in x if coeffs.get(k)]
+    m = len(names)
+
+    def value(coalition):
+        total = 0.0
+        for r in reference:
+            z = coeffs["intercept"]
+            for n in names:
+                z += coeffs[n] * (x[n] if n in coalition else r[n])
+            total += 100.0 / (1.0 + math.exp(-z))
+        return total / len(reference)
+
+    phi = {}
+    for n in names:
+        others = [o for o in names if o != n]
+        acc = 0.0
+        for size in range(m):
+            w = math.factorial(size) * math.factorial(m - size - 1) / math.factorial(m)
+            for subset in itertools.combinations(others, size):
+                acc += w * (value(set(subset) | {n}) - value(set(subset)))
+        phi[n] = acc
+    return phi
+
+
+@pytest.fixture(scope="module")
+def results(make_ipo):
+    rng = random.Random(7)
+    return [compute_ipo_risk(make_ipo(rng)) for _ in range(60)]
+
+
+def test_exact_mode_matches_brute_force(results):
+    reference = [r.raw_features for r in results[:15]]
+    explainer = ShapleyExplainer(reference, grid_step=None)
+    for result in results[40:43]:
+        expected = _brute_force_shapley(result.raw_features, reference, COEFFS_V1)
+        got = explainer.explain(result.raw_features).contributions
+        assert got.keys() == expected.keys()
+        for name in expected:
+            assert got[name] == pytest.approx(expected[name], abs=1e-9)
+
+
+def test_contributions_sum_to_score_minus_baseline(results):
+    reference = [r.raw_features for r in results[:40]]
+    explainer = ShapleyExplainer(reference)
+    baseline = sum(r.risk_score for r in results[:40]) / 40
+    assert explainer.baseline == pytest.approx(baseline, abs=1e-9)
+
+    for result, explanation in zip(results[40:], explainer.explain_results(results[40:])):
+        assert explanation.score == pytest.approx(result.risk_score, abs=1e-9)
+        total = explanation.baseline + sum(explanation.contributions.values())
+        assert total == pytest.approx(result.risk_score, abs=1e-9)
+
+
+def test_tabulated_mode_is_close_to_exact(results):
+    reference = [r.raw_features for r in results[:40]]
+    exact = ShapleyExplainer(reference, grid_step=None)
+    fast = ShapleyExplainer(reference)
+    rows = [r.raw_features for r in results[40:]]
+    for a, b in zip(exact.contribution_matrix(rows), fast.contribution_matrix(rows)):
+        for x, y in zip(a, b):
+            assert x == pytest.approx(y, abs=1e-3)
+
+
+def test_single_feature_model_attributes_everything_to_it(results):
+    coeffs = {"intercept": -1.0, "f_val": 3.0}
+    explainer = ShapleyExplainer([r.raw_features for r in results[:10]], coeffs)
+    explanation = explainer.explain(results[20].raw_features)
+    assert list(explanation.contributions) == ["f_val"]
+    assert explanation.contributions["f_val"] == pytest.approx(
+        explanation.score - explanation.baseline
+    )
+
+
+def test_rejects_empty_reference():
+    with pytest.raises(ValueError):
+        ShapleyExplainer([])
@@ -0,0 +1,97 @@
+import math
+import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import resource_tracker
+
+import pytest
+
+from ipo_risk_score.domain.risk import shared
+from ipo_risk_score.domain.risk.columnar import score_columns
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE
+from ipo_risk_score.domain.risk.shared import (
+    STATUS_INVALID,
+    STATUS_OK,
+    SharedBatch,
+    score_shared,
+)
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_shared_scores_match_compute_ipo_risk(workers, make_ipo):
+    rng = random.Random(48)
+    ipos = [make_ipo(rng) for _ in range(300)]
+    with SharedBatch.from_ipos(ipos) as batch:
+        assert score_shared(batch, COEFFS_TEX_EXAMPLE, workers=workers, chunk_rows=64) == 0
+        assert all(status == STATUS_OK for status in batch.status)
+        results = batch.results(COEFFS_TEX_EXAMPLE)
+        assert list(batch.column("risk_score")) == [r.risk_score for r in results]
+        assert list(batch.column("risk_score")) == list(
+            score_columns(batch.input_columns(), COEFFS_TEX_EXAMPLE)
+        )
+    for ipo, result in zip(ipos, results):
+        assert result == compute_ipo_risk(ipo, coeffs=COEFFS_TEX_EXAMPLE)
+
+
+def test_invalid_rows_get_status_codes(make_ipo):
+    rng = random.Random(1)
+    ipos = [make_ipo(rng) for _ in range(10)]
+    ipos[3].deal_terms.price_low = -1.0
+    ipos[4].underwriter_tier = 9
+    ipos[9].financials.revenue_ttm = math.nan
+    with SharedBatch.from_ipos(ipos) as batch:
+        assert score_shared(batch, workers=0, chunk_rows=4) == 3
+        assert batch.invalid_rows() == [3, 4, 9]
+        assert batch.status[3] == STATUS_INVALID
+        results = batch.results()
+        assert [r is None for r in results] == [i in (3, 4, 9) for i in range(10)]
+        assert results[5] == compute_ipo_risk(ipos[5])
+
+
+def test_attach_sees_owner_writes_and_columns_round_trip():
+    columns = {
+        "price_low": [10.0, 4.0],
+        "price_high": array("d", [12.0, 5.0]),
+        "offer_shares": array("q", [1_000_000, 1_500_000]),
+        "free_float_pct": [20.0, 10.0],
+        "lockup_days": [180, 90],
+        "revenue_ttm": [1e7, 8e6],
+        "gross_margin": [30.0, 30.5],
+        "net_margin": [12.0, -3.0],
+        "growth_yoy": [40.0, 43.9],
+        "underwriter_tier": [3, 4],
+        "auditor_is_big4": [True, False],
+        "sector_cyclicality": [1, 2],
+        "region_risk_tier": [1, 2],
+    }
+    with SharedBatch.from_columns(columns) as batch:
+        assert math.isnan(batch.column("sector_ps_multiple")[0])
+        other = SharedBatch.attach(batch.handle)
+        try:
+            score_shared(batch, workers=0)
+            assert list(other.column("risk_score")) == list(score_columns(batch.input_columns()))
+        finally:
+            other.close()
+    with pytest.raises(ValueError, match="rows"):
+        SharedBatch.from_columns({**columns, "lockup_days": [1]})
+    with pytest.raises(ValueError, match="missing"):
+        SharedBatch.from_columns({"price_low": [1.0]})
+    with SharedBatch.create(0) as empty:
+        assert score_shared(empty, workers=0) == 0 and empty.results() == []
+
+
+def test_thread_pool_scoring_keeps_tracker_and_attachments_intact(make_ipo):
+    rng = random.Random(7)
+    ipos = [make_ipo(rng) for _ in range(400)]
+    register = resource_tracker.register
+    with SharedBatch.from_ipos(ipos) as batch, SharedBatch.from_ipos(ipos[:100]) as other:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(5):
+                assert score_shared(batch, executor=pool, chunk_rows=8) == 0
+                assert score_shared(other, executor=pool, chunk_rows=8) == 0
+        assert list(batch.column("risk_score")) == list(score_columns(batch.input_columns()))
+        assert list(other.column("risk_score"))[:100] == list(batch.column("risk_score"))[:100]
+    assert resource_tracker.register is register
+    # Pool threads map the block per task instead of sharing the cache.
+    assert shared._attached is None
@@ -0,0 +1,159 @@
+import pytest
+
+from ipo_risk_score.domain.risk.comparison import score_models
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.entities import DealTermsDomain, FinancialSnapshotDomain, IpoInput
+from ipo_risk_score.domain.risk.features.builder import FEATURE_KEYS, TEXT_ENGINE_KEYS
+from ipo_risk_score.domain.risk.features.tables import TableScorer
+from ipo_risk_score.domain.risk.features.text_engine import TextFeatureEngine
+from ipo_risk_score.domain.risk.fused import compile_fused_scorer
+from ipo_risk_score.domain.risk.logistic import COEFFS_V1
+from ipo_risk_score.domain.risk.model import compile_model
+from ipo_risk_score.domain.risk.screening import screen_threshold
+
+FILING = """PROSPECTUS SUMMARY
+We are a growing company.
+RISK FACTORS
+We may face litigation. Demand could decline.
+Item 7. Management's Discussion and Analysis of Financial Condition
+We expect no significant decline in revenue and strong growth.
+USE OF PROCEEDS
+We intend to use the proceeds for general corporate purposes.
+DIVIDEND POLICY
+We have never paid dividends.
+"""
+
+
+def _make_ipo(text=None) -> IpoInput:
+    return IpoInput(
+        ticker=None,
+        company_name=None,
+        country=None,
+        sector=None,
+        deal_terms=DealTermsDomain(
+            price_low=10.0,
+            price_high=12.0,
+            offer_shares=5_000_000,
+            free_float_pct=30.0,
+            lockup_days=180,
+        ),
+        financials=FinancialSnapshotDomain(
+            revenue_ttm=50_000_000.0,
+            gross_margin=40.0,
+            net_margin=5.0,
+            growth_yoy=25.0,
+        ),
+        underwriter_tier=2,
+        auditor_is_big4=True,
+        sector_cyclicality=1,
+        region_risk_tier=1,
+        sector_ps_multiple=None,
+        prospectus_text=text,
+    )
+
+
+def test_sections_are_scored_separately_and_headings_ignored():
+    scan = TextFeatureEngine().scan(FILING)
+    risk = scan.sections["risk_factors"]
+    # "RISK FACTORS" itself is not counted; "litigation" and "decline" are.
+    assert (risk.words, risk.hits, risk.score) == (7, 2, 2.0)
+    assert scan.sections["use_of_proceeds"].hits == 0
+    assert scan.sections["mdna"].words == 10
+
+
+def test_subheadings_stay_in_their_section():
+    filing = (
+        "RISK FACTORS\n"
+        "RISKS RELATED TO OUR BUSINESS\n"
+        "We face litigation and a decline in demand.\n"
+        "Risks Related to This Offering\n"
+        "Dilution may be substantial.\n"
+        "BUSINESS\n"
+        "We sell software.\n"
+    )
+    scan = TextFeatureEngine().scan(filing)
+    risk = scan.sections["risk_factors"]
+    assert (risk.words, risk.hits) == (17, 3)
+    assert scan.sections["other"].words == 3
+    assert TextFeatureEngine().features(filing)["f_text_risk_factors"] > 0.5
+
+
+def test_negation_window_flips_sign():
+    engine = TextFeatureEngine()
+    mdna = engine.scan(FILING).sections["mdna"]
+    # "no significant decline" -> -1, "strong" -> -1, "growth" -> -1.
+    assert (mdna.hits, mdna.negated, mdna.score) == (3, 1, -3.0)
+    # A sentence break ends the negation scope.
+    assert engine.scan("No. Decline").total().score == 1.0
+    assert TextFeatureEngine(negation_window=0).scan("no decline").total().score == 1.0
+
+
+def test_features_are_bounded_and_neutral_without_text():
+    engine = TextFeatureEngine(scale=50.0)
+    feats = engine.features(FILING)
+    assert tuple(feats) == TEXT_ENGINE_KEYS
+    assert all(0.0 <= v <= 1.0 for v in feats.values())
+    assert feats["f_text_risk_factors"] == 1.0
+    assert feats["f_text_mdna"] == 0.0
+    assert feats["f_text_proceeds"] == 0.5
+    assert engine.features(None) == dict.fromkeys(TEXT_ENGINE_KEYS, 0.5)
+    assert engine.features("") == dict.fromkeys(TEXT_ENGINE_KEYS, 0.5)
+
+
+def test_chunked_stream_matches_single_string():
+    engine = TextFeatureEngine()
+    text = FILING * 50
+    for size in (1, 7, 64, 4096):
+        chunks = (text[i : i + size] for i in range(0, len(text), size))
+        assert engine.features(chunks) == engine.features(text)
+
+
+def test_idf_downweights_ubiquitous_terms():
+    docs = ["litigation risk", "risk of fraud", "risk", "risk and decline"]
+    engine = TextFeatureEngine.with_idf(docs)
+    assert engine.lexicon["risk"] / 0.5 < engine.lexicon["fraud"] / 1.5
+    assert engine.lexicon["growth"] < 0
+
+
+def test_invalid_parameters_rejected():
+    with pytest.raises(ValueError):
+        TextFeatureEngine(negation_window=-1)
+    with pytest.raises(ValueError):
+        TextFeatureEngine(scale=0.0)
+    with pytest.raises(ValueError):
+        TextFeatureEngine({"risk": float("nan")})
+
+
+def test_compute_ipo_risk_with_text_engine():
+    ipo = _make_ipo(FILING)
+    engine = TextFeatureEngine()
+    base = compute_ipo_risk(ipo)
+    extended = compute_ipo_risk(ipo, text_engine=engine)
+    assert tuple(extended.raw_features) == FEATURE_KEYS + TEXT_ENGINE_KEYS
+    # Unweighted extra features leave the score unchanged.
+    assert extended.risk_score == base.risk_score
+
+    coeffs = {**COEFFS_V1, "f_text_risk_factors": 1.0, "f_text_mdna": 2.0}
+    model = compile_model(coeffs, "v1-sections")
+    weighted = compute_ipo_risk(ipo, model=model, text_engine=engine)
+    plain = compute_ipo_risk(ipo, coeffs=coeffs, text_engine=engine)
+    assert weighted.risk_score == plain.risk_score
+    assert {d.name for d in weighted.drivers} >= {"f_text_risk_factors", "f_text_mdna"}
+
+
+def test_text_engine_weights_require_an_engine():
+    ipo = _make_ipo(FILING)
+    coeffs = {**COEFFS_V1, "f_text_mdna": 2.0}
+    model = compile_model(coeffs, "v1-sections")
+    with pytest.raises(ValueError, match="f_text_mdna"):
+        compute_ipo_risk(ipo, model=model)
+    with pytest.raises(ValueError, match="f_text_mdna"):
+        compute_ipo_risk(ipo, coeffs=coeffs)
+    for scorer in (
+        lambda: score_models([ipo], {"sections": model}),
+        lambda: compile_fused_scorer(coeffs),
+        lambda: TableScorer(coeffs),
+        lambda: screen_threshold([ipo], 50.0, coeffs=model),
+    ):
+        with pytest.raises(ValueError):
+            scorer()
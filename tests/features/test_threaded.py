@@ -0,0 +1,113 @@
+import copy
+import json
+import pickle
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from ipo_risk_score.domain.risk.engine import compute_ipo_risk
+from ipo_risk_score.domain.risk.features.text_engine import DEFAULT_LEXICON
+from ipo_risk_score.domain.risk.features.textual import POSITIVE_WORDS
+from ipo_risk_score.domain.risk.fused import compile_fused_scorer
+from ipo_risk_score.domain.risk.logistic import COEFFS_TEX_EXAMPLE, COEFFS_V1
+from ipo_risk_score.domain.risk.threaded import gil_enabled, score_threaded
+from ipo_risk_score.domain.risk.validators import ValidationError
+
+TEXTS = [None, "strong growth", "volatile decline and loss"]
+
+
+@pytest.mark.parametrize("threads", [0, 1, 4])
+def test_threaded_scores_match_compute_ipo_risk(threads, make_ipo):
+    rng = random.Random(49)
+    ipos = [make_ipo(rng, texts=TEXTS) for _ in range(500)]
+    scores = score_threaded(ipos, COEFFS_TEX_EXAMPLE, threads=threads, chunk_size=37)
+    assert list(scores) == [
+        compute_ipo_risk(ipo, coeffs=COEFFS_TEX_EXAMPLE).risk_score for ipo in ipos
+    ]
+
+
+def test_threaded_reuses_executor_and_scorer(make_ipo):
+    rng = random.Random(7)
+    ipos = (make_ipo(rng, texts=TEXTS) for _ in range(100))  # any iterable
+    scorer = compile_fused_scorer()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        scores = score_threaded(ipos, scorer=scorer, executor=pool, chunk_size=8)
+        assert len(score_threaded([], executor=pool)) == 0
+    rng = random.Random(7)
+    assert list(scores) == [scorer.score(make_ipo(rng, texts=TEXTS)) for _ in range(100)]
+    with pytest.raises(ValueError):
+        score_threaded([], COEFFS_V1, scorer=scorer)
+    with pytest.raises(ValueError):
+        score_threaded([], chunk_size=0)
+    assert isinstance(gil_enabled(), bool)
+
+
+def test_threaded_error_names_row(make_ipo):
+    rng = random.Random(3)
+    ipos = [make_ipo(rng, texts=TEXTS) for _ in range(50)]
+    ipos[41] = replace(ipos[41], underwriter_tier=9)
+    with pytest.raises(ValidationError, match=r"^row 41: "):
+        score_threaded(ipos, threads=2, chunk_size=10)
+
+
+def test_shared_scoring_state_is_read_only():
+    with pytest.raises(TypeError):
+        COEFFS_V1["f_val"] = 5.0  # type: ignore[index]
+    with pytest.raises(TypeError):
+        DEFAULT_LEXICON["risk"] = 2.0  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        POSITIVE_WORDS.add("moon")  # type: ignore[attr-defined]
+    coeffs = dict(COEFFS_V1)
+    scorer = compile_fused_scorer(coeffs)
+    coeffs["f_val"] = 5.0
+    with pytest.raises(TypeError):
+        scorer.coeffs["f_val"] = 5.0  # type: ignore[index]
+    assert scorer.coeffs == COEFFS_V1
+
+
+def test_read_only_state_pickles(make_ipo):
+    restored = pickle.loads(pickle.dumps(COEFFS_V1))
+    assert restored == COEFFS_V1 and type(restored) is type(COEFFS_V1)
+    with pytest.raises(TypeError):
+        restored["f_val"] = 5.0  # type: ignore[index]
+    assert json.loads(json.dumps(COEFFS_TEX_EXAMPLE)) == COEFFS_TEX_EXAMPLE
+    assert copy.deepcopy(COEFFS_V1) == COEFFS_V1
+
+    ipo = make_ipo(random.Random(4), texts=TEXTS)
+    scorer = compile_fused_scorer({"intercept": 0.1, "f_val": 2.0}, model_version="x")
+    clone = pickle.loads(pickle.dumps(scorer))
+    assert (clone.coeffs, clone.model_version, clone.config) == (
+        scorer.coeffs,
+        scorer.model_version,
+        scorer.config,
+    )
+    assert clone.result(ipo) == scorer.result(ipo)
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        remote = pool.submit(compute_ipo_risk, ipo, coeffs=COEFFS_V1).result()
+    assert remote == compute_ipo_risk(ipo, coeffs=COEFFS_V1)
+
+
+def test_one_scorer_shared_by_many_threads(make_ipo):
+    rng = random.Random(11)
+    ipos = [make_ipo(rng, texts=TEXTS) for _ in range(200)]
+    scorer = compile_fused_scorer(COEFFS_V1)
+    expected = [scorer.result(ipo) for ipo in ipos]
+    barrier = threading.Barrier(8)
+    mismatches = []
+
+    def run(offset: int) -> None:
+        barrier.wait()
+        for i in range(len(ipos)):
+            j = (i + offset) % len(ipos)
+            if scorer.result(ipos[j]) != expected[j]:
+                mismatches.append(j)
+
+    workers = [threading.Thread(target=run, args=(k * 25,)) for k in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert not mismatches